@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark Compact Projected-Motion Storage
+
+Compares projected/ files as float64 .npy (what stage 03 writes by default)
+and float32 .npy against the compact .npq format (int16 fixed point, delta
+encoded, zlib or lzma; see intensely_pipeline/compact.py): bytes on disk,
+worst-case error in pixels, and write/read throughput in frames per second
+(file read + decode to float32 for .npq).
+
+By default the clips are synthetic (smooth periodic joint motion with mocap
+jitter, projected to the unit box like stage 03); pass --projected-dir to
+measure existing projections instead.
+
+Usage:
+    python scripts/benchmark_projected_storage.py
+
+    # Longer clips, finer fixed point
+    python scripts/benchmark_projected_storage.py --frames 50000 --steps-per-unit 16384
+
+    # Real stage 03 output
+    python scripts/benchmark_projected_storage.py --projected-dir projected
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from intensely_pipeline.compact import (  # noqa: E402
+    CODECS,
+    DEFAULT_STEPS_PER_UNIT,
+    load_compact,
+    save_compact,
+)
+from intensely_pipeline.projection import find_projected, load_projected, project_motion_unit  # noqa: E402
+
+FPS = 30
+
+
+def synthetic_clip(rng, frames, joints):
+    """(T, J, 2) unit-box projection of smooth periodic 3D motion."""
+    t = np.arange(frames)[:, np.newaxis, np.newaxis] / FPS
+    base = rng.normal(scale=0.4, size=(1, joints, 3))
+    motion = base.repeat(frames, axis=0)
+    for _ in range(3):
+        freq = rng.uniform(0.2, 1.5, size=(1, joints, 3))
+        phase = rng.uniform(0, 2 * np.pi, size=(1, joints, 3))
+        motion += rng.uniform(0.02, 0.15) * np.sin(2 * np.pi * freq * t + phase)
+    motion += rng.normal(scale=0.001, size=motion.shape)  # ~1 mm tracking jitter
+    unit, _ = project_motion_unit(motion.astype(np.float32), 45)
+    return unit
+
+
+def time_median(fn, runs):
+    """Median seconds over runs."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark .npy vs compact .npq projected motion")
+    parser.add_argument("--frames", type=int, default=10000, help="Frames per synthetic clip (default: 10000)")
+    parser.add_argument("--joints", type=int, default=22, help="Joints per frame (default: 22)")
+    parser.add_argument("--clips", type=int, default=4, help="Synthetic clips (default: 4)")
+    parser.add_argument("--projected-dir", help="Measure existing stage 03 projections instead")
+    parser.add_argument("--steps-per-unit", type=int, default=DEFAULT_STEPS_PER_UNIT,
+                        help=f"Fixed-point resolution (default: {DEFAULT_STEPS_PER_UNIT})")
+    parser.add_argument("--canvas", type=int, default=400, help="Canvas size for the pixel error (default: 400)")
+    parser.add_argument("--runs", type=int, default=5, help="Timing runs (default: 5)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Projected Motion Storage Benchmark")
+    print("=" * 60)
+
+    if args.projected_dir:
+        clips = [np.asarray(load_projected(path), dtype=np.float64) for path in find_projected(args.projected_dir)]
+        if not clips:
+            print(f"\n❌ No projected files found in {args.projected_dir}")
+            sys.exit(1)
+        print(f"✓ {len(clips)} clips from {args.projected_dir}")
+    else:
+        rng = np.random.default_rng(0)
+        clips = [synthetic_clip(rng, args.frames, args.joints) for _ in range(args.clips)]
+        print(f"✓ {args.clips} synthetic clips × {args.frames} frames × {args.joints} joints")
+
+    total_frames = sum(len(clip) for clip in clips)
+    # Unit box → pixels at the default 15% padding
+    px_per_unit = args.canvas - 2 * int(args.canvas * 0.15)
+    print(f"  Fixed point: {args.steps_per_unit} steps per unit "
+          f"(1/{args.steps_per_unit / px_per_unit:.0f} px on a {args.canvas} px canvas)\n")
+
+    formats = [("npy float64", ".npy", np.float64), ("npy float32", ".npy", np.float32)]
+    formats += [(f"npq {codec}", ".npq", codec) for codec in CODECS]
+
+    print(f"  {'Format':13s} {'Size':>10s} {'Ratio':>7s} {'Max err':>10s} {'Write':>13s} {'Read':>13s}")
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = None
+        for name, suffix, kind in formats:
+            paths = [Path(tmp) / f"{name.replace(' ', '-')}-{i}{suffix}" for i in range(len(clips))]
+
+            if suffix == ".npq":
+                def write():
+                    for path, clip in zip(paths, clips):
+                        with open(path, "wb") as f:
+                            save_compact(f, clip, args.steps_per_unit, kind)
+                read_one = load_compact
+            else:
+                def write():
+                    for path, clip in zip(paths, clips):
+                        np.save(path, clip.astype(kind))
+                read_one = np.load
+
+            write_s = time_median(write, args.runs)
+            read_s = time_median(lambda: [read_one(path) for path in paths], args.runs)
+
+            size = sum(path.stat().st_size for path in paths)
+            baseline = baseline or size
+            error = max(float(np.abs(read_one(path) - clip).max()) for path, clip in zip(paths, clips))
+            print(f"  {name:13s} {size / 1024 / 1024:8.2f}MB {baseline / size:6.1f}× "
+                  f"{error * px_per_unit:8.4f}px {total_frames / write_s:11,.0f}/s {total_frames / read_s:11,.0f}/s")
+
+    print(f"\n  Ratio is against float64 .npy; write/read are frames per second")
+    print(f"  ({total_frames:,} frames, median of {args.runs} runs, page-cached files)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
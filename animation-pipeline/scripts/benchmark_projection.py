@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark Stage 03 Projection
+
+Compares project_motion_sequence() against the previous per-frame
+implementation (project every frame for the bounding box, then project and
+normalize every frame again, stacking Python lists) on long synthetic clips,
+and checks both produce the same array.
+
+Usage:
+    python scripts/benchmark_projection.py
+
+    # Longer clips, more clips, more timing runs
+    python scripts/benchmark_projection.py --frames 50000 --clips 5 --runs 7
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from intensely_pipeline.projection import (  # noqa: E402
+    get_rotation_matrix,
+    normalize_to_canvas,
+    project_motion_sequence,
+)
+
+CAMERA_ANGLES = [0, 45, 90, 135]
+
+
+def per_frame_projection(points_3d, camera_angle):
+    """Previous orthographic_projection(): one (J, 3) frame at a time."""
+    points_rotated = points_3d @ get_rotation_matrix(camera_angle).T
+    points_2d = points_rotated[:, :2].copy()
+    points_2d[:, 0] *= -1
+    return points_2d
+
+
+def per_frame_sequence(motion_3d, camera_angle, canvas_size):
+    """Previous project_motion_sequence(): projects every frame twice."""
+    all_points = np.concatenate([per_frame_projection(frame, camera_angle) for frame in motion_3d], axis=0)
+    min_x, min_y = all_points.min(axis=0)
+    max_x, max_y = all_points.max(axis=0)
+    bbox = {
+        'min_x': min_x, 'max_x': max_x, 'min_y': min_y, 'max_y': max_y,
+        'width': max_x - min_x, 'height': max_y - min_y, 'y_baseline': min_y,
+    }
+
+    frames = [
+        normalize_to_canvas(per_frame_projection(frame, camera_angle), bbox, canvas_size)
+        for frame in motion_3d
+    ]
+    return np.stack(frames, axis=0), bbox
+
+
+def time_runs(fn, clips, canvas_size, runs):
+    """Median seconds to project every clip once."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for motion_3d, angle in clips:
+            fn(motion_3d, angle, canvas_size)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized vs per-frame 3D → 2D projection")
+    parser.add_argument("--frames", type=int, default=10000, help="Frames per clip (default: 10000)")
+    parser.add_argument("--joints", type=int, default=22, help="Joints per frame (default: 22)")
+    parser.add_argument("--clips", type=int, default=4, help="Clips, one per camera angle in turn (default: 4)")
+    parser.add_argument("--runs", type=int, default=5, help="Timing runs (default: 5)")
+    parser.add_argument("--canvas", type=int, default=400, help="Canvas size in pixels (default: 400)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Stage 03 Projection Benchmark")
+    print("=" * 60)
+
+    rng = np.random.default_rng(0)
+    clips = [
+        (rng.normal(scale=0.5, size=(args.frames, args.joints, 3)).astype(np.float32),
+         CAMERA_ANGLES[i % len(CAMERA_ANGLES)])
+        for i in range(args.clips)
+    ]
+    print(f"✓ {args.clips} clips × {args.frames} frames × {args.joints} joints\n")
+
+    for motion_3d, angle in clips:
+        expected, expected_bbox = per_frame_sequence(motion_3d, angle, args.canvas)
+        actual, bbox = project_motion_sequence(motion_3d, angle, args.canvas)
+        if not np.allclose(actual, expected) or bbox != expected_bbox:
+            print(f"❌ Output differs from the per-frame implementation at {angle}°")
+            sys.exit(1)
+    print("✓ Output matches the per-frame implementation")
+
+    per_frame = time_runs(per_frame_sequence, clips, args.canvas, args.runs)
+    vectorized = time_runs(project_motion_sequence, clips, args.canvas, args.runs)
+    total_frames = args.clips * args.frames
+
+    print(f"\n  Per-frame:  {per_frame * 1000:8.1f} ms  ({total_frames / per_frame:12,.0f} frames/s)")
+    print(f"  Vectorized: {vectorized * 1000:8.1f} ms  ({total_frames / vectorized:12,.0f} frames/s)")
+    print(f"\n⚡ Speedup: {per_frame / vectorized:.1f}×")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark Stage 04 Rasterizers
+
+Compares the NumPy batch rasterizer (rasterize.py) against the PIL path
+stage 04 uses (render_webp.render_frames) on frames/sec, and checks
+pixel-level agreement:
+
+    hard edges    rasterize_frames() without anti-aliasing against PIL:
+                  every pixel must match PIL at that pixel or one of its
+                  8 neighbours (PIL snaps coordinates to whole pixels)
+    anti-aliased  rasterize_frames() against PIL drawn at 4× and box
+                  filtered down: same figure area, small mean difference
+
+Clips come from projected/ (run 03_project_to_2d.py first), or are
+synthetic random walks with --synthetic.
+
+The batch rasterizer is not used by the pipeline: hard-edged, it runs
+slower than PIL (see the README's "Batch rasterizer (not adopted)"). Re-run
+this before reconsidering that.
+
+Usage:
+    python scripts/benchmark_rasterizer.py
+
+    # More frames and timing runs, synthetic clips
+    python scripts/benchmark_rasterizer.py --frames 300 --runs 7 --synthetic
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from intensely_pipeline.config import PIPELINE_ROOT, load_config  # noqa: E402
+from intensely_pipeline.projection import canvas_padding, find_projected, load_projected, to_canvas  # noqa: E402
+from intensely_pipeline.rasterize import rasterize_frames  # noqa: E402
+from intensely_pipeline.render_webp import render_frame, render_frames  # noqa: E402
+
+# Supersampling factor of the anti-aliased PIL reference
+SUPERSAMPLE = 4
+
+# Pass thresholds
+MIN_NEIGHBOUR_MATCH = 0.999   # hard edges: share of pixels matching within 1 px
+MAX_AREA_ERROR = 0.05         # anti-aliased: relative figure area difference
+
+
+def with_rendering(config, **overrides):
+    """Copy of config with some rendering settings replaced."""
+    return dict(config, rendering=dict(config['rendering'], **overrides))
+
+
+def load_clips(config, canvas_size, frames, count, synthetic):
+    """(T, 22, 2) canvas-pixel clips from projected/, or random walks."""
+    if not synthetic:
+        files = find_projected(PIPELINE_ROOT / "projected")[:count]
+        if files:
+            padding = canvas_padding(config)
+            return [to_canvas(load_projected(path), canvas_size, padding)[:frames] for path in files]
+        print("  (No projected clips found, using synthetic ones)")
+
+    rng = np.random.default_rng(0)
+    clips = []
+    for _ in range(count):
+        start = rng.uniform(0.3, 0.7, size=(1, 22, 2))
+        walk = np.cumsum(rng.normal(scale=0.004, size=(frames, 22, 2)), axis=0)
+        clips.append(np.clip(start + walk, 0.05, 0.95) * canvas_size)
+    return clips
+
+
+def pil_frames(motion_2d, canvas_size, config):
+    """(T, H, W, 4) uint8 frames from the PIL path."""
+    return np.stack([np.asarray(frame) for frame in render_frames(motion_2d, canvas_size, config)])
+
+
+def pil_supersampled(motion_2d, canvas_size, config):
+    """(T, H, W, 4) uint8 PIL frames drawn at SUPERSAMPLE× and box filtered (premultiplied)."""
+    rendering = config['rendering']
+    scaled = with_rendering(
+        config,
+        bone_width=rendering['bone_width'] * SUPERSAMPLE,
+        joint_radius=(rendering['joint_radius'] + 0.4) * SUPERSAMPLE,
+        head_radius=(rendering['head_radius'] + 0.4) * SUPERSAMPLE,
+    )
+    offset = (SUPERSAMPLE - 1) / 2  # pixel centres of the small canvas
+    frames = []
+    for joints in motion_2d:
+        large = render_frame(joints * SUPERSAMPLE + offset, canvas_size * SUPERSAMPLE, scaled)
+        frames.append(np.asarray(large.convert('RGBa').reduce(SUPERSAMPLE).convert('RGBA')))
+    return np.stack(frames)
+
+
+def neighbour_match(frames, reference):
+    """Share of pixels equal to the reference at the same pixel or one of its 8 neighbours."""
+    pixels = frames.view(np.uint32)[..., 0]
+    padded = np.pad(reference.view(np.uint32)[..., 0], ((0, 0), (1, 1), (1, 1)))
+    height, width = pixels.shape[1:]
+    matched = np.zeros(pixels.shape, dtype=bool)
+    for dy in range(3):
+        for dx in range(3):
+            matched |= pixels == padded[:, dy:dy + height, dx:dx + width]
+    return matched.mean()
+
+
+def time_runs(fn, clips, canvas_size, config, runs):
+    """Median seconds to render every clip once."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for motion_2d in clips:
+            fn(motion_2d, canvas_size, config)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NumPy batch vs PIL stick-figure rasterizers")
+    parser.add_argument("--frames", type=int, default=120, help="Frames per clip (default: 120)")
+    parser.add_argument("--clips", type=int, default=4, help="Clips (default: 4)")
+    parser.add_argument("--runs", type=int, default=5, help="Timing runs (default: 5)")
+    parser.add_argument("--synthetic", action="store_true", help="Random-walk clips instead of projected/")
+    args = parser.parse_args()
+
+    config = load_config()
+    canvas_size = config['canvas']['width']
+    hard = with_rendering(config, edge_antialias=False)
+    smooth = with_rendering(config, edge_antialias=True)
+
+    print("=" * 60)
+    print("Batch Rasterizer Benchmark")
+    print("=" * 60)
+
+    clips = load_clips(config, canvas_size, args.frames, args.clips, args.synthetic)
+    total_frames = sum(len(clip) for clip in clips)
+    print(f"✓ {len(clips)} clips, {total_frames} frames on a {canvas_size}×{canvas_size} canvas\n")
+
+    # Agreement
+    reference = [pil_frames(clip, canvas_size, config) for clip in clips]
+    batch_hard = [rasterize_frames(clip, canvas_size, hard) for clip in clips]
+    exact = np.mean([(a == b).all(axis=-1).mean() for a, b in zip(batch_hard, reference)])
+    nearby = min(neighbour_match(a, b) for a, b in zip(batch_hard, reference))
+    print(f"  Hard edges vs PIL:   {exact * 100:.2f}% identical, {nearby * 100:.3f}% within 1 px")
+
+    supersampled = [pil_supersampled(clip, canvas_size, config) for clip in clips]
+    batch_smooth = [rasterize_frames(clip, canvas_size, smooth) for clip in clips]
+    area = sum(int(a[..., 3].sum()) for a in batch_smooth)
+    area_reference = sum(int(b[..., 3].sum()) for b in supersampled)
+    area_error = (area - area_reference) / max(area_reference, 1)
+    alpha_error = np.mean([
+        np.abs(a[..., 3].astype(np.int16) - b[..., 3])[(a[..., 3] > 0) | (b[..., 3] > 0)].mean()
+        for a, b in zip(batch_smooth, supersampled)
+    ])
+    print(f"  Anti-aliased vs PIL {SUPERSAMPLE}×: area {area_error * 100:+.2f}% off, "
+          f"mean |Δalpha| {alpha_error:.1f}/255 on figure pixels")
+
+    if nearby < MIN_NEIGHBOUR_MATCH or abs(area_error) > MAX_AREA_ERROR:
+        print("❌ Batch rasterizer disagrees with the PIL path")
+        sys.exit(1)
+    print("✓ Output agrees with the PIL path")
+
+    # Speed
+    pil = time_runs(pil_frames, clips, canvas_size, config, args.runs)
+    pil_joints = time_runs(pil_frames, clips, canvas_size, with_rendering(config, joint_antialias=True), args.runs)
+    pil_smooth = time_runs(pil_supersampled, clips, canvas_size, config, max(1, args.runs // 2))
+    batch = time_runs(rasterize_frames, clips, canvas_size, hard, args.runs)
+    batch_aa = time_runs(rasterize_frames, clips, canvas_size, smooth, args.runs)
+
+    print(f"\n  PIL:                 {pil * 1000:8.1f} ms  ({total_frames / pil:8,.0f} frames/s)")
+    print(f"  PIL, smooth joints:  {pil_joints * 1000:8.1f} ms  ({total_frames / pil_joints:8,.0f} frames/s)")
+    print(f"  PIL {SUPERSAMPLE}× (anti-aliased): {pil_smooth * 1000:8.1f} ms  "
+          f"({total_frames / pil_smooth:8,.0f} frames/s)")
+    print(f"  NumPy hard edges:    {batch * 1000:8.1f} ms  ({total_frames / batch:8,.0f} frames/s)")
+    print(f"  NumPy anti-aliased:  {batch_aa * 1000:8.1f} ms  ({total_frames / batch_aa:8,.0f} frames/s)")
+    print(f"\n⚡ Speedup: {pil / batch:.1f}× vs PIL, "
+          f"{pil_smooth / batch_aa:.1f}× vs PIL {SUPERSAMPLE}× at anti-aliased quality")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Check Fused and Staged Manifests Match
+
+The fused path (src/fused_pipeline.py) promises the same output as running
+stages 03 → 04 → 05 → 09. This renders a few motion files both ways in a
+scratch copy of the pipeline and compares the two output manifests field by
+field (frame counts, file sizes, loop and tempo entries, stats), ignoring
+only the generation timestamp.
+
+Exits non-zero on any difference, so it can run in CI.
+
+Usage:
+    python scripts/check_fused_manifest.py
+
+    # More exercises, keep the scratch copy for inspection
+    python scripts/check_fused_manifest.py --count 5 --keep
+
+    # Motion files and step 02 manifest from elsewhere
+    python scripts/check_fused_manifest.py --motion-dir /workspace/motion_data \
+        --source-manifest /workspace/manifest.json
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PIPELINE_ROOT = Path(__file__).parent.parent
+
+# Differ between any two runs
+VOLATILE_KEYS = {"generated_at"}
+
+
+def make_workspace(motion_files: list, source_manifest: Path) -> Path:
+    """Scratch pipeline with src/, config, the step 02 manifest and the given motion files."""
+    workspace = Path(tempfile.mkdtemp(prefix="fused-check-"))
+    shutil.copytree(PIPELINE_ROOT / "src", workspace / "src",
+                    ignore=shutil.ignore_patterns("__pycache__"))
+    shutil.copy(PIPELINE_ROOT / "config.json", workspace / "config.json")
+    shutil.copy(source_manifest, workspace / "manifest.json")
+
+    motion_dir = workspace / "motion_data"
+    motion_dir.mkdir()
+    for motion_file in motion_files:
+        shutil.copy(motion_file, motion_dir)
+        sidecar = motion_file.with_suffix(".json")
+        if sidecar.exists():
+            shutil.copy(sidecar, motion_dir)
+    return workspace
+
+
+def run_script(workspace: Path, script: str, *args: str):
+    """Run one pipeline script inside the workspace, failing loudly."""
+    result = subprocess.run([sys.executable, f"src/{script}", *args], cwd=workspace,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    if result.returncode != 0:
+        print(result.stdout)
+        raise RuntimeError(f"{script} exited with {result.returncode}")
+
+
+def differences(staged, fused, path="") -> list:
+    """Paths (and values) where two manifests disagree."""
+    if isinstance(staged, dict) and isinstance(fused, dict):
+        found = []
+        for key in sorted(set(staged) | set(fused)):
+            if key in VOLATILE_KEYS:
+                continue
+            if key not in staged or key not in fused:
+                found.append(f"{path}/{key}: only in {'staged' if key in staged else 'fused'}")
+            else:
+                found += differences(staged[key], fused[key], f"{path}/{key}")
+        return found
+    if staged != fused:
+        return [f"{path}: staged {staged!r}, fused {fused!r}"]
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare fused and staged output manifests")
+    parser.add_argument("--count", type=int, default=3, help="Motion files to render (default: 3)")
+    parser.add_argument("--motion-dir", type=Path, default=PIPELINE_ROOT / "motion_data",
+                        help="Motion files to copy (default: motion_data/)")
+    parser.add_argument("--source-manifest", type=Path, default=PIPELINE_ROOT / "manifest.json",
+                        help="Source manifest from step 02 (default: manifest.json)")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch pipeline copy")
+    args = parser.parse_args()
+
+    motion_files = sorted(args.motion_dir.glob("*.npy"))[:args.count]
+    if not motion_files:
+        print(f"❌ No motion files found in {args.motion_dir}")
+        sys.exit(1)
+    if not args.source_manifest.exists():
+        print(f"❌ Source manifest not found: {args.source_manifest}")
+        print("   Run 02_prepare_batch.py first.")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("Fused vs Staged Manifest Check")
+    print("=" * 60)
+
+    workspace = make_workspace(motion_files, args.source_manifest)
+    try:
+        print(f"📁 Scratch pipeline: {workspace}")
+
+        print("🔄 Staged: 03 → 04 → 05 → 09")
+        run_script(workspace, "03_project_to_2d.py", "--force")
+        run_script(workspace, "04_render_webp.py", "--force")
+        run_script(workspace, "05_render_lottie.py", "--force")
+        run_script(workspace, "09_generate_manifest.py", "--include-lottie",
+                   "--output", "output/manifest_staged.json")
+
+        print("⚡ Fused")
+        run_script(workspace, "fused_pipeline.py", "--force", "--output", "output/manifest_fused.json")
+
+        with open(workspace / "output" / "manifest_staged.json") as f:
+            staged = json.load(f)
+        with open(workspace / "output" / "manifest_fused.json") as f:
+            fused = json.load(f)
+        found = differences(staged, fused)
+    finally:
+        if not args.keep:
+            shutil.rmtree(workspace)
+
+    if found:
+        print(f"\n❌ Manifests differ ({len(found)} fields):")
+        for line in found:
+            print(f"  {line}")
+        sys.exit(1)
+
+    print(f"\n✅ Manifests match ({len(staged['exercises'])} exercises)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Check Pipeline CLI Start-up Budget
+
+Guards against heavy imports creeping back into module scope:
+
+1. Times `python src/pipeline.py --help` (median of several runs) and fails
+   if it exceeds the budget (default 150 ms).
+2. Runs `pipeline <command> --help` for every subcommand under
+   `python -X importtime` and fails if any of them imports a heavy
+   dependency (pandas, anthropic, torch, OpenCV, ultralytics, GVHMR,
+   ViTPose). Commands other than convert/video must not import NumPy or
+   Pillow either. This part does not depend on machine speed.
+
+Exits non-zero on any failure, so it can run in CI or a pre-commit hook.
+
+Usage:
+    python scripts/check_startup_budget.py
+
+    # Looser budget on a slow machine, more timing runs
+    python scripts/check_startup_budget.py --budget-ms 250 --runs 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PIPELINE = Path(__file__).parent.parent / "src" / "pipeline.py"
+
+# Never imported just to print help
+HEAVY_MODULES = {"pandas", "anthropic", "torch", "cv2", "ultralytics", "gvhmr", "vitpose"}
+
+# Only the GPU-side commands may load NumPy at import time
+ARRAY_MODULES = {"numpy", "PIL"}
+ARRAY_COMMANDS = {"convert", "video"}
+
+
+def time_help(runs: int) -> float:
+    """Median wall-clock milliseconds of `pipeline --help`."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, str(PIPELINE), "--help"], check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def imported_modules(command: str) -> set:
+    """Top-level packages imported by `pipeline <command> --help`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(PIPELINE), command, "--help"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"'pipeline {command} --help' exited with {result.returncode}")
+
+    # Lines look like "import time:   self [us] | cumulative | package.module"
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            name = line.rsplit("|", 1)[1].strip()
+            modules.add(name.split(".")[0])
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check pipeline CLI start-up time and lazy imports")
+    parser.add_argument("--budget-ms", type=float, default=150.0,
+                        help="Maximum median time for 'pipeline --help' (default: 150)")
+    parser.add_argument("--runs", type=int, default=10, help="Timing runs (default: 10)")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PIPELINE.parent))
+    from pipeline import COMMANDS
+
+    print("=" * 60)
+    print("Pipeline Start-up Budget")
+    print("=" * 60)
+
+    failures = []
+
+    median_ms = time_help(args.runs)
+    status = "✓" if median_ms <= args.budget_ms else "✗"
+    print(f"\n{status} pipeline --help: {median_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    if median_ms > args.budget_ms:
+        failures.append(f"pipeline --help took {median_ms:.0f} ms")
+
+    print("\nImports for '<command> --help':")
+    for command in COMMANDS:
+        forbidden = HEAVY_MODULES if command in ARRAY_COMMANDS else HEAVY_MODULES | ARRAY_MODULES
+        try:
+            loaded = imported_modules(command) & forbidden
+        except RuntimeError as e:
+            print(f"  ✗ {command:12s} {e}")
+            failures.append(str(e))
+            continue
+
+        if loaded:
+            print(f"  ✗ {command:12s} imports {', '.join(sorted(loaded))}")
+            failures.append(f"'pipeline {command} --help' imports {', '.join(sorted(loaded))}")
+        else:
+            print(f"  ✓ {command}")
+
+    print("\n" + "=" * 60)
+    if failures:
+        print(f"❌ {len(failures)} start-up regression(s):")
+        for failure in failures:
+            print(f"   {failure}")
+        print("=" * 60)
+        sys.exit(1)
+
+    print("✅ Start-up within budget")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
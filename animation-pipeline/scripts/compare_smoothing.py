@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Compare Renders With and Without Temporal Smoothing
+
+For each motion file, projects the clip as stage 03 does (whole clip, no
+loop trim) once raw and once through the configured smoothing filter, then
+reports per exercise the Lottie keyframe count and JSON size (stage 05
+keyframe optimization) and the animated WebP size (stage 04). Nothing is
+written outside a temporary directory.
+
+Synthetic clips have no jitter; --noise adds Gaussian joint noise (in
+motion units, metres for SMPL-H) to mimic the GVHMR video path.
+
+Usage:
+    python scripts/compare_smoothing.py
+
+    # Simulate 8 mm tracking jitter, try One-Euro instead of the config's filter
+    python scripts/compare_smoothing.py --noise 0.008 --method one_euro
+
+    # Lottie only (WebP encoding is the slow part)
+    python scripts/compare_smoothing.py --no-webp --limit 20
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from intensely_pipeline.config import PIPELINE_ROOT, load_config, load_manifest  # noqa: E402
+from intensely_pipeline.frame_rate import resample_frames  # noqa: E402
+from intensely_pipeline.projection import canvas_padding, project_motion_unit, to_canvas  # noqa: E402
+from intensely_pipeline.render_lottie import create_lottie_animation, optimize_keyframes_for_animation  # noqa: E402
+from intensely_pipeline.render_webp import render_frame, save_as_webp  # noqa: E402
+from intensely_pipeline.smoothing import smooth_motion, smoothing_settings  # noqa: E402
+
+
+def measure(motion_3d, camera_angle, config, webp_path=None):
+    """Lottie keyframes and bytes, and WebP bytes (if webp_path), for one clip."""
+    canvas_size = config["canvas"]["width"]
+    rendering = config["rendering"]
+    motion_unit, _ = project_motion_unit(motion_3d, camera_angle)
+    motion_2d = to_canvas(motion_unit.astype(np.float64), canvas_size, canvas_padding(config))
+
+    keyframe_map = optimize_keyframes_for_animation(motion_2d)
+    fps = rendering.get("target_fps", rendering.get("fps", 15))
+    lottie_json = create_lottie_animation(motion_2d, keyframe_map, config, fps=fps)
+    stats = {
+        "keyframes": sum(len(frames) for frames in keyframe_map.values()),
+        "lottie_bytes": len(json.dumps(lottie_json, separators=(",", ":"))),
+    }
+
+    if webp_path is not None:
+        frames = [
+            render_frame(joints, canvas_size, config)
+            for joints in resample_frames(motion_2d, rendering["source_fps"], rendering["fps"],
+                                          rendering.get("antialias", True))
+        ]
+        save_as_webp(frames, webp_path, rendering["fps"], loop=0)
+        stats["webp_bytes"] = webp_path.stat().st_size
+    return stats
+
+
+def change(before, after):
+    """Percentage change, formatted."""
+    return f"{(after - before) / before * 100:+6.1f}%" if before else "     -"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyframe counts and file sizes with and without smoothing")
+    parser.add_argument("--motion-dir", default=str(PIPELINE_ROOT / "motion_data"),
+                        help="Directory of (T, J, 3) motion .npy files (default: motion_data/)")
+    parser.add_argument("--noise", type=float, default=0.0,
+                        help="Add Gaussian joint jitter with this standard deviation (default: 0)")
+    parser.add_argument("--method", choices=["savgol", "one_euro"], help="Override smoothing.method")
+    parser.add_argument("--window", type=int, help="Override smoothing.window (Savitzky-Golay)")
+    parser.add_argument("--order", type=int, help="Override smoothing.order (Savitzky-Golay)")
+    parser.add_argument("--no-webp", action="store_true", help="Skip WebP encoding")
+    parser.add_argument("--limit", type=int, help="Only the first N motion files")
+    args = parser.parse_args()
+
+    config = load_config()
+    overrides = {key: value for key, value in
+                 {"method": args.method, "window": args.window, "order": args.order}.items()
+                 if value is not None}
+    config["smoothing"] = dict(config.get("smoothing", {}), enabled=True, **overrides)
+    settings = smoothing_settings(config)
+    try:
+        exercises = load_manifest()["exercises"]
+    except (OSError, json.JSONDecodeError, KeyError):
+        exercises = {}
+
+    motion_files = sorted(Path(args.motion_dir).glob("*.npy"))[:args.limit]
+    if not motion_files:
+        print(f"❌ No .npy files found in {args.motion_dir}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("Smoothing Comparison")
+    print("=" * 60)
+    method = settings["method"]
+    detail = f"window {settings['window']}, order {settings['order']}" if method == "savgol" else (
+        f"min_cutoff {settings['min_cutoff']} Hz, beta {settings['beta']}")
+    print(f"✓ {len(motion_files)} clips, {method} ({detail}), noise {args.noise}\n")
+
+    header = f"  {'Exercise':32s} {'Keyframes':>15s} {'':>7s} {'Lottie KB':>13s} {'':>7s}"
+    if not args.no_webp:
+        header += f" {'WebP KB':>13s} {'':>7s}"
+    print(header)
+
+    rng = np.random.default_rng(0)
+    totals = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for motion_file in motion_files:
+            slug = motion_file.stem
+            motion_3d = np.load(motion_file).astype(np.float64)
+            if args.noise:
+                motion_3d += rng.normal(scale=args.noise, size=motion_3d.shape)
+            camera_angle = exercises.get(slug, {}).get("camera_angle", config["camera_angles"]["default"])
+
+            webp_path = None if args.no_webp else Path(tmp) / f"{slug}.webp"
+            before = measure(motion_3d, camera_angle, config, webp_path)
+            after = measure(smooth_motion(motion_3d, settings), camera_angle, config, webp_path)
+
+            row = (f"  {slug[:32]:32s} {before['keyframes']:6d} → {after['keyframes']:6d} "
+                   f"{change(before['keyframes'], after['keyframes'])} "
+                   f"{before['lottie_bytes'] / 1024:5.1f} → {after['lottie_bytes'] / 1024:5.1f} "
+                   f"{change(before['lottie_bytes'], after['lottie_bytes'])}")
+            if not args.no_webp:
+                row += (f" {before['webp_bytes'] / 1024:5.1f} → {after['webp_bytes'] / 1024:5.1f} "
+                        f"{change(before['webp_bytes'], after['webp_bytes'])}")
+            print(row)
+
+            for key in before:
+                totals.setdefault(key, [0, 0])
+                totals[key][0] += before[key]
+                totals[key][1] += after[key]
+
+    print("\n" + "=" * 60)
+    print("TOTAL")
+    print("=" * 60)
+    for key, label, scale in [("keyframes", "Keyframes", 1), ("lottie_bytes", "Lottie KB", 1024),
+                              ("webp_bytes", "WebP KB", 1024)]:
+        if key in totals:
+            before, after = totals[key]
+            print(f"  {label:10s} {before / scale:10.1f} → {after / scale:10.1f}  {change(before, after)}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,8 @@ NPZ structure:
 
 Pipeline expects: motion_data/{slug}.npy with shape (T, 22, 3)
   — 3D world positions of the 22 body joints in meters
+and motion_data/{slug}.json with the frame rate of that data ({"fps": 15}),
+which stages 03-05 resample from
 
 Usage (on RunPod):
     python /workspace/convert_hymotion_to_npy.py \\
@@ -30,6 +32,11 @@ Usage (local, after downloading hymotion_output/):
         --input  hymotion_output \\
         --output motion_data
 
+Usage (several machines sharing the volume; needs the repo's src/ alongside):
+    python scripts/convert_hymotion_to_npy.py ... --shard 0/4   # static split
+    python scripts/convert_hymotion_to_npy.py ... --claim       # lock-file queue
+    python src/merge_shard_stats.py --stage convert
+
 Requirements:
     pip install smplx scipy numpy
     (smplx and scipy already available on RunPod after runpod_setup.sh)
@@ -40,6 +47,12 @@ import sys
 import numpy as np
 from pathlib import Path
 
+# Sharding and atomic writes come from the pipeline package in ../src
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from intensely_pipeline.build_graph import atomic_write
+from intensely_pipeline.frame_rate import write_motion_fps
+from intensely_pipeline.sharding import LockDir, parse_shard, select_shard, shard_label, write_stats
+
 
 BODY_JOINT_COUNT = 22  # pelvis → right_wrist (SMPL-H joints 0-21)
 SRC_FPS = 20           # HY-Motion internal frame rate
@@ -242,7 +255,11 @@ def convert_one(slug: str, raw_dir: Path, output_dir: Path, model) -> bool:
         # Subsample 20fps → 15fps
         joints = subsample(joints, SRC_FPS, TGT_FPS)
 
-        np.save(str(output_dir / f"{slug}.npy"), joints)
+        # Atomic, so other nodes never see a half-written .npy as converted;
+        # the frame rate goes first so the .npy never appears without it
+        write_motion_fps(output_dir / f"{slug}.npy", TGT_FPS)
+        with atomic_write(output_dir / f"{slug}.npy") as f:
+            np.save(f, joints)
         return True
 
     except Exception as e:
@@ -262,6 +279,10 @@ def main():
                         help="Output directory for .npy files (motion_data/)")
     parser.add_argument("--hy-motion-dir", default="/workspace/HY-Motion-1.0",
                         help="HY-Motion repo root (for locating SMPL-H model)")
+    parser.add_argument("--shard", type=parse_shard, metavar="i/N",
+                        help="Only convert slugs in shard i of N (by slug hash)")
+    parser.add_argument("--claim", action="store_true",
+                        help="Claim slugs through lock files (for several nodes on a shared volume)")
     args = parser.parse_args()
 
     raw_dir    = Path(args.input)
@@ -286,17 +307,32 @@ def main():
         print(f"❌ No exercise output found in {raw_dir}")
         sys.exit(1)
 
-    already_done = {f.stem for f in output_dir.glob("*.npy")}
+    if args.shard is not None:
+        slugs = select_shard(slugs, args.shard)
+        print(f"Shard {args.shard[0]}/{args.shard[1]}: {len(slugs)} exercises")
+
+    already_done = {f.stem for f in output_dir.glob("*.npy")} & set(slugs)
     to_convert   = [s for s in slugs if s not in already_done]
 
     print(f"Total exercises:   {len(slugs)}")
     print(f"Already converted: {len(already_done)}")
     print(f"To convert:        {len(to_convert)}\n")
 
-    success, failed = 0, []
+    success, failed, claimed_elsewhere = 0, [], 0
+    locks = LockDir("convert", root=output_dir.parent / ".locks") if args.claim else None
 
     for slug in to_convert:
-        ok = convert_one(slug, raw_dir, output_dir, model)
+        if locks is None:
+            ok = convert_one(slug, raw_dir, output_dir, model)
+        else:
+            with locks.held(slug) as claimed:
+                # Another node may have converted it since we listed output_dir
+                if not claimed or (output_dir / f"{slug}.npy").exists():
+                    print(f"  - {slug}: claimed by another node")
+                    claimed_elsewhere += 1
+                    continue
+                ok = convert_one(slug, raw_dir, output_dir, model)
+
         if ok:
             shape = np.load(str(output_dir / f"{slug}.npy")).shape
             print(f"  ✓ {slug}: {shape}")
@@ -307,11 +343,27 @@ def main():
 
     print(f"\n{'='*50}")
     print(f"Converted: {success}  |  Already done: {len(already_done)}  |  Failed: {len(failed)}")
+    if locks is not None:
+        print(f"Claimed by other nodes: {claimed_elsewhere}")
     total_npy = len(list(output_dir.glob("*.npy")))
     print(f"Total .npy files:  {total_npy} / 219")
 
+    sharded = args.shard is not None or args.claim
+    if sharded:
+        label = shard_label(args.shard, args.claim)
+        stats_path = write_stats("convert", label, {
+            "total": len(slugs),
+            "converted": success,
+            "already_done": len(already_done),
+            "claimed_elsewhere": claimed_elsewhere,
+            "failed": len(failed),
+        }, root=output_dir.parent / "shard_stats",
+            claimed=success + len(failed) if args.claim else None)
+        print(f"Shard stats: {stats_path}")
+
     if failed:
-        failed_path = Path(args.output).parent / "conversion_failed.txt"
+        failed_name = f"conversion_failed_{label}.txt" if sharded else "conversion_failed.txt"
+        failed_path = Path(args.output).parent / failed_name
         failed_path.write_text("\n".join(failed) + "\n")
         print(f"\nFailed slugs saved to: {failed_path}")
         print("These exercises may need video fallback (GVHMR).")
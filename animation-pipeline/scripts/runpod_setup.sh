@@ -417,7 +417,8 @@ Conversion steps:
   2. Run SMPL-H forward kinematics (smplx) to get joint world positions
   3. Extract first 22 body joints (indices 0-21, pelvis through wrists)
   4. Subsample from HY-Motion 20fps → pipeline 15fps
-  5. Save as float32 .npy
+  5. Save as float32 .npy, with its frame rate in <slug>.json next to it
+     ({"fps": 15}; the pipeline otherwise assumes rendering.source_fps)
 
 Usage:
     python convert_hymotion_to_npy.py \
@@ -427,6 +428,8 @@ Usage:
 """
 
 import argparse
+import json
+import os
 import sys
 import numpy as np
 from pathlib import Path
@@ -667,8 +670,14 @@ def convert_one(slug: str, raw_dir: Path, output_dir: Path, smplh_model) -> bool
         # Subsample 20fps → 15fps
         joints = subsample(joints, SRC_FPS, TGT_FPS)
 
-        # Save
+        # Save: the frame rate sidecar goes first (atomically), so the .npy
+        # never appears without it
         out_path = output_dir / f"{slug}.npy"
+        meta_path = out_path.with_suffix(".json")
+        tmp_path = meta_path.with_name(meta_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"fps": TGT_FPS}, f, indent=2)
+        os.replace(tmp_path, meta_path)
         np.save(str(out_path), joints)
         return True
 
@@ -2,10 +2,12 @@
 """
 Generate motion prompts for HY-Motion 1.0 text-to-motion model.
 Reads exercise_library_master.csv and outputs prompts.json.
+
+pandas is imported where the CSV is read, so --help returns immediately.
 """
 
+import argparse
 import json
-import pandas as pd
 from pathlib import Path
 from collections import Counter
 
@@ -18,7 +20,14 @@ def load_config():
 
 
 def get_camera_angle(movement_pattern, config):
-    """Map movement pattern to camera angle."""
+    """
+    Map movement pattern to camera angle.
+
+    A first guess: once motion exists, suggest_camera_angles.py scores the
+    views on the motion itself and flags exercises this guess may not suit.
+    """
+    import pandas as pd
+
     if not movement_pattern or pd.isna(movement_pattern):
         return config["camera_angles"]["default"]
 
@@ -43,6 +52,8 @@ def generate_prompt(row):
     Uses exercise name, description, primary muscles, and instructions
     to create a descriptive prompt suitable for text-to-motion AI.
     """
+    import pandas as pd
+
     name = str(row.get("name", "")).strip() if pd.notna(row.get("name")) else ""
     description = str(row.get("description", "")).strip() if pd.notna(row.get("description")) else ""
     instructions = row.get("instructions", "") if pd.notna(row.get("instructions")) else ""
@@ -90,6 +101,10 @@ def generate_prompt(row):
 
 def main():
     """Main pipeline entry point."""
+    argparse.ArgumentParser(
+        description="Generate motion prompts from data/exercise_library_master.csv into prompts.json"
+    ).parse_args()
+
     print("=" * 60)
     print("Exercise Animation Pipeline - Prompt Generator")
     print("=" * 60)
@@ -106,6 +121,8 @@ def main():
         print("   Please add exercise_library_master.csv to the data/ directory.")
         return
 
+    import pandas as pd
+
     df = pd.read_csv(data_path)
     print(f"✓ Loaded {len(df)} exercises from CSV")
 
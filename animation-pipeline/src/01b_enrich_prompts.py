@@ -3,9 +3,12 @@
 Enrich weak prompts using Claude API.
 Flags prompts <15 words or missing body parts, then generates
 40-50 word biomechanical descriptions. Implements checkpointing
-and rate-limiting for API reliability.
+(in the pipeline.db catalog) and rate-limiting for API reliability.
+
+The anthropic client is imported on the first API call.
 """
 
+import argparse
 import json
 import os
 import re
@@ -13,12 +16,14 @@ import time
 from pathlib import Path
 from typing import Dict, List, Set
 
-import anthropic
+from intensely_pipeline.catalog import Catalog
 
 
 # Rate limiting configuration
 API_DELAY_SECONDS = 1.0  # Delay between API calls
 CHECKPOINT_INTERVAL = 5  # Save checkpoint every N enrichments
+CHECKPOINT_KEY = "prompt_enrichment"  # Catalog state key
+LEGACY_CHECKPOINT = Path(__file__).parent.parent / ".prompt_enrichment_checkpoint.json"
 
 # Body part keywords to check for
 BODY_PARTS = {
@@ -47,20 +52,27 @@ def save_prompts(prompts: Dict, path: Path):
         json.dump(prompts, f, indent=2)
 
 
-def load_checkpoint():
-    """Load checkpoint if exists."""
-    checkpoint_path = Path(__file__).parent.parent / ".prompt_enrichment_checkpoint.json"
-    if checkpoint_path.exists():
-        with open(checkpoint_path) as f:
-            return json.load(f)
-    return {"enriched": {}, "processed_slugs": []}
+def load_checkpoint(catalog: Catalog):
+    """Load checkpoint if exists (migrating an old JSON checkpoint file)."""
+    checkpoint = catalog.get_state(CHECKPOINT_KEY)
+    if checkpoint is None and LEGACY_CHECKPOINT.exists():
+        with open(LEGACY_CHECKPOINT) as f:
+            checkpoint = json.load(f)
+        catalog.set_state(CHECKPOINT_KEY, checkpoint)
+        LEGACY_CHECKPOINT.unlink()
+    return checkpoint or {"enriched": {}, "processed_slugs": []}
 
 
-def save_checkpoint(checkpoint: Dict):
+def save_checkpoint(catalog: Catalog, checkpoint: Dict):
     """Save checkpoint."""
-    checkpoint_path = Path(__file__).parent.parent / ".prompt_enrichment_checkpoint.json"
-    with open(checkpoint_path, "w") as f:
-        json.dump(checkpoint, f, indent=2)
+    catalog.set_state(CHECKPOINT_KEY, checkpoint)
+
+
+def clear_checkpoint(catalog: Catalog):
+    """Remove checkpoint once every prompt is processed."""
+    if catalog.get_state(CHECKPOINT_KEY) is not None:
+        catalog.delete_state(CHECKPOINT_KEY)
+        print("✓ Removed checkpoint")
 
 
 def is_weak_prompt(prompt: str) -> tuple[bool, List[str]]:
@@ -98,6 +110,8 @@ def enrich_prompt_with_claude(
     Returns:
         Enriched 40-50 word prompt starting with "A person"
     """
+    import anthropic
+
     client = anthropic.Anthropic(api_key=api_key)
 
     system_prompt = """You are an expert in exercise biomechanics and motion description.
@@ -150,6 +164,10 @@ Return ONLY the improved description, no explanation."""
 
 def main():
     """Main enrichment pipeline."""
+    argparse.ArgumentParser(
+        description="Enrich weak prompts in prompts.json with the Claude API (needs ANTHROPIC_API_KEY)"
+    ).parse_args()
+
     print("=" * 60)
     print("Exercise Animation Pipeline - Prompt Enrichment")
     print("=" * 60)
@@ -169,7 +187,8 @@ def main():
     print(f"✓ Loaded {total_count} prompts from prompts.json")
 
     # Load checkpoint if exists
-    checkpoint = load_checkpoint()
+    catalog = Catalog()
+    checkpoint = load_checkpoint(catalog)
     already_processed = set(checkpoint.get("processed_slugs", []))
 
     if already_processed:
@@ -199,10 +218,7 @@ def main():
     if not weak_prompts:
         print("✓ All prompts are strong! No enrichment needed.")
         # Clean up checkpoint if exists
-        checkpoint_path = Path(__file__).parent.parent / ".prompt_enrichment_checkpoint.json"
-        if checkpoint_path.exists():
-            checkpoint_path.unlink()
-            print("✓ Removed checkpoint file")
+        clear_checkpoint(catalog)
         return
 
     # Process weak prompts
@@ -244,7 +260,7 @@ def main():
 
             # Save checkpoint periodically
             if enriched_count % CHECKPOINT_INTERVAL == 0:
-                save_checkpoint(checkpoint)
+                save_checkpoint(catalog, checkpoint)
                 print(f"  💾 Checkpoint saved ({enriched_count} enriched)")
 
             # Rate limiting
@@ -253,7 +269,7 @@ def main():
 
         except KeyboardInterrupt:
             print("\n\n⚠️  Interrupted by user!")
-            save_checkpoint(checkpoint)
+            save_checkpoint(catalog, checkpoint)
             print("💾 Progress saved to checkpoint")
             print(f"   Processed: {enriched_count}/{len(weak_prompts)}")
             print("   Run script again to resume from checkpoint")
@@ -264,7 +280,7 @@ def main():
             error_count += 1
 
             # Save checkpoint on error too
-            save_checkpoint(checkpoint)
+            save_checkpoint(catalog, checkpoint)
             print("  💾 Checkpoint saved after error")
 
             # Continue with next prompt
@@ -280,10 +296,7 @@ def main():
     print(f"\n✓ Saved enriched prompts to {prompts_path.name}")
 
     # Clean up checkpoint
-    checkpoint_path = Path(__file__).parent.parent / ".prompt_enrichment_checkpoint.json"
-    if checkpoint_path.exists():
-        checkpoint_path.unlink()
-        print("✓ Removed checkpoint file")
+    clear_checkpoint(catalog)
 
     # Print summary
     print("\n" + "=" * 60)
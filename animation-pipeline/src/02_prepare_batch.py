@@ -2,13 +2,25 @@
 """
 Prepare batch files for motion generation.
 Reads prompts.json and creates individual text files for each exercise
-in prompts/ directory, plus a manifest.json for tracking.
+in prompts/ directory, plus a manifest.json for tracking. Exercises and
+prompt files are also recorded in the pipeline.db catalog.
+
+Exercises derived from another one's motion (set_variant.py) get no prompt
+file: their motion is mirrored on the CPU by stage 03, not generated.
 """
 
+import argparse
 import json
 from pathlib import Path
 from collections import Counter
 
+from intensely_pipeline.build_graph import hash_file
+from intensely_pipeline.catalog import Catalog
+from intensely_pipeline.config import save_manifest
+
+# Manifest fields set after step 02 that survive a rebuild
+CARRIED_KEYS = ["camera_angle_override", "camera_angle_source", "angle_suggestion", "derived_from"]
+
 
 def load_prompts():
     """Load prompts.json."""
@@ -22,13 +34,16 @@ def load_prompts():
         return json.load(f)
 
 
-def create_prompt_files(prompts: dict, output_dir: Path):
+def create_prompt_files(prompts: dict, output_dir: Path, catalog: Catalog, derived=()):
     """
     Create individual text files for each exercise prompt.
 
     Args:
         prompts: Dictionary of slug -> prompt data
         output_dir: Directory to write files (will be created if needed)
+        catalog: Artifact catalog to record prompt files in
+        derived: Slugs mirrored from another exercise: no prompt file, and
+                 one left from before is removed so it isn't uploaded
 
     Returns:
         Number of files created
@@ -38,6 +53,10 @@ def create_prompt_files(prompts: dict, output_dir: Path):
     created_count = 0
 
     for slug, data in prompts.items():
+        if slug in derived:
+            (output_dir / f"{slug}.txt").unlink(missing_ok=True)
+            continue
+
         prompt_text = data.get("prompt", "")
         if not prompt_text:
             print(f"  ⚠ Warning: {slug} has no prompt text, skipping")
@@ -47,6 +66,7 @@ def create_prompt_files(prompts: dict, output_dir: Path):
         file_path = output_dir / f"{slug}.txt"
         with open(file_path, "w") as f:
             f.write(prompt_text)
+        catalog.record(slug, "prompt", path=file_path, hash=hash_file(file_path))
 
         created_count += 1
 
@@ -72,9 +92,24 @@ def build_manifest(prompts: dict, manifest_path: Path):
         }
       }
     }
+
+    Camera angle overrides (camera_angle_override/camera_angle_source,
+    written by set_camera_angle.py and suggest_camera_angles.py --apply),
+    angle suggestions and derived variants (derived_from, set_variant.py)
+    are carried over from the existing manifest. A derived variant that is
+    not in prompts.json is kept whole.
     """
     from datetime import datetime
 
+    previous = {}
+    if manifest_path.exists():
+        with open(manifest_path) as f:
+            previous = json.load(f).get("exercises", {})
+    carried = {
+        slug: {key: ex[key] for key in CARRIED_KEYS if key in ex}
+        for slug, ex in previous.items()
+    }
+
     manifest = {
         "total_count": len(prompts),
         "created_at": datetime.now().isoformat(),
@@ -95,15 +130,27 @@ def build_manifest(prompts: dict, manifest_path: Path):
         if data.get("enriched") and "original_prompt" in data:
             manifest["exercises"][slug]["original_prompt"] = data["original_prompt"]
 
+        manifest["exercises"][slug].update(carried.get(slug, {}))
+        if "camera_angle_override" in manifest["exercises"][slug]:
+            manifest["exercises"][slug]["camera_angle"] = manifest["exercises"][slug]["camera_angle_override"]
+
+    for slug, ex in previous.items():
+        if slug not in manifest["exercises"] and ex.get("derived_from"):
+            manifest["exercises"][slug] = ex
+    manifest["total_count"] = len(manifest["exercises"])
+
     # Save manifest
-    with open(manifest_path, "w") as f:
-        json.dump(manifest, f, indent=2)
+    save_manifest(manifest, manifest_path)
 
     return manifest
 
 
 def main():
     """Main batch preparation pipeline."""
+    argparse.ArgumentParser(
+        description="Write prompts/<slug>.txt files and manifest.json from prompts.json"
+    ).parse_args()
+
     print("=" * 60)
     print("Exercise Animation Pipeline - Batch Preparation")
     print("=" * 60)
@@ -116,14 +163,23 @@ def main():
     prompts_dir = Path(__file__).parent.parent / "prompts"
     print(f"\nCreating prompt files in {prompts_dir.name}/")
 
-    # Create individual prompt files
-    created_count = create_prompt_files(prompts, prompts_dir)
-    print(f"✓ Created {created_count} prompt text files")
-
     # Build manifest
     manifest_path = Path(__file__).parent.parent / "manifest.json"
     manifest = build_manifest(prompts, manifest_path)
+    catalog = Catalog()
+    catalog.sync_exercises(manifest["exercises"])
+
+    # Create individual prompt files (none for mirrored variants)
+    derived = {slug for slug, ex in manifest["exercises"].items() if ex.get("derived_from")}
+    created_count = create_prompt_files(prompts, prompts_dir, catalog, derived)
+    print(f"✓ Created {created_count} prompt text files")
+    if derived:
+        print(f"  ({len(derived)} mirrored variants need no generation, see set_variant.py)")
+
     print(f"✓ Created manifest.json")
+    override_count = sum(1 for ex in manifest["exercises"].values() if "camera_angle_override" in ex)
+    if override_count:
+        print(f"  (Kept {override_count} camera angle overrides)")
 
     # Print summary statistics
     print("\n" + "=" * 60)
@@ -12,11 +12,14 @@ Usage:
     python 06_qa_report.py
 """
 
+import argparse
 import json
 import base64
 from pathlib import Path
 from datetime import datetime
 
+from intensely_pipeline.catalog import Catalog, resolve_path
+
 
 def load_manifest():
     """Load manifest with exercise metadata."""
@@ -29,8 +32,17 @@ def load_manifest():
 
 
 def get_webp_files(webp_dir):
-    """Get list of available WebP files."""
-    return {f.stem: f for f in webp_dir.glob("*.webp")}
+    """Get available WebP files as slug -> size in bytes (from the catalog)."""
+    catalog = Catalog()
+    if not catalog.has("webp"):
+        catalog.backfill("webp", webp_dir.glob("*.webp"))
+
+    webp_files = {}
+    for row in catalog.artifacts("webp"):
+        path = resolve_path(row["path"])
+        if path.parent.resolve() == webp_dir.resolve() and path.exists():
+            webp_files[row["slug"]] = row["size_bytes"] or 0
+    return webp_files
 
 
 def generate_html(manifest, webp_files, output_path):
@@ -43,12 +55,13 @@ def generate_html(manifest, webp_files, output_path):
     # Collect unique values for filters
     movement_patterns = sorted(set(ex['movement_pattern'] for ex in exercises.values()))
     camera_angles = sorted(set(ex['camera_angle'] for ex in exercises.values()))
+    sheet_dir = Path(output_path).parent / 'contact_sheets'
 
     # Build exercise data for JavaScript
     exercise_data = []
     for slug, ex_data in sorted(exercises.items()):
         has_animation = slug in webp_files
-        file_size = webp_files[slug].stat().st_size / 1024 if has_animation else 0
+        file_size = webp_files[slug] / 1024 if has_animation else 0
 
         exercise_data.append({
             'slug': slug,
@@ -59,7 +72,12 @@ def generate_html(manifest, webp_files, output_path):
             'enriched': ex_data.get('enriched', False),
             'has_animation': has_animation,
             'file_size_kb': round(file_size, 1) if has_animation else 0,
-            'animation_path': f'webp/{slug}.webp' if has_animation else None
+            'animation_path': f'webp/{slug}.webp' if has_animation else None,
+            'angle_override': 'camera_angle_override' in ex_data,
+            'angle_flagged': ex_data.get('angle_suggestion', {}).get('flagged', False),
+            'suggested_angle': ex_data.get('angle_suggestion', {}).get('angle'),
+            'angle_confidence': ex_data.get('angle_suggestion', {}).get('confidence'),
+            'contact_sheet_path': f'contact_sheets/{slug}.png' if (sheet_dir / f'{slug}.png').exists() else None
         })
 
     html_content = f"""<!DOCTYPE html>
@@ -279,6 +297,12 @@ def generate_html(manifest, webp_files, output_path):
             color: #6ee7b7;
         }}
 
+        .badge.angle-flagged {{
+            background: #78350f;
+            border-color: #f59e0b;
+            color: #fcd34d;
+        }}
+
         .checkbox-group {{
             display: flex;
             align-items: center;
@@ -418,6 +442,7 @@ def generate_html(manifest, webp_files, output_path):
                 <option value="rendered">Rendered</option>
                 <option value="missing">Missing</option>
                 <option value="rework">Needs Rework</option>
+                <option value="angle">Angle Flagged</option>
             </select>
         </div>
 
@@ -463,6 +488,7 @@ def generate_html(manifest, webp_files, output_path):
                 if (statusFilter === 'rendered' && !ex.has_animation) return false;
                 if (statusFilter === 'missing' && ex.has_animation) return false;
                 if (statusFilter === 'rework' && !reworkList.has(ex.slug)) return false;
+                if (statusFilter === 'angle' && !ex.angle_flagged) return false;
                 return true;
             }});
 
@@ -486,10 +512,12 @@ def generate_html(manifest, webp_files, output_path):
                         <div class="card-meta">
                             <div>
                                 <span class="badge">${{ex.movement_pattern}}</span>
-                                <span class="badge angle-badge">${{ex.camera_angle}}°</span>
+                                <span class="badge angle-badge">${{ex.camera_angle}}°${{ex.angle_override ? ' (picked)' : ''}}</span>
                                 ${{ex.enriched ? '<span class="badge enriched">Enriched</span>' : ''}}
+                                ${{ex.angle_flagged ? `<span class="badge angle-flagged" title="Suggested ${{ex.suggested_angle}}° with confidence ${{ex.angle_confidence}}">⚠ Check angle</span>` : ''}}
                             </div>
                             ${{ex.has_animation ? `<div>Size: ${{ex.file_size_kb}} KB</div>` : ''}}
+                            ${{ex.contact_sheet_path ? `<div><a href="${{ex.contact_sheet_path}}" target="_blank">📐 Compare angles</a></div>` : ''}}
                             <div>${{ex.word_count}} words in prompt</div>
                         </div>
                         <div class="checkbox-group" onclick="toggleRework('${{ex.slug}}')">
@@ -625,6 +653,10 @@ def generate_html(manifest, webp_files, output_path):
 
 def main():
     """Generate QA report."""
+    argparse.ArgumentParser(
+        description="Generate output/qa_review.html for visual review of rendered animations"
+    ).parse_args()
+
     print("=" * 60)
     print("Exercise Animation Pipeline - QA Report Generator")
     print("=" * 60)
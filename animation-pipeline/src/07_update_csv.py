@@ -22,6 +22,8 @@ Output:
     - Updates animationUrl column (or animationUrlLottie if --format lottie)
     - Creates backup: data/exercise_library_master.csv.backup
     - Shows statistics about updates
+
+pandas is imported when the CSV is read, so --help returns immediately.
 """
 
 import argparse
@@ -29,9 +31,12 @@ import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from intensely_pipeline.catalog import Catalog, resolve_path
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def find_rendered_files(
@@ -41,6 +46,9 @@ def find_rendered_files(
     """
     Find all successfully rendered animation files.
 
+    Files come from the artifact catalog (pipeline.db); a directory that
+    was rendered before the catalog existed is scanned once and backfilled.
+
     Args:
         output_dir: Directory containing rendered files
         file_extension: File extension to look for (.webp or .json)
@@ -54,11 +62,17 @@ def find_rendered_files(
         print(f"⚠️  Warning: Output directory not found: {output_dir}")
         return {}
 
+    kind = "lottie" if file_extension == ".json" else "webp"
+    catalog = Catalog()
+    if not catalog.has(kind):
+        catalog.backfill(kind, output_path.glob(f"*{file_extension}"))
+
     rendered_files = {}
 
-    for file_path in output_path.glob(f"*{file_extension}"):
-        slug = file_path.stem
-        rendered_files[slug] = str(file_path)
+    for row in catalog.artifacts(kind):
+        file_path = resolve_path(row["path"])
+        if file_path.parent.resolve() == output_path.resolve() and file_path.exists():
+            rendered_files[row["slug"]] = str(file_path)
 
     return rendered_files
 
@@ -95,7 +109,7 @@ def update_csv_with_urls(
     cdn_base_url: str,
     format: str = "webp",
     dry_run: bool = False,
-) -> Tuple[pd.DataFrame, Dict]:
+) -> Tuple["pd.DataFrame", Dict]:
     """
     Update CSV with animation URLs.
 
@@ -109,6 +123,8 @@ def update_csv_with_urls(
     Returns:
         Tuple of (updated_df, stats)
     """
+    import pandas as pd
+
     # Load CSV
     df = pd.read_csv(csv_path)
 
@@ -216,7 +232,7 @@ def print_stats(stats: Dict, format: str = "webp"):
     print("=" * 60)
 
 
-def verify_urls(df: pd.DataFrame, url_column: str) -> None:
+def verify_urls(df: "pd.DataFrame", url_column: str) -> None:
     """
     Verify that URLs are properly formatted.
 
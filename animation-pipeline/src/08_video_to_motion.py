@@ -3,7 +3,8 @@
 Video-to-Motion Processing (GVHMR Wrapper)
 
 Processes iPhone videos through GVHMR pipeline to extract SMPL-H motion data.
-Outputs .npy files matching HY-Motion's 22-joint format.
+Outputs .npy files matching HY-Motion's 22-joint format, each with a .json
+sidecar holding the video's frame rate.
 
 Usage:
     # Process single video
@@ -15,10 +16,16 @@ Usage:
     # Preview without saving
     python src/08_video_to_motion.py --input videos/push-up.mp4 --preview
 
+    # Long videos on a small instance: run inference in chunks that fit 8 GB
+    python src/08_video_to_motion.py --input videos/ --max-memory 8G
+
 Requirements:
     - Must run on GPU instance with GVHMR installed
     - YOLOv8 and ViTPose models downloaded
     - CUDA-enabled GPU
+
+torch, OpenCV, GVHMR, YOLOv8 and ViTPose are imported when the processor
+is created, so --help and argument errors return without loading them.
 """
 
 import argparse
@@ -28,29 +35,11 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import cv2
 import numpy as np
-import torch
 from tqdm import tqdm
 
-# GVHMR imports (adjust paths based on actual GVHMR installation)
-try:
-    from gvhmr.models import GVHMR
-    from gvhmr.utils.video_preprocessing import track_and_crop_video
-    from gvhmr.utils.renderer import Renderer
-    GVHMR_AVAILABLE = True
-except ImportError:
-    print("⚠️  GVHMR not found. This script must run on GPU instance with GVHMR installed.")
-    GVHMR_AVAILABLE = False
-
-# YOLOv8 and ViTPose imports
-try:
-    from ultralytics import YOLO
-    from vitpose import ViTPose
-    PREPROCESSING_AVAILABLE = True
-except ImportError:
-    print("⚠️  YOLOv8 or ViTPose not found. Install with: pip install ultralytics vitpose-pytorch")
-    PREPROCESSING_AVAILABLE = False
+from intensely_pipeline.frame_rate import motion_meta_path, write_motion_fps
+from intensely_pipeline.memory import current_rss, format_bytes, parse_memory, peak_rss, reset_peak
 
 
 # SMPL-H joint mapping
@@ -83,6 +72,30 @@ SMPL_H_BODY_JOINTS = [
 
 assert len(SMPL_H_BODY_JOINTS) == 22, "Must extract exactly 22 body joints"
 
+# Copies of each frame alive during inference (stacked array, device tensor,
+# activations), used to size chunks under --max-memory
+INFERENCE_COPIES = 3
+MIN_CHUNK_FRAMES = 16
+
+
+def chunk_frames(frames: List[np.ndarray], max_memory: Optional[int]) -> int:
+    """
+    Frames per GVHMR inference chunk for a memory budget.
+
+    Args:
+        frames: Cropped frames from preprocess_video()
+        max_memory: Budget in bytes, or None to infer on all frames at once
+
+    Returns:
+        Chunk length (>= MIN_CHUNK_FRAMES, or all frames)
+    """
+    if max_memory is None or not frames:
+        return len(frames)
+
+    per_frame = max(frame.nbytes for frame in frames) * INFERENCE_COPIES
+    available = max_memory - (current_rss() or 0)
+    return max(MIN_CHUNK_FRAMES, min(len(frames), available // per_frame))
+
 
 class VideoToMotionProcessor:
     """Processes videos through GVHMR to extract motion data."""
@@ -93,6 +106,7 @@ class VideoToMotionProcessor:
         model_path: Optional[str] = None,
         yolo_path: str = "models/yolov8x.pt",
         vitpose_path: str = "models/vitpose-h.pth",
+        max_memory: Optional[int] = None,
     ):
         """
         Initialize GVHMR processor.
@@ -102,14 +116,24 @@ class VideoToMotionProcessor:
             model_path: Path to GVHMR checkpoint (uses default if None)
             yolo_path: Path to YOLOv8 weights
             vitpose_path: Path to ViTPose weights
+            max_memory: Host RAM budget in bytes; inference runs in frame chunks that fit
         """
         self.device = device
+        self.max_memory = max_memory
 
-        # Check dependencies
-        if not GVHMR_AVAILABLE:
+        # Check dependencies (GVHMR imports: adjust paths based on actual GVHMR installation)
+        try:
+            from gvhmr.models import GVHMR
+        except ImportError:
             raise ImportError("GVHMR not available. Run on GPU instance with GVHMR installed.")
-        if not PREPROCESSING_AVAILABLE:
-            raise ImportError("YOLOv8 or ViTPose not available. Install preprocessing tools.")
+        try:
+            from ultralytics import YOLO
+            from vitpose import ViTPose
+        except ImportError:
+            raise ImportError(
+                "YOLOv8 or ViTPose not available. "
+                "Install with: pip install ultralytics vitpose-pytorch"
+            )
 
         print(f"🔧 Initializing GVHMR on {device}...")
 
@@ -146,6 +170,8 @@ class VideoToMotionProcessor:
                 - fps: Video frame rate
                 - original_size: (width, height)
         """
+        import cv2
+
         print(f"📹 Preprocessing video: {video_path}")
 
         # Load video
@@ -159,14 +185,15 @@ class VideoToMotionProcessor:
 
         # Track person through video with YOLOv8
         print("  🎯 Detecting and tracking person...")
-        results = self.yolo.track(video_path, persist=True, verbose=False)
+        # stream=True yields one result at a time instead of keeping every decoded frame
+        results = self.yolo.track(video_path, persist=True, verbose=False, stream=True)
 
         frames = []
         bboxes = []
         keypoints_2d = []
 
         # Process each frame
-        for frame_idx, result in enumerate(tqdm(results, desc="  🔍 Processing frames")):
+        for frame_idx, result in enumerate(tqdm(results, total=total_frames, desc="  🔍 Processing frames")):
             frame = result.orig_img
 
             # Get person bounding box (class 0 = person)
@@ -241,24 +268,32 @@ class VideoToMotionProcessor:
         Returns:
             SMPL-H joint positions (T, 22, 3) in meters
         """
+        import torch
+
         frames = preprocessed_data["frames"]
         keypoints_2d = preprocessed_data["keypoints_2d"]
+        chunk = chunk_frames(frames, self.max_memory)
 
-        print(f"🎬 Running GVHMR inference on {len(frames)} frames...")
-
-        # Prepare batch
-        batch = {
-            "frames": torch.from_numpy(np.array(frames)).to(self.device),
-            "keypoints_2d": torch.from_numpy(keypoints_2d).to(self.device),
-        }
-
-        # Run inference
-        with torch.no_grad():
-            output = self.model(batch)
+        if chunk < len(frames):
+            print(f"🎬 Running GVHMR inference on {len(frames)} frames in chunks of {chunk}...")
+        else:
+            print(f"🎬 Running GVHMR inference on {len(frames)} frames...")
+
+        # Only one chunk's stacked frames and tensors are alive at a time
+        chunks = []
+        for start in range(0, len(frames), chunk):
+            batch = {
+                "frames": torch.from_numpy(np.array(frames[start:start + chunk])).to(self.device),
+                "keypoints_2d": torch.from_numpy(keypoints_2d[start:start + chunk]).to(self.device),
+            }
+            with torch.no_grad():
+                output = self.model(batch)
+            chunks.append(output["smpl_joints"].cpu().numpy())
+            del batch, output
 
         # Extract SMPL-H joints
         # GVHMR outputs full 52-joint SMPL-H, we extract the 22 body joints
-        smpl_joints = output["smpl_joints"].cpu().numpy()  # (T, 52, 3)
+        smpl_joints = np.concatenate(chunks)  # (T, 52, 3)
         body_joints = smpl_joints[:, SMPL_H_BODY_JOINTS, :]  # (T, 22, 3)
 
         print(f"  ✅ Extracted motion: {body_joints.shape}")
@@ -287,11 +322,15 @@ class VideoToMotionProcessor:
         Returns:
             Motion data (T, 22, 3)
         """
+        reset_peak()
+
         # Preprocess video
         preprocessed = self.preprocess_video(video_path)
 
         # Run GVHMR
         motion_data = self.run_gvhmr(preprocessed)
+        fps = preprocessed["fps"]
+        del preprocessed
 
         # Save output
         if not preview:
@@ -305,12 +344,15 @@ class VideoToMotionProcessor:
                 # Default: save next to video
                 save_path = str(Path(video_path).with_suffix(".npy"))
 
+            # The video's frame rate, which stages 03-05 resample from
+            write_motion_fps(save_path, fps)
             np.save(save_path, motion_data)
-            print(f"💾 Saved motion data: {save_path}")
+            print(f"💾 Saved motion data: {save_path} (+ {motion_meta_path(save_path).name}, {fps:.2f} fps)")
             print(f"   Shape: {motion_data.shape}")
             print(f"   Size: {os.path.getsize(save_path) / 1024:.1f} KB")
         else:
             print("👁️  Preview mode - not saving")
+        print(f"🧠 Peak RSS: {format_bytes(peak_rss())}")
 
         return motion_data
 
@@ -423,6 +465,12 @@ def main():
         default="models/vitpose-h.pth",
         help="Path to ViTPose weights",
     )
+    parser.add_argument(
+        "--max-memory",
+        type=parse_memory,
+        metavar="SIZE",
+        help="Host RAM budget, e.g. 8G: run inference in frame chunks that fit",
+    )
 
     args = parser.parse_args()
 
@@ -441,6 +489,7 @@ def main():
             model_path=args.model,
             yolo_path=args.yolo,
             vitpose_path=args.vitpose,
+            max_memory=args.max_memory,
         )
     except Exception as e:
         print(f"❌ Failed to initialize processor: {e}")
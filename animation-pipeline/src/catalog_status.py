@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Query the Artifact Catalog
+
+Every stage records what it produced in pipeline.db: one row per
+(slug, artifact kind) with path, hash, size, frame count, camera angle,
+status, duration and the last error. This answers "what's left to do"
+without crawling output directories.
+
+Usage:
+    # Counts per artifact kind and status
+    python src/catalog_status.py
+
+    # Exercises with no finished WebP yet
+    python src/catalog_status.py --missing webp
+
+    # Lottie files built from a projection that has since changed
+    python src/catalog_status.py --stale lottie
+
+    # Everything whose last attempt failed, with the error
+    python src/catalog_status.py --failed
+
+Artifact kinds: prompt, motion, projected, contact_sheet, webp, lottie, video
+"""
+
+import argparse
+
+from intensely_pipeline.catalog import DEFAULT_CATALOG_PATH, Catalog
+
+KINDS = ["prompt", "motion", "projected", "contact_sheet", "webp", "lottie", "video"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the pipeline artifact catalog")
+    parser.add_argument("--missing", choices=KINDS, metavar="KIND",
+                        help="List exercises without a finished artifact of this kind")
+    parser.add_argument("--stale", choices=KINDS, metavar="KIND",
+                        help="List artifacts whose upstream artifact changed since they were built")
+    parser.add_argument("--failed", action="store_true",
+                        help="List artifacts whose last attempt failed")
+    parser.add_argument("--db", type=str, default=str(DEFAULT_CATALOG_PATH),
+                        help="Catalog database (default: pipeline.db)")
+    args = parser.parse_args()
+
+    with Catalog(args.db) as catalog:
+        if args.missing:
+            slugs = catalog.missing(args.missing)
+            for slug in slugs:
+                print(slug)
+            print(f"\n{len(slugs)} of {catalog.exercise_count()} exercises missing {args.missing}")
+            return
+
+        if args.stale:
+            slugs = catalog.stale(args.stale)
+            for slug in slugs:
+                print(slug)
+            print(f"\n{len(slugs)} stale {args.stale} artifacts")
+            return
+
+        if args.failed:
+            rows = catalog.failed()
+            for row in rows:
+                print(f"{row['kind']:10s} {row['slug']:40s} {row['error']}")
+            print(f"\n{len(rows)} failed artifacts")
+            return
+
+        print("=" * 60)
+        print("Artifact Catalog")
+        print("=" * 60)
+        print(f"Database: {args.db}")
+        print(f"Exercises: {catalog.exercise_count()}\n")
+
+        summary = catalog.summary()
+        if not summary:
+            print("❌ Nothing recorded yet. Run 02_prepare_batch.py or a render stage first.")
+            return
+
+        for kind in KINDS:
+            if kind not in summary:
+                continue
+            counts = ", ".join(f"{status}: {n}" for status, n in sorted(summary[kind].items()))
+            print(f"  {kind:10s} {counts}")
+        print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Fused Pipeline - motion_data → WebP + Lottie + manifest in one pass
+
+Alternative to running stages 03 → 04 → 05 → 09 separately. Each motion
+file is loaded once, projected in memory, and the projected array feeds the
+WebP and Lottie renderers directly. Manifest entries are emitted from the
+frame counts and byte sizes known at render time, so nothing is written to
+projected/ and no WebP is decoded to count frames (the count comes from each
+file's header, as libwebp may merge identical frames).
+
+The implementation lives in intensely_pipeline/fused.py; this is the CLI.
+
+Usage:
+    python src/fused_pipeline.py
+
+    # Skip Lottie output
+    python src/fused_pipeline.py --no-lottie
+
+    # Parallel, with CDN URLs in the manifest
+    python src/fused_pipeline.py --jobs 8 --cdn-base https://cdn.intensely.app
+
+Output:
+    output/webp/*.webp, output/lottie/*.json, output/manifest.json
+"""
+
+import argparse
+
+from intensely_pipeline import tracing
+from intensely_pipeline.config import load_config, load_manifest
+from intensely_pipeline.memory import parse_memory
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fused motion_data → WebP + Lottie + manifest pipeline"
+    )
+    parser.add_argument("--limit", type=int, help="Limit number of files to process (for testing)")
+    parser.add_argument("--no-lottie", action="store_true", help="Only render WebP")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Lottie direction change threshold in degrees (default: 10.0)")
+    parser.add_argument("--min-displacement", type=float, default=5.0,
+                        help="Lottie minimum displacement in pixels (default: 5.0)")
+    parser.add_argument("--cdn-base", type=str, help="CDN base URL for manifest entries")
+    parser.add_argument("--output", type=str, default="output/manifest.json",
+                        help="Output manifest path, relative to the pipeline root")
+    parser.add_argument("--pretty", action="store_true", help="Pretty-print manifest JSON")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if inputs are unchanged")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes (default: 1, 0 = all cores)")
+    parser.add_argument("--max-memory", type=parse_memory, metavar="SIZE",
+                        help="RAM budget, e.g. 2G: stream frames and cap workers to fit")
+    parser.add_argument("--trace", type=str, metavar="FILE",
+                        help="Write Chrome trace-event JSON timings to FILE (view in Perfetto)")
+    args = parser.parse_args()
+    tracing.start(args.trace)
+
+    # Imported after argument parsing so --help doesn't load NumPy/Pillow
+    from intensely_pipeline.fused import run
+
+    print("=" * 60)
+    print("Exercise Animation Pipeline - Fused Render")
+    print("=" * 60)
+
+    config = load_config()
+    source_manifest = load_manifest()
+    print(f"✓ Loaded config and manifest ({len(source_manifest['exercises'])} exercises)")
+
+    run(
+        config,
+        source_manifest,
+        limit=args.limit,
+        lottie=not args.no_lottie,
+        threshold=args.threshold,
+        min_displacement=args.min_displacement,
+        cdn_base=args.cdn_base,
+        output=args.output,
+        pretty=args.pretty,
+        force=args.force,
+        jobs=args.jobs,
+        max_memory=args.max_memory,
+    )
+
+
+if __name__ == "__main__":
+    main()
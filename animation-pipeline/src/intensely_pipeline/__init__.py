@@ -0,0 +1,76 @@
+"""
+Intensely animation pipeline as an importable package.
+
+The numbered scripts in src/ are thin command-line wrappers around the
+modules here. Importing the package lets a long-lived process (the driver,
+a notebook, a test) chain stages without paying interpreter start-up and
+NumPy/Pillow import cost for every stage. Names below are resolved lazily.
+
+Example:
+    from intensely_pipeline import load_config, load_manifest, project_motion_sequence
+
+    config = load_config()
+    motion_2d, bbox = project_motion_sequence(motion_3d, 45, config["canvas"]["width"])
+"""
+
+import importlib
+
+# Exported name -> submodule. Submodules are imported on first attribute
+# access (PEP 562), so `import intensely_pipeline.catalog` or a CLI --help
+# does not pay for NumPy and Pillow.
+_EXPORTS = {
+    "PIPELINE_ROOT": "config",
+    "load_config": "config",
+    "load_manifest": "config",
+    "BuildGraph": "build_graph",
+    "atomic_write": "build_graph",
+    "Catalog": "catalog",
+    "run_pool": "parallel",
+    "get_rotation_matrix": "projection",
+    "orthographic_projection": "projection",
+    "perspective_projection": "projection",
+    "camera_settings": "projection",
+    "bounding_box": "projection",
+    "calculate_global_bounding_box": "projection",
+    "normalize_to_canvas": "projection",
+    "project_motion_sequence": "projection",
+    "project_motion_angles": "projection",
+    "project_motion_unit": "projection",
+    "unit_box": "projection",
+    "to_canvas": "projection",
+    "load_projected": "projection",
+    "find_projected": "projection",
+    "project_motion_streamed": "streaming",
+    "load_compact": "compact",
+    "find_loop": "loop",
+    "mirror_motion": "variants",
+    "smooth_motion": "smoothing",
+    "normalize_tempo": "tempo",
+    "save_compact": "compact",
+    "render_contact_sheet": "contact_sheet",
+    "subsample_frames": "frame_rate",
+    "resample_frames": "frame_rate",
+    "draw_stick_figure": "render_webp",
+    "render_frame": "render_webp",
+    "save_as_webp": "render_webp",
+    "detect_keyframes": "render_lottie",
+    "optimize_keyframes_for_animation": "render_lottie",
+    "create_lottie_animation": "render_lottie",
+    "scan_animations": "manifest",
+    "build_manifest": "manifest",
+    "calculate_statistics": "manifest",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
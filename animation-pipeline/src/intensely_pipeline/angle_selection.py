@@ -0,0 +1,162 @@
+"""
+Automatic camera angle selection from the 3D motion.
+
+The movement-pattern mapping in config.json picks one of four views from
+a string, which foreshortens exercises whose main motion happens in another
+plane. This sweeps yaw angles over the clip in one batched projection and
+scores each view:
+
+    spread   how much of the 3D pose and movement survives the projection:
+             projected variance / 3D variance, for the per-frame pose and
+             for each joint's path over time
+    overlap  how often left/right counterpart joints (knees, wrists, ...)
+             land on top of each other, hiding one limb behind the other
+
+    score = spread - OVERLAP_WEIGHT * overlap
+
+Yaw θ and θ + 180° give mirror-image projections with identical scores, so
+the proposal is reported in [0°, 180°). For a left/right symmetric movement
+θ and -θ also look alike, so for confidence views are compared by how far
+they turn from front-on (0-90°). Confidence is how far the best view stands
+above the best clearly different view (at least MIN_SEPARATION away by that
+measure), relative to the whole score range: near 0 when another view is
+just as good, near 1 when the best view is unambiguous. Picks under the
+threshold are flagged for QA instead of being applied.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .projection import projection_matrix
+
+DEFAULT_NUM_ANGLES = 72
+DEFAULT_THRESHOLD = 0.25
+
+# Frames analysed per clip: long clips are strided, since the score is a
+# whole-clip average and 72 angles × T × J points add up
+MAX_FRAMES = 240
+
+# Relative weight of pose spread vs movement spread, and of limb overlap
+POSE_WEIGHT = 0.4
+OVERLAP_WEIGHT = 0.5
+
+# Counterpart joints closer than this fraction of body height overlap
+OVERLAP_DISTANCE = 0.05
+
+# Views closer than this are "the same view" for confidence
+MIN_SEPARATION = 30.0
+
+
+def sweep_angles(num_angles: int = DEFAULT_NUM_ANGLES) -> np.ndarray:
+    """Yaw angles in degrees, evenly spaced over the full circle."""
+    return np.arange(num_angles) * (360.0 / num_angles)
+
+
+def counterpart_pairs(config: Dict) -> List[tuple]:
+    """(left, right) joint index pairs from the skeleton's joint names."""
+    joints = {name: int(idx) for idx, name in config['smpl_h_skeleton']['joints'].items()}
+    return [
+        (idx, joints['right_' + name[len('left_'):]])
+        for name, idx in sorted(joints.items())
+        if name.startswith('left_') and 'right_' + name[len('left_'):] in joints
+    ]
+
+
+def score_angles(motion_3d: np.ndarray, angles: np.ndarray, pairs: List[tuple]) -> Dict[str, np.ndarray]:
+    """
+    Score every yaw angle for one clip in a single batched projection.
+
+    Args:
+        motion_3d: (T, J, 3) motion
+        angles: (A,) yaw angles in degrees
+        pairs: (left, right) joint index pairs for the overlap term
+
+    Returns:
+        Dictionary of (A,) arrays: score, spread and overlap
+    """
+    stride = max(1, int(np.ceil(len(motion_3d) / MAX_FRAMES)))
+    motion = motion_3d[::stride].astype(np.float64)
+
+    R = np.stack([projection_matrix(angle) for angle in angles])  # (A, 2, 3)
+    points = motion[np.newaxis] @ R.transpose(0, 2, 1)[:, np.newaxis]  # (A, T, J, 2)
+
+    eps = 1e-12
+    # Pose spread: joints around each frame's centroid
+    pose_3d = motion.var(axis=1).sum()
+    pose_2d = points.var(axis=2).sum(axis=(1, 2))
+    pose_spread = pose_2d / (pose_3d + eps)
+
+    # Movement spread: each joint around its own mean position
+    move_3d = motion.var(axis=0).sum()
+    move_2d = points.var(axis=1).sum(axis=(1, 2))
+    if move_3d > eps:
+        spread = POSE_WEIGHT * pose_spread + (1 - POSE_WEIGHT) * move_2d / move_3d
+    else:
+        # Static hold: only the pose can be judged
+        spread = pose_spread
+
+    overlap = np.zeros(len(angles))
+    if pairs:
+        left, right = np.array(pairs).T
+        height = np.ptp(motion[..., 1]) or 1.0
+        distance = np.linalg.norm(points[:, :, left] - points[:, :, right], axis=-1)  # (A, T, P)
+        overlap = (distance < OVERLAP_DISTANCE * height).mean(axis=(1, 2))
+
+    return {'score': spread - OVERLAP_WEIGHT * overlap, 'spread': spread, 'overlap': overlap}
+
+
+def _turn(angle):
+    """How far a view turns from front-on, 0° (front) to 90° (side)."""
+    angle = np.asarray(angle, dtype=float) % 180.0
+    return np.minimum(angle, 180.0 - angle)
+
+
+def view_distance(a, b):
+    """Angular distance between views, treating θ, -θ and θ + 180° as alike."""
+    return np.abs(_turn(a) - _turn(b))
+
+
+def propose_angle(
+    motion_3d: np.ndarray,
+    config: Dict,
+    current_angle: Optional[float] = None,
+    num_angles: int = DEFAULT_NUM_ANGLES,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Dict:
+    """
+    Propose a camera angle for one clip.
+
+    Args:
+        motion_3d: (T, J, 3) motion
+        config: Pipeline configuration (skeleton joint names)
+        current_angle: The exercise's current angle, to score for comparison
+        num_angles: Yaw angles in the sweep
+        threshold: Confidence below which the pick is flagged for QA
+
+    Returns:
+        Dictionary with angle, confidence, score, current_score (if
+        current_angle given) and flagged
+    """
+    angles = sweep_angles(num_angles)
+    scores = score_angles(motion_3d, angles, counterpart_pairs(config))['score']
+
+    # Mirror views score the same: report the one in [0, 180)
+    half = angles < 180.0
+    best = int(np.flatnonzero(half)[np.argmax(scores[half])])
+    best_angle = angles[best]
+
+    far = view_distance(angles, best_angle) >= MIN_SEPARATION
+    score_range = scores.max() - scores.min()
+    confidence = float((scores[best] - scores[far].max()) / score_range) if score_range > 0 else 0.0
+
+    proposal = {
+        'angle': int(round(best_angle)) % 180,
+        'confidence': round(confidence, 3),
+        'score': round(float(scores[best]), 4),
+        'flagged': confidence < threshold,
+    }
+    if current_angle is not None:
+        nearest = int(np.argmin(view_distance(angles, current_angle)))
+        proposal['current_score'] = round(float(scores[nearest]), 4)
+    return proposal
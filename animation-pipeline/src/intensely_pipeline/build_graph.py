@@ -0,0 +1,254 @@
+"""
+Content-hash build graph for the render stages (03-09).
+
+Records, per stage and per exercise slug, the hashes of every input file and
+of the config subtree that stage consumes. A (stage, slug) pair is rebuilt
+only when one of those hashes changes or a recorded output has gone missing,
+so editing a camera angle, a colour or a motion file invalidates exactly the
+artifacts that depend on it.
+
+State lives in .build_graph.json at the pipeline root. Outputs are written
+through atomic_write() so a killed run never leaves a truncated file behind
+that a later run would mistake for a finished artifact.
+
+Several processes (or machines sharing the volume) may save the same graph:
+save() re-reads it under a lock file and applies only this process's
+changes, so concurrent shards don't overwrite each other's records.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .config import PIPELINE_ROOT
+
+GRAPH_VERSION = 1
+DEFAULT_GRAPH_PATH = PIPELINE_ROOT / ".build_graph.json"
+
+# Bytes read per chunk when hashing input files
+HASH_CHUNK_SIZE = 1 << 20
+
+# Seconds after which a leftover graph lock is assumed abandoned
+GRAPH_LOCK_TIMEOUT = 30.0
+
+# mkstemp creates files 0600; atomic outputs get the usual umask-derived mode
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def hash_file(path) -> str:
+    """
+    SHA-256 of a file's contents.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_value(value) -> str:
+    """
+    SHA-256 of any JSON-serializable value (key order independent).
+
+    Args:
+        value: Config subtree, CLI option dict, scalar, ...
+
+    Returns:
+        Hex digest
+    """
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def config_subset(config: Dict, keys: Iterable[str]) -> Dict:
+    """
+    Extract the top-level config sections a stage depends on.
+
+    Args:
+        config: Full pipeline configuration
+        keys: Section names (e.g. ["canvas", "rendering"])
+
+    Returns:
+        Dictionary with only those sections
+    """
+    return {key: config.get(key) for key in keys}
+
+
+@contextmanager
+def atomic_write(path, mode: str = "wb"):
+    """
+    Write a file atomically.
+
+    Yields a file object for a temporary file in the destination directory,
+    then renames it over the destination once the block completes. On error
+    the temporary file is removed and the destination is left untouched.
+
+    Args:
+        path: Final output path
+        mode: File mode for the temporary file ("wb" or "w")
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.chmod(tmp_path, 0o666 & ~_UMASK)
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+@contextmanager
+def file_lock(path, timeout: float = GRAPH_LOCK_TIMEOUT):
+    """
+    Hold an exclusive lock file next to `path` for the duration of a block.
+
+    The lock is a plain O_EXCL-created file, which works across machines on
+    a shared filesystem. A lock older than `timeout` is treated as left
+    behind by a killed process and removed.
+
+    Args:
+        path: File being protected (the lock is "<path>.lock")
+        timeout: Seconds before an existing lock is considered abandoned
+    """
+    lock_path = Path(f"{path}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > timeout:
+                    lock_path.unlink(missing_ok=True)
+                    continue
+            except FileNotFoundError:
+                continue
+            time.sleep(0.05)
+
+    os.close(fd)
+    try:
+        yield
+    finally:
+        lock_path.unlink(missing_ok=True)
+
+
+class BuildGraph:
+    """Per-(stage, slug) record of input hashes and produced outputs."""
+
+    def __init__(self, path=DEFAULT_GRAPH_PATH):
+        self.path = Path(path)
+        self.stages = self._read()
+
+        # (stage, slug) -> entry recorded (or None if invalidated) since the last save
+        self._changes: Dict[tuple, Optional[Dict]] = {}
+
+    def _read(self) -> Dict[str, Dict[str, Dict]]:
+        """Load the stages table from disk (empty if missing or unreadable)."""
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get("version") == GRAPH_VERSION:
+                return data.get("stages", {})
+        except (json.JSONDecodeError, OSError):
+            print(f"⚠ Warning: Unreadable build graph {self.path.name}, rebuilding from scratch")
+        return {}
+
+    def is_stale(self, stage: str, slug: str, inputs: Dict[str, str], outputs: List) -> bool:
+        """
+        Check whether a (stage, slug) pair needs rebuilding.
+
+        Args:
+            stage: Stage key (e.g. "03")
+            slug: Exercise slug
+            inputs: Mapping of input name -> hash
+            outputs: Output paths the stage produces
+
+        Returns:
+            True if never built, any input hash changed, or an output is missing
+        """
+        entry = self.stages.get(stage, {}).get(slug)
+        if entry is None:
+            return True
+        if entry.get("inputs") != inputs:
+            return True
+        return not all(Path(p).exists() for p in outputs)
+
+    def record(
+        self,
+        stage: str,
+        slug: str,
+        inputs: Dict[str, str],
+        outputs: List,
+        meta: Optional[Dict] = None,
+    ) -> None:
+        """
+        Record a successful build of a (stage, slug) pair.
+
+        Args:
+            stage: Stage key
+            slug: Exercise slug
+            inputs: Mapping of input name -> hash used for the build
+            outputs: Output paths written
+            meta: Optional extra facts about the outputs (e.g. frame count)
+        """
+        entry = {
+            "inputs": inputs,
+            "outputs": [str(p) for p in outputs],
+        }
+        if meta:
+            entry["meta"] = meta
+        self.stages.setdefault(stage, {})[slug] = entry
+        self._changes[(stage, slug)] = entry
+
+    def get_meta(self, stage: str, slug: str) -> Dict:
+        """Return recorded metadata for a (stage, slug) pair (empty if none)."""
+        return self.stages.get(stage, {}).get(slug, {}).get("meta", {})
+
+    def invalidate(self, stage: str, slug: str) -> None:
+        """Forget a (stage, slug) pair so the next run rebuilds it."""
+        self.stages.get(stage, {}).pop(slug, None)
+        self._changes[(stage, slug)] = None
+
+    def save(self) -> None:
+        """
+        Persist the graph atomically, merging with concurrent writers.
+
+        Re-reads the file under a lock and applies only the entries recorded
+        or invalidated through this instance, then picks up everyone else's.
+        """
+        with file_lock(self.path):
+            stages = self._read()
+            for (stage, slug), entry in self._changes.items():
+                if entry is None:
+                    stages.get(stage, {}).pop(slug, None)
+                else:
+                    stages.setdefault(stage, {})[slug] = entry
+
+            with atomic_write(self.path, "w") as f:
+                json.dump({"version": GRAPH_VERSION, "stages": stages}, f, indent=2, sort_keys=True)
+
+        self.stages = stages
+        self._changes.clear()
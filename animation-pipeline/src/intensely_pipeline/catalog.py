@@ -0,0 +1,346 @@
+"""
+SQLite catalog of exercises, artifacts and resumable script state.
+
+One row per (slug, artifact kind) records where the artifact lives, its
+content hash and size, frame count, camera angle, status, how long it took
+and the last error. Stages write rows as they finish; later stages and the
+QA/CSV/manifest scripts read them instead of globbing output directories and
+re-opening files. "What's missing / stale / failed" are indexed queries:
+
+    missing   exercises with no finished artifact of a kind
+    stale     artifacts built from an upstream artifact that has since changed
+    failed    artifacts whose last attempt raised
+
+Artifact kinds and the kind each is built from:
+
+    prompt    prompts/<slug>.txt        (02)
+    motion    motion_data/<slug>.npy    (HY-Motion / GVHMR; hashed by 03)
+    projected projected/<slug>.npy|.npq (03, from motion)
+    contact_sheet
+              output/contact_sheets/<slug>.png (03 --contact-sheets, from motion)
+    webp      output/webp/<slug>.webp   (04, from projected)
+    lottie    output/lottie/<slug>.json (05, from projected)
+    video     videos/<slug>.mp4         (requested by regen_helper)
+
+The state table replaces the per-script JSON checkpoint files.
+
+The build graph (.build_graph.json) stays the source of truth for "is this
+(stage, slug) up to date"; the catalog is the queryable record of results.
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .config import PIPELINE_ROOT
+
+DEFAULT_CATALOG_PATH = PIPELINE_ROOT / "pipeline.db"
+SCHEMA_VERSION = 1
+
+# Artifact kind -> kind it is built from
+UPSTREAM = {
+    "motion": "prompt",
+    "projected": "motion",
+    "contact_sheet": "motion",
+    "webp": "projected",
+    "lottie": "projected",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS exercises (
+    slug             TEXT PRIMARY KEY,
+    name             TEXT,
+    movement_pattern TEXT,
+    camera_angle     INTEGER,
+    word_count       INTEGER,
+    enriched         INTEGER,
+    updated_at       TEXT
+);
+
+CREATE TABLE IF NOT EXISTS artifacts (
+    slug         TEXT NOT NULL,
+    kind         TEXT NOT NULL,
+    path         TEXT,
+    hash         TEXT,
+    size_bytes   INTEGER,
+    frame_count  INTEGER,
+    camera_angle INTEGER,
+    status       TEXT NOT NULL,
+    source_hash  TEXT,
+    duration_ms  REAL,
+    error        TEXT,
+    updated_at   TEXT,
+    PRIMARY KEY (slug, kind)
+);
+
+CREATE INDEX IF NOT EXISTS artifacts_kind_status ON artifacts (kind, status);
+CREATE INDEX IF NOT EXISTS artifacts_status ON artifacts (status);
+
+CREATE TABLE IF NOT EXISTS state (
+    key        TEXT PRIMARY KEY,
+    value      TEXT NOT NULL,
+    updated_at TEXT
+);
+"""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def catalog_path(path) -> str:
+    """Store paths relative to the pipeline root when inside it."""
+    try:
+        return str(Path(path).resolve().relative_to(PIPELINE_ROOT.resolve()))
+    except ValueError:
+        return str(path)
+
+
+def resolve_path(path: str) -> Path:
+    """Absolute path for a path stored in the catalog."""
+    path = Path(path)
+    return path if path.is_absolute() else PIPELINE_ROOT / path
+
+
+class Catalog:
+    """Embedded SQLite store for exercises, artifacts and script state."""
+
+    def __init__(self, path=DEFAULT_CATALOG_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Several shards or a watcher may write at once: wait for the lock
+        self.conn = sqlite3.connect(self.path, timeout=30.0)
+        self.conn.row_factory = sqlite3.Row
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # ---- exercises -------------------------------------------------------
+
+    def sync_exercises(self, exercises: Dict[str, Dict]) -> int:
+        """
+        Upsert exercise metadata from the source manifest.
+
+        Args:
+            exercises: Source manifest "exercises" mapping (slug -> info)
+
+        Returns:
+            Number of exercises written
+        """
+        now = _now()
+        rows = [
+            (
+                slug,
+                info.get("name", slug.replace("-", " ").title()),
+                info.get("movement_pattern", "unknown"),
+                info.get("camera_angle"),
+                info.get("word_count"),
+                int(bool(info.get("enriched", False))),
+                now,
+            )
+            for slug, info in exercises.items()
+        ]
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO exercises (slug, name, movement_pattern, camera_angle, word_count, enriched, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (slug) DO UPDATE SET
+                    name = excluded.name,
+                    movement_pattern = excluded.movement_pattern,
+                    camera_angle = excluded.camera_angle,
+                    word_count = excluded.word_count,
+                    enriched = excluded.enriched,
+                    updated_at = excluded.updated_at
+                """,
+                rows,
+            )
+        return len(rows)
+
+    # ---- artifacts -------------------------------------------------------
+
+    def record(
+        self,
+        slug: str,
+        kind: str,
+        path=None,
+        status: str = "done",
+        hash: Optional[str] = None,
+        size_bytes: Optional[int] = None,
+        frame_count: Optional[int] = None,
+        camera_angle: Optional[int] = None,
+        source_hash: Optional[str] = None,
+        duration_ms: Optional[float] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Insert or replace the row for (slug, kind).
+
+        Fields left as None keep their previous value, except error, which is
+        cleared by a successful record. size_bytes is read from the file when
+        not given.
+        """
+        if path is not None and size_bytes is None and status == "done":
+            try:
+                size_bytes = os.path.getsize(path)
+            except OSError:
+                pass
+
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO artifacts
+                    (slug, kind, path, hash, size_bytes, frame_count, camera_angle,
+                     status, source_hash, duration_ms, error, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (slug, kind) DO UPDATE SET
+                    path = COALESCE(excluded.path, path),
+                    hash = COALESCE(excluded.hash, hash),
+                    size_bytes = COALESCE(excluded.size_bytes, size_bytes),
+                    frame_count = COALESCE(excluded.frame_count, frame_count),
+                    camera_angle = COALESCE(excluded.camera_angle, camera_angle),
+                    status = excluded.status,
+                    source_hash = COALESCE(excluded.source_hash, source_hash),
+                    duration_ms = COALESCE(excluded.duration_ms, duration_ms),
+                    error = excluded.error,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    slug, kind, catalog_path(path) if path is not None else None, hash, size_bytes,
+                    frame_count, camera_angle, status, source_hash, duration_ms, error, _now(),
+                ),
+            )
+
+    def mark_failed(self, slug: str, kind: str, error: Optional[str], duration_ms: Optional[float] = None) -> None:
+        """Record a failed attempt, keeping the last good path/hash for reference."""
+        self.record(slug, kind, status="failed", duration_ms=duration_ms, error=error or "unknown error")
+
+    def get(self, slug: str, kind: str) -> Optional[sqlite3.Row]:
+        """Row for (slug, kind), or None."""
+        return self.conn.execute(
+            "SELECT * FROM artifacts WHERE slug = ? AND kind = ?", (slug, kind)
+        ).fetchone()
+
+    def artifacts(self, kind: str, status: Optional[str] = "done") -> List[sqlite3.Row]:
+        """All rows of a kind (with the given status; None = any), by slug."""
+        if status is None:
+            return self.conn.execute(
+                "SELECT * FROM artifacts WHERE kind = ? ORDER BY slug", (kind,)
+            ).fetchall()
+        return self.conn.execute(
+            "SELECT * FROM artifacts WHERE kind = ? AND status = ? ORDER BY slug", (kind, status)
+        ).fetchall()
+
+    def has(self, kind: str) -> bool:
+        """Whether any finished artifact of this kind has been recorded."""
+        return self.conn.execute(
+            "SELECT 1 FROM artifacts WHERE kind = ? AND status = 'done' LIMIT 1", (kind,)
+        ).fetchone() is not None
+
+    def backfill(self, kind: str, paths: Iterable[Path]) -> int:
+        """
+        Record existing files rendered before the catalog existed.
+
+        Only slugs with no row for the kind are added (path and size only).
+
+        Returns:
+            Number of rows added
+        """
+        added = 0
+        for path in paths:
+            if self.get(Path(path).stem, kind) is None:
+                self.record(Path(path).stem, kind, path=path)
+                added += 1
+        return added
+
+    # ---- queries ---------------------------------------------------------
+
+    def missing(self, kind: str) -> List[str]:
+        """Exercises without a finished artifact of this kind."""
+        rows = self.conn.execute(
+            """
+            SELECT e.slug FROM exercises e
+            LEFT JOIN artifacts a ON a.slug = e.slug AND a.kind = ? AND a.status = 'done'
+            WHERE a.slug IS NULL
+            ORDER BY e.slug
+            """,
+            (kind,),
+        ).fetchall()
+        return [row["slug"] for row in rows]
+
+    def stale(self, kind: str) -> List[str]:
+        """Finished artifacts whose upstream artifact's hash has changed since they were built."""
+        upstream = UPSTREAM.get(kind)
+        if upstream is None:
+            return []
+
+        rows = self.conn.execute(
+            """
+            SELECT a.slug FROM artifacts a
+            JOIN artifacts u ON u.slug = a.slug AND u.kind = ?
+            WHERE a.kind = ? AND a.status = 'done'
+              AND a.source_hash IS NOT NULL AND u.hash IS NOT NULL
+              AND a.source_hash != u.hash
+            ORDER BY a.slug
+            """,
+            (upstream, kind),
+        ).fetchall()
+        return [row["slug"] for row in rows]
+
+    def failed(self, kind: Optional[str] = None) -> List[sqlite3.Row]:
+        """Rows whose last attempt failed (optionally of one kind)."""
+        if kind is None:
+            return self.conn.execute(
+                "SELECT * FROM artifacts WHERE status = 'failed' ORDER BY kind, slug"
+            ).fetchall()
+        return self.conn.execute(
+            "SELECT * FROM artifacts WHERE kind = ? AND status = 'failed' ORDER BY slug", (kind,)
+        ).fetchall()
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Kind -> status -> count."""
+        summary: Dict[str, Dict[str, int]] = {}
+        for row in self.conn.execute(
+            "SELECT kind, status, COUNT(*) AS n FROM artifacts GROUP BY kind, status"
+        ):
+            summary.setdefault(row["kind"], {})[row["status"]] = row["n"]
+        return summary
+
+    def exercise_count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM exercises").fetchone()[0]
+
+    # ---- script state ----------------------------------------------------
+
+    def get_state(self, key: str, default=None):
+        """Load a JSON value saved with set_state()."""
+        row = self.conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return json.loads(row["value"]) if row else default
+
+    def set_state(self, key: str, value) -> None:
+        """Save a JSON-serialisable value (e.g. a resumable checkpoint)."""
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO state (key, value, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+                """,
+                (key, json.dumps(value), _now()),
+            )
+
+    def delete_state(self, key: str) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM state WHERE key = ?", (key,))
@@ -0,0 +1,185 @@
+"""
+Compact on-disk format for projected motion (projected/<slug>.npq).
+
+Unit-box coordinates (stage 03) span about ±0.5, and a float64 .npy spends
+16 bytes per joint per frame on them. With "projection.storage" set to
+"compact", stage 03 writes .npq files instead:
+
+    quantize   fixed-point int16, steps_per_unit steps per unit-box unit
+               (default 8192: ≈1/29 px on the 400 px canvas with 15% padding,
+               max error half a step)
+    delta      each joint coordinate's track is stored as frame-to-frame
+               differences (int16, wrapping), so smooth motion becomes
+               runs of small numbers
+    shuffle    low and high bytes of the deltas in separate planes
+    compress   zlib (fast to decode) or lzma (smaller)
+
+Layout: a fixed header (magic, version, codec, ndim, step, shape) followed
+by the compressed payload. load_compact() returns float32.
+
+The header is read without decompressing the payload, which is how
+scheduling (frame counts) and memory estimates treat .npq like .npy.
+"""
+
+import lzma
+import math
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+COMPACT_SUFFIX = ".npq"
+
+MAGIC = b"IPQ1"
+VERSION = 1
+CODECS = {"none": 0, "zlib": 1, "lzma": 2}
+
+DEFAULT_CODEC = "zlib"
+DEFAULT_STEPS_PER_UNIT = 8192
+
+# magic, version, codec, ndim, pad, step
+_HEADER = struct.Struct("<4sBBBxd")
+
+_INT16_MAX = np.iinfo(np.int16).max
+
+
+def _compress(payload: bytes, codec: str) -> bytes:
+    if codec == "zlib":
+        return zlib.compress(payload, 6)
+    if codec == "lzma":
+        return lzma.compress(payload, preset=6)
+    return payload
+
+
+def _decompress(payload: bytes, codec: str) -> bytes:
+    if codec == "zlib":
+        return zlib.decompress(payload)
+    if codec == "lzma":
+        return lzma.decompress(payload)
+    return payload
+
+
+def encode(array: np.ndarray, steps_per_unit: int = DEFAULT_STEPS_PER_UNIT, codec: str = DEFAULT_CODEC) -> bytes:
+    """
+    Encode a (T, ...) coordinate array in the compact format.
+
+    Args:
+        array: (T, ...) array, frames first
+        steps_per_unit: Fixed-point resolution (steps per coordinate unit)
+        codec: "zlib", "lzma" or "none"
+
+    Returns:
+        Encoded bytes (header + payload)
+
+    Raises:
+        ValueError: If the codec is unknown or values don't fit int16 at this resolution
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec {codec!r} (expected one of {', '.join(CODECS)})")
+
+    quantized = np.rint(np.asarray(array, dtype=np.float64) * steps_per_unit)
+    if quantized.size and np.abs(quantized).max() > _INT16_MAX:
+        raise ValueError(f"Values exceed the int16 range at {steps_per_unit} steps per unit")
+
+    # Frames last, so each joint coordinate's track is contiguous
+    tracks = np.moveaxis(quantized.astype(np.int16), 0, -1)
+    deltas = np.diff(tracks, axis=-1, prepend=np.int16(0))  # int16, wraps
+
+    # Byte planes: low bytes, then high bytes
+    planes = np.ascontiguousarray(deltas).view(np.uint8).reshape(-1, 2).T
+
+    header = _HEADER.pack(MAGIC, VERSION, CODECS[codec], array.ndim, 1.0 / steps_per_unit)
+    shape = struct.pack(f"<{array.ndim}I", *array.shape)
+    return header + shape + _compress(planes.tobytes(), codec)
+
+
+def _parse_header(data: bytes) -> Dict:
+    try:
+        magic, version, codec_id, ndim, step = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a compact projection file")
+        shape = struct.unpack_from(f"<{ndim}I", data, _HEADER.size)
+    except struct.error:
+        raise ValueError("Truncated compact projection file") from None
+    codec = {value: name for name, value in CODECS.items()}[codec_id]
+    return {
+        "shape": tuple(shape),
+        "step": step,
+        "codec": codec,
+        "offset": _HEADER.size + 4 * ndim,
+    }
+
+
+def decode(data: bytes) -> np.ndarray:
+    """
+    Decode bytes produced by encode().
+
+    Args:
+        data: Encoded bytes
+
+    Returns:
+        float32 array of the original shape
+    """
+    header = _parse_header(data)
+    shape = header["shape"]
+    planes = np.frombuffer(_decompress(data[header["offset"]:], header["codec"]), dtype=np.uint8)
+    deltas = np.ascontiguousarray(planes.reshape(2, -1).T).view(np.int16)
+    deltas = deltas.reshape(shape[1:] + shape[:1])
+
+    tracks = np.cumsum(deltas, axis=-1, dtype=np.int16)  # wraps back exactly
+    values = np.moveaxis(tracks, -1, 0).astype(np.float32)
+    values *= np.float32(header["step"])
+    return np.ascontiguousarray(values)
+
+
+def read_header(path) -> Dict:
+    """
+    Read a compact file's shape, step and codec without decoding it.
+
+    Args:
+        path: Path to a .npq file
+
+    Returns:
+        Dictionary with shape, step, codec and payload offset
+    """
+    with open(path, "rb") as f:
+        data = f.read(_HEADER.size + 4 * 8)
+    return _parse_header(data)
+
+
+def save_compact(f, array: np.ndarray, steps_per_unit: int = DEFAULT_STEPS_PER_UNIT,
+                 codec: str = DEFAULT_CODEC) -> int:
+    """
+    Write an array in the compact format.
+
+    Args:
+        f: Binary file object (e.g. from atomic_write)
+        array: (T, ...) array, frames first
+        steps_per_unit: Fixed-point resolution (steps per coordinate unit)
+        codec: "zlib", "lzma" or "none"
+
+    Returns:
+        Bytes written
+    """
+    return f.write(encode(array, steps_per_unit, codec))
+
+
+def load_compact(path) -> np.ndarray:
+    """
+    Load a .npq file.
+
+    Args:
+        path: Path to a .npq file
+
+    Returns:
+        float32 array
+    """
+    return decode(Path(path).read_bytes())
+
+
+def npy_equivalent_size(path) -> int:
+    """Size in bytes of the same array as a float64 .npy (for memory estimates)."""
+    shape = read_header(path)["shape"]
+    return 8 * math.prod(shape)
@@ -0,0 +1,70 @@
+"""
+Pipeline configuration and source manifest loading.
+
+Stages take the parsed dictionaries as arguments, so a driver can load them
+once and chain several stages in one process.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+# animation-pipeline/ (this file is src/intensely_pipeline/config.py)
+PIPELINE_ROOT = Path(__file__).parent.parent.parent
+
+# Stages the driver can chain, in pipeline order
+STAGES = ["03", "04", "05", "09"]
+
+
+def load_config(config_path: Optional[Path] = None) -> Dict:
+    """
+    Load pipeline configuration.
+
+    Args:
+        config_path: Path to config.json (default: pipeline root)
+
+    Returns:
+        Parsed config dictionary
+    """
+    config_path = Path(config_path) if config_path else PIPELINE_ROOT / "config.json"
+    with open(config_path) as f:
+        return json.load(f)
+
+
+def load_manifest(manifest_path: Optional[Path] = None) -> Dict:
+    """
+    Load the source manifest (step 02 output) with camera angles.
+
+    Args:
+        manifest_path: Path to manifest.json (default: pipeline root)
+
+    Returns:
+        Parsed manifest dictionary
+
+    Raises:
+        FileNotFoundError: If the manifest hasn't been generated yet
+    """
+    manifest_path = Path(manifest_path) if manifest_path else PIPELINE_ROOT / "manifest.json"
+    if not manifest_path.exists():
+        raise FileNotFoundError(
+            f"{manifest_path} not found. Run 02_prepare_batch.py first."
+        )
+
+    with open(manifest_path) as f:
+        return json.load(f)
+
+
+def save_manifest(manifest: Dict, manifest_path: Optional[Path] = None) -> None:
+    """
+    Write the source manifest atomically (a concurrent reader never sees half a file).
+
+    Args:
+        manifest: Manifest dictionary
+        manifest_path: Path to manifest.json (default: pipeline root)
+    """
+    manifest_path = Path(manifest_path) if manifest_path else PIPELINE_ROOT / "manifest.json"
+    tmp_path = manifest_path.with_name(f".{manifest_path.name}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
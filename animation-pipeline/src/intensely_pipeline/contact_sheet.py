@@ -0,0 +1,99 @@
+"""
+Per-exercise camera angle contact sheets (stage 03 --contact-sheets).
+
+One PNG per exercise: a row per candidate angle, a column per sampled
+frame, with the exercise's current angle marked. Reviewers pick the view
+that reads best and store it with set_camera_angle.py instead of waiting
+for another render/QA round per candidate.
+
+Candidate angles and layout come from the "contact_sheet" config section:
+
+    "contact_sheet": {"angles": [0, 45, 90, 135], "frames": 4, "thumb_size": 120}
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from .render_webp import render_frame
+
+DEFAULT_ANGLES = [0, 45, 90, 135]
+DEFAULT_FRAMES = 4
+DEFAULT_THUMB_SIZE = 120
+
+ANGLE_NAMES = {0: 'front', 45: '3/4 front', 90: 'side', 135: '3/4 back'}
+
+LABEL_WIDTH = 90
+BACKGROUND = (255, 255, 255, 255)
+CELL_BACKGROUND = (243, 244, 246, 255)
+CURRENT_OUTLINE = (59, 130, 246, 255)
+TEXT_COLOR = (55, 65, 81, 255)
+
+
+def sheet_settings(config: Dict) -> Dict:
+    """Contact sheet settings from config, with defaults filled in."""
+    settings = config.get('contact_sheet', {})
+    return {
+        'angles': list(settings.get('angles', DEFAULT_ANGLES)),
+        'frames': settings.get('frames', DEFAULT_FRAMES),
+        'thumb_size': settings.get('thumb_size', DEFAULT_THUMB_SIZE),
+    }
+
+
+def candidate_angles(config: Dict, current_angle: int) -> List[int]:
+    """Configured candidate angles, plus the exercise's current angle if it isn't one of them."""
+    angles = sheet_settings(config)['angles']
+    return angles if current_angle in angles else sorted(angles + [current_angle])
+
+
+def render_contact_sheet(
+    motion_by_angle: np.ndarray,
+    camera_angles: Sequence[int],
+    canvas_size: int,
+    config: Dict,
+    current_angle: Optional[int] = None,
+) -> Image.Image:
+    """
+    Draw sampled frames of every candidate angle on one sheet.
+
+    Args:
+        motion_by_angle: (A, T, J, 2) projections from project_motion_angles()
+        camera_angles: The A camera angles, in the same order
+        canvas_size: Canvas size the projections were normalized to
+        config: Pipeline configuration (rendering style and sheet layout)
+        current_angle: Angle to outline as the exercise's current pick
+
+    Returns:
+        RGBA PIL Image
+    """
+    settings = sheet_settings(config)
+    thumb = settings['thumb_size']
+    num_frames = motion_by_angle.shape[1]
+    frame_indices = np.linspace(0, num_frames - 1, min(settings['frames'], num_frames), dtype=int)
+
+    gap = 4
+    width = LABEL_WIDTH + len(frame_indices) * (thumb + gap) + gap
+    height = len(camera_angles) * (thumb + gap) + gap
+    sheet = Image.new('RGBA', (width, height), BACKGROUND)
+    draw = ImageDraw.Draw(sheet)
+
+    for row, angle in enumerate(camera_angles):
+        top = gap + row * (thumb + gap)
+        label = f"{angle}°\n{ANGLE_NAMES.get(angle, '')}"
+        if angle == current_angle:
+            label += "\n(current)"
+        draw.multiline_text((gap * 2, top + thumb // 3), label, fill=TEXT_COLOR)
+
+        for col, frame_idx in enumerate(frame_indices):
+            left = LABEL_WIDTH + gap + col * (thumb + gap)
+            cell = Image.new('RGBA', (canvas_size, canvas_size), CELL_BACKGROUND)
+            cell.alpha_composite(render_frame(motion_by_angle[row, frame_idx], canvas_size, config))
+            sheet.paste(cell.resize((thumb, thumb), Image.LANCZOS), (left, top))
+
+        if angle == current_angle:
+            right = LABEL_WIDTH + len(frame_indices) * (thumb + gap)
+            draw.rectangle((LABEL_WIDTH + gap - 2, top - 2, right + 1, top + thumb + 1),
+                           outline=CURRENT_OUTLINE, width=2)
+
+    return sheet
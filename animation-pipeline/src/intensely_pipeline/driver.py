@@ -0,0 +1,139 @@
+"""
+Run several pipeline stages in one warm process.
+
+Config and the source manifest are loaded once and a single build graph and
+artifact catalog are shared, so stage N+1 sees stage N's records without a
+save/load round trip.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+from . import fused, manifest, projection, render_lottie, render_webp
+from .build_graph import BuildGraph
+from .catalog import Catalog
+from .config import PIPELINE_ROOT, STAGES
+
+
+def run_stages(
+    config: Dict,
+    source_manifest: Dict,
+    stages: List[str],
+    limit: Optional[int] = None,
+    force: bool = False,
+    jobs: int = 1,
+    cdn_base: Optional[str] = None,
+    include_lottie: bool = False,
+    pretty: bool = False,
+    shard: Optional[Tuple[int, int]] = None,
+    claim: bool = False,
+    max_memory: Optional[int] = None,
+) -> Dict[str, float]:
+    """
+    Run the given stages in pipeline order.
+
+    Args:
+        config: Pipeline configuration
+        source_manifest: Parsed source manifest from step 02
+        stages: Stage numbers to run (subset of STAGES)
+        limit: Only process the first N files in each stage
+        force: Rebuild even if inputs are unchanged
+        jobs: Worker processes per stage (0 = all cores)
+        cdn_base: CDN base URL for manifest entries (stage 09)
+        include_lottie: Include Lottie animations in the manifest (stage 09)
+        pretty: Pretty-print manifest JSON (stage 09)
+        shard: (index, count) - stages 03-05 only process slugs in this shard
+        claim: Stages 03-05 claim slugs through lock files
+        max_memory: RAM budget in bytes for stages 03-05 (None = no budget)
+
+    Returns:
+        Stage number -> wall-clock seconds
+    """
+    unknown = sorted(set(stages) - set(STAGES))
+    if unknown:
+        raise ValueError(f"Unknown stage(s) {', '.join(unknown)}; choose from {', '.join(STAGES)}")
+
+    graph = BuildGraph()
+    catalog = Catalog()
+    timings = {}
+
+    for stage in STAGES:
+        if stage not in stages:
+            continue
+
+        print("\n" + "=" * 60)
+        print(f"Stage {stage}")
+        print("=" * 60)
+        start = time.perf_counter()
+
+        if stage == "03":
+            projection.run(config, source_manifest, limit=limit, force=force, jobs=jobs, graph=graph,
+                           catalog=catalog, shard=shard, claim=claim, max_memory=max_memory)
+        elif stage == "04":
+            render_webp.run(config, limit=limit, force=force, jobs=jobs, graph=graph,
+                            catalog=catalog, shard=shard, claim=claim, max_memory=max_memory)
+        elif stage == "05":
+            render_lottie.run(
+                config,
+                projected_dir=PIPELINE_ROOT / "projected",
+                output_dir=PIPELINE_ROOT / "output" / "lottie",
+                limit=limit,
+                force=force,
+                jobs=jobs,
+                graph=graph,
+                catalog=catalog,
+                shard=shard,
+                claim=claim,
+                max_memory=max_memory,
+            )
+        elif stage == "09":
+            manifest.run(
+                source_manifest,
+                output=PIPELINE_ROOT / "output" / "manifest.json",
+                webp_dir=PIPELINE_ROOT / "output" / "webp",
+                lottie_dir=PIPELINE_ROOT / "output" / "lottie",
+                include_lottie=include_lottie,
+                cdn_base=cdn_base,
+                pretty=pretty,
+                graph=graph,
+                catalog=catalog,
+            )
+
+        timings[stage] = time.perf_counter() - start
+
+    return timings
+
+
+def run_fused(
+    config: Dict,
+    source_manifest: Dict,
+    limit: Optional[int] = None,
+    force: bool = False,
+    jobs: int = 1,
+    cdn_base: Optional[str] = None,
+    include_lottie: bool = False,
+    pretty: bool = False,
+    max_memory: Optional[int] = None,
+) -> Dict[str, float]:
+    """
+    Run the fused 03 → 09 path instead of the individual stages.
+
+    Args:
+        See run_stages(); include_lottie also controls Lottie rendering.
+
+    Returns:
+        {"fused": wall-clock seconds}
+    """
+    start = time.perf_counter()
+    fused.run(
+        config,
+        source_manifest,
+        limit=limit,
+        lottie=include_lottie,
+        cdn_base=cdn_base,
+        pretty=pretty,
+        force=force,
+        jobs=jobs,
+        max_memory=max_memory,
+    )
+    return {"fused": time.perf_counter() - start}
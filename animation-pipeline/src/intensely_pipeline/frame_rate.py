@@ -0,0 +1,224 @@
+"""
+Per-file frame rates, carried from the motion file to the renderers.
+
+Motion files don't all share one rate: convert_hymotion_to_npy.py writes
+HY-Motion clips at 15 fps (resampled from 20), 08_video_to_motion.py keeps
+the recording's rate (30, 60, 29.97, ...). Each producer writes the true
+rate next to the motion file:
+
+    motion_data/<slug>.npy   (T, 22, 3) joints
+    motion_data/<slug>.json  {"fps": 15}
+
+Files without a sidecar fall back to rendering.source_fps. Stage 03 reads
+the rate, uses it for smoothing, tempo and loop timing, and records it in
+the projected/<slug>.json sidecar as "fps"; stages 04/05 and the fused path
+resample from that rate to rendering.fps (never up) and time their output
+at the rate they actually render, so playback speed is right whatever the
+source.
+
+Resampling (resample_frames) interpolates linearly between the two source
+frames around each output frame's time, so any ratio works (20 -> 15,
+30 -> 12). When downsampling it first low-passes the trajectories with a
+Gaussian sized to the ratio (rendering.antialias), so fast limbs don't
+alias into jerky steps at low rates. A looped cycle wraps around at both
+ends of the filter and the interpolation.
+
+Stage 04 and the fused path can also write lower-rate WebP tiers for
+low-end devices (rendering.fps_tiers, off by default; e.g. [8, 10, 12]):
+
+    output/webp/<slug>.webp         rendering.fps
+    output/webp/12fps/<slug>.webp   one file per tier below that rate
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .build_graph import atomic_write
+
+# Gaussian sigma per source frame of step: the filter's response is 0.5 at
+# the output rate's Nyquist frequency (sigma = step * sqrt(2 ln 2) / pi)
+ANTIALIAS_SIGMA = 0.375
+
+# Kernel radius in sigmas
+ANTIALIAS_RADIUS = 3.0
+
+
+def motion_meta_path(motion_file) -> Path:
+    """motion_data/<slug>.json next to motion_data/<slug>.npy."""
+    return Path(motion_file).with_suffix(".json")
+
+
+def write_motion_fps(motion_file, fps: float):
+    """
+    Record a motion file's frame rate in its sidecar (atomically).
+
+    Write it before the motion file, so watch mode never picks up a new
+    motion file without its rate.
+
+    Args:
+        motion_file: Path to the motion .npy (it may not exist yet)
+        fps: Frame rate of the motion data
+    """
+    with atomic_write(motion_meta_path(motion_file), "w") as f:
+        json.dump({"fps": fps_value(fps)}, f, indent=2)
+
+
+def motion_fps(motion_file, default: float) -> float:
+    """
+    Frame rate of a motion file.
+
+    Args:
+        motion_file: Path to a motion .npy
+        default: Rate to assume without a sidecar (rendering.source_fps)
+
+    Returns:
+        Frames per second
+    """
+    try:
+        with open(motion_meta_path(motion_file)) as f:
+            fps = json.load(f).get("fps")
+    except (OSError, json.JSONDecodeError):
+        fps = None
+    return fps_value(fps) if fps else fps_value(default)
+
+
+def projected_fps(meta: Dict, config: Dict) -> float:
+    """
+    Frame rate of a unit-box projection.
+
+    Args:
+        meta: projected/<slug>.json sidecar (load_projection_meta())
+        config: Pipeline configuration (fallback: rendering.source_fps, for
+                projections written before stage 03 recorded the rate)
+
+    Returns:
+        Frames per second
+    """
+    return fps_value(meta.get("fps") or config["rendering"]["source_fps"])
+
+
+def output_fps(source_fps: float, target_fps: Optional[float]) -> float:
+    """Rate a clip renders at: the target, unless the source is slower (no upsampling)."""
+    if not target_fps:
+        return fps_value(source_fps)
+    return fps_value(min(source_fps, target_fps))
+
+
+def subsample_frames(motion_2d, source_fps, target_fps):
+    """
+    Subsample frames to target FPS, without interpolation.
+
+    Each output frame takes the source frame nearest its time, so any ratio
+    works (20 -> 15 as well as 30 -> 15). A source at or below the target
+    rate is returned unchanged and plays at its own rate (output_fps()).
+    The stages use resample_frames(); this keeps source poses exactly.
+
+    Args:
+        motion_2d: (T, J, 2) array of motion data
+        source_fps: FPS of the motion data (its projection sidecar's "fps")
+        target_fps: Target FPS (typically 15)
+
+    Returns:
+        Subsampled array
+    """
+    if source_fps <= target_fps:
+        return motion_2d
+
+    # Output frame k shows source time k / target_fps
+    step = source_fps / target_fps
+    count = int(np.ceil(len(motion_2d) / step - 1e-9))
+    indices = np.minimum(np.round(np.arange(count) * step).astype(np.intp), len(motion_2d) - 1)
+
+    return motion_2d[indices]
+
+
+def antialias_filter(motion: np.ndarray, step: float, cyclic: bool = False) -> np.ndarray:
+    """
+    Low-pass joint trajectories before keeping every step-th frame.
+
+    Args:
+        motion: (T, J, D) motion
+        step: Source frames per output frame (> 1)
+        cyclic: The clip is one loop cycle: wrap around instead of holding the ends
+
+    Returns:
+        (T, J, D) float64 array
+    """
+    sigma = ANTIALIAS_SIGMA * step
+    radius = min(int(np.ceil(ANTIALIAS_RADIUS * sigma)), len(motion) - 1)
+    if radius < 1:
+        return motion.astype(np.float64)
+    taps = np.arange(-radius, radius + 1)
+    kernel = np.exp(-0.5 * (taps / sigma) ** 2)
+    kernel /= kernel.sum()
+
+    pad = ((radius, radius),) + ((0, 0),) * (motion.ndim - 1)
+    padded = np.pad(motion.astype(np.float64), pad, mode='wrap' if cyclic else 'edge')
+    return sliding_window_view(padded, len(kernel), axis=0) @ kernel
+
+
+def resample_frames(motion: np.ndarray, source_fps: float, target_fps: float,
+                    antialias: bool = True, cyclic: bool = False) -> np.ndarray:
+    """
+    Resample a clip to a lower frame rate by linear interpolation.
+
+    Output frame k shows source time k / target_fps, blended from the two
+    source frames around it, for the whole clip in one gather. A source at
+    or below the target rate is returned unchanged and plays at its own rate
+    (output_fps()).
+
+    Args:
+        motion: (T, J, D) motion (2D canvas or unit-box coordinates)
+        source_fps: FPS of the motion data (its projection sidecar's "fps")
+        target_fps: Target FPS
+        antialias: Low-pass the trajectories first (antialias_filter())
+        cyclic: The clip is one loop cycle (frame T follows frame T - 1 as frame 0)
+
+    Returns:
+        (ceil(T * target_fps / source_fps), J, D) float64 array
+    """
+    if source_fps <= target_fps or len(motion) < 2:
+        return motion
+
+    step = source_fps / target_fps
+    num_frames = len(motion)
+    if antialias:
+        motion = antialias_filter(motion, step, cyclic)
+
+    count = int(np.ceil(num_frames / step - 1e-9))
+    positions = np.arange(count) * step
+    lower = np.minimum(positions.astype(np.intp), num_frames - 1)
+    upper = (lower + 1) % num_frames if cyclic else np.minimum(lower + 1, num_frames - 1)
+    weight = (positions - lower).reshape((-1,) + (1,) * (motion.ndim - 1))
+    return motion[lower] * (1.0 - weight) + motion[upper] * weight
+
+
+def fps_tiers(config: Dict, fps: float) -> List:
+    """
+    Extra WebP frame rates to render for a clip.
+
+    Args:
+        config: Pipeline configuration (rendering.fps_tiers)
+        fps: Rate of the main WebP (output_fps())
+
+    Returns:
+        Configured tiers below fps, highest first
+    """
+    return sorted({fps_value(tier) for tier in config['rendering'].get('fps_tiers', []) if tier < fps},
+                  reverse=True)
+
+
+def tier_path(webp_file, fps: float) -> Path:
+    """output/webp/<fps>fps/<slug>.webp for output/webp/<slug>.webp."""
+    webp_file = Path(webp_file)
+    return webp_file.parent / f"{fps_value(fps)}fps" / webp_file.name
+
+
+def fps_value(fps: float):
+    """An fps as an int when it is whole (15, not 15.0), otherwise a float (29.97)."""
+    fps = float(fps)
+    return int(fps) if fps.is_integer() else round(fps, 3)
@@ -0,0 +1,378 @@
+"""
+Fused pipeline - motion_data → WebP + Lottie + manifest in one pass
+
+Alternative to running stages 03 → 04 → 05 → 09 separately. Each motion
+file is loaded once, projected in memory, and the projected array feeds the
+WebP and Lottie renderers directly. Manifest entries are emitted from the
+frame counts and byte sizes known at render time, so nothing is written to
+projected/ and no WebP is decoded to count frames. The count is read from
+each WebP's header after encoding, because libwebp merges identical
+consecutive frames and stage 09 reports what is in the file.
+
+The staged modules remain the reference path; this reuses their functions
+unchanged, so output is identical (scripts/check_fused_manifest.py checks
+the manifests match).
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from . import projection, render_lottie, render_webp
+from .build_graph import BuildGraph, atomic_write, config_subset, hash_file, hash_value
+from .catalog import Catalog
+from .config import PIPELINE_ROOT
+from .frame_rate import fps_tiers, motion_fps, output_fps, resample_frames, tier_path
+from .loop import describe_loop, find_loop, loop_cycle, loop_settings
+from .smoothing import smooth_motion, smoothing_settings
+from .tempo import describe_tempo, normalize_tempo, tempo_settings
+from .manifest import build_manifest, calculate_statistics, print_statistics, write_manifest
+from .memory import (
+    STREAMED_FRAMES,
+    budget_jobs,
+    estimate_task_bytes,
+    format_bytes,
+    input_size,
+    peak_rss,
+    reset_peak,
+)
+from .parallel import longest_first, resolve_jobs, run_pool
+from .tracing import span, traced, traced_task
+from .variants import derive_variants
+
+# Config sections that affect any fused output
+CONFIG_KEYS = ["canvas", "projection", "rendering", "smpl_h_skeleton", "loop", "smoothing"]
+
+
+def animation_entries(meta: Dict, paths: Dict[str, Path]) -> Dict:
+    """
+    Build scan_animations()-style entries from recorded render metadata.
+
+    Args:
+        meta: Format -> {"frame_count", "file_size_bytes"}, plus "loop" and "tempo"
+        paths: Format -> output path
+
+    Returns:
+        Format -> entry with path, exists, frame_count and file_size_bytes,
+        plus the loop cycle and retiming (None if not analysed)
+    """
+    entries = {
+        fmt: {
+            "path": str(path.relative_to(PIPELINE_ROOT)),
+            "exists": True,
+            "frame_count": meta.get(fmt, {}).get("frame_count"),
+            "file_size_bytes": meta.get(fmt, {}).get("file_size_bytes"),
+        }
+        for fmt, path in paths.items()
+    }
+    entries["loop"] = meta.get("loop")
+    entries["tempo"] = meta.get("tempo")
+    return entries
+
+
+@traced_task("fused")
+def render_fused(task: Dict) -> Dict:
+    """
+    Project and render one exercise entirely in memory.
+
+    Args:
+        task: Dictionary with slug, motion_file, fps, camera_angle, camera, tempo, config,
+              webp_file, lottie_file (or None), paths, inputs, Lottie
+              options, stream flag and a progress label
+
+    Returns:
+        Dictionary with slug, ok flag, inputs, paths, per-format frame
+        counts and byte sizes, WebP tiers, loop and tempo (if analysed),
+        duration_ms, peak_rss and error (if any)
+    """
+    start = time.perf_counter()
+    reset_peak()
+    config = task["config"]
+    canvas_size = config["canvas"]["width"]
+    target_fps = config["rendering"]["fps"]
+    source_fps = task["fps"]
+    result = {
+        "slug": task["slug"],
+        "ok": False,
+        "inputs": task["inputs"],
+        "paths": task["paths"],
+        "tiers": {},
+    }
+
+    print(task["label"])
+
+    try:
+        with span("load npy"):
+            motion_3d = np.load(task["motion_file"])
+        if motion_3d.ndim != 3 or motion_3d.shape[2] != 3:
+            raise ValueError(f"Invalid shape {motion_3d.shape}, expected (T, J, 3)")
+
+        # Stage 03, without the projected/*.npy round trip, cut to one loop,
+        # timed at the motion file's own rate
+        motion_3d = smooth_motion(motion_3d, dict(smoothing_settings(config), source_fps=source_fps))
+        if task["tempo"]["enabled"]:
+            motion_3d, result["tempo"] = normalize_tempo(motion_3d, dict(task["tempo"], source_fps=source_fps))
+            print(f"  Tempo: {describe_tempo(result['tempo'])}")
+        motion_unit, _ = projection.project_motion_unit(motion_3d, task["camera_angle"], task["camera"])
+        settings = dict(loop_settings(config), source_fps=source_fps)
+        if settings["enabled"]:
+            result["loop"] = find_loop(motion_unit, settings)
+            print(f"  Loop: {describe_loop(result['loop'])}")
+            motion_unit = loop_cycle(motion_unit, result["loop"])
+        motion_2d = projection.to_canvas(motion_unit, canvas_size, projection.canvas_padding(config))
+        antialias = config["rendering"].get("antialias", True)
+        cyclic = bool(result.get("loop") and result["loop"]["looped"])
+
+        # Stage 04
+        motion_subsampled = resample_frames(motion_2d, source_fps, target_fps, antialias, cyclic)
+        if task.get("stream"):
+            frames = render_webp.FrameStream(motion_subsampled, canvas_size, config)
+        else:
+            frames = render_webp.render_frames(motion_subsampled, canvas_size, config)
+        fps = output_fps(source_fps, target_fps)
+        render_webp.save_as_webp(frames, task["webp_file"], fps, loop=0)
+        result["webp"] = {
+            "frame_count": render_webp.encoded_frame_count(task["webp_file"]),
+            "file_size_bytes": task["webp_file"].stat().st_size,
+        }
+        for tier in fps_tiers(config, fps):
+            tier_file = tier_path(task["webp_file"], tier)
+            tier_file.parent.mkdir(exist_ok=True)
+            tier_motion = resample_frames(motion_2d, source_fps, tier, antialias, cyclic)
+            render_webp.save_as_webp(render_webp.FrameStream(tier_motion, canvas_size, config),
+                                     tier_file, tier, loop=0)
+            result["tiers"][str(tier)] = {"path": str(tier_file),
+                                          "frame_count": render_webp.encoded_frame_count(tier_file)}
+        render_webp.remove_stale_tiers(task["webp_file"], result["tiers"])
+
+        # Stage 05
+        if task["lottie_file"] is not None:
+            lottie_fps = config["rendering"].get("target_fps", config["rendering"].get("fps", 15))
+            motion_lottie = resample_frames(motion_2d, source_fps, lottie_fps, antialias, cyclic)
+            keyframe_map = render_lottie.optimize_keyframes_for_animation(
+                motion_lottie,
+                threshold_degrees=task["threshold_degrees"],
+                min_displacement=task["min_displacement"],
+            )
+            lottie_json = render_lottie.create_lottie_animation(
+                motion_lottie, keyframe_map, config, fps=output_fps(source_fps, lottie_fps)
+            )
+            with span("json dump"), atomic_write(task["lottie_file"], "w") as f:
+                json.dump(lottie_json, f, separators=(",", ":"))
+            result["lottie"] = {
+                "frame_count": motion_lottie.shape[0],
+                "file_size_bytes": task["lottie_file"].stat().st_size,
+            }
+
+        print(f"  ✓ {result['webp']['frame_count']} frames, {result['webp']['file_size_bytes'] / 1024:.1f} KB WebP"
+              + (f" (+ {', '.join(result['tiers'])} fps tiers)" if result["tiers"] else ""))
+        result["ok"] = True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        result["error"] = str(e)
+        import traceback
+        traceback.print_exc()
+
+    result["duration_ms"] = (time.perf_counter() - start) * 1000
+    result["peak_rss"] = peak_rss()
+    print(f"  Peak RSS: {format_bytes(result['peak_rss'])}")
+    return result
+
+
+@traced("fused")
+def run(
+    config: Dict,
+    source_manifest: Dict,
+    limit: Optional[int] = None,
+    lottie: bool = True,
+    threshold: float = 10.0,
+    min_displacement: float = 5.0,
+    cdn_base: Optional[str] = None,
+    output: str = "output/manifest.json",
+    pretty: bool = False,
+    force: bool = False,
+    jobs: int = 1,
+    graph: Optional[BuildGraph] = None,
+    catalog: Optional[Catalog] = None,
+    max_memory: Optional[int] = None,
+) -> Optional[Dict]:
+    """
+    Render every motion file to WebP (and Lottie) and write the manifest.
+
+    Args:
+        config: Pipeline configuration
+        source_manifest: Parsed source manifest from step 02
+        limit: Only process the first N motion files
+        lottie: Also render Lottie JSON
+        threshold: Lottie direction change threshold in degrees
+        min_displacement: Lottie minimum displacement in pixels
+        cdn_base: CDN base URL for manifest entries
+        output: Output manifest path, relative to the pipeline root
+        pretty: Pretty-print manifest JSON
+        force: Rebuild even if inputs are unchanged
+        jobs: Worker processes (0 = all cores)
+        graph: Build graph to use (default: the pipeline's .build_graph.json)
+        catalog: Artifact catalog to record results in (default: pipeline.db)
+        max_memory: RAM budget in bytes: stream WebP frames into the encoder
+                    and cap workers to fit (default: no budget)
+
+    Returns:
+        The manifest that was written, or None if there was nothing to render
+    """
+    exercises = source_manifest["exercises"]
+
+    motion_data_dir = PIPELINE_ROOT / "motion_data"
+    webp_dir = PIPELINE_ROOT / "output" / "webp"
+    lottie_dir = PIPELINE_ROOT / "output" / "lottie"
+    webp_dir.mkdir(parents=True, exist_ok=True)
+    if lottie:
+        lottie_dir.mkdir(parents=True, exist_ok=True)
+
+    derive_variants(config, exercises, motion_data_dir, force=force, graph=graph, catalog=catalog)
+    motion_files = sorted(motion_data_dir.glob("*.npy"))
+    if not motion_files:
+        print(f"\n❌ No .npy files found in {motion_data_dir}")
+        return None
+
+    if limit:
+        motion_files = motion_files[:limit]
+    print(f"✓ Found {len(motion_files)} motion files\n")
+
+    if graph is None:
+        graph = BuildGraph()
+    if catalog is None:
+        catalog = Catalog()
+    catalog.sync_exercises(exercises)
+    config_hash = hash_value(config_subset(config, CONFIG_KEYS))
+    options_hash = hash_value({
+        "lottie": lottie,
+        "threshold": threshold,
+        "min_displacement": min_displacement,
+    })
+
+    animations = {}
+    tasks = []
+    skipped_count = 0
+
+    for idx, motion_file in enumerate(motion_files, 1):
+        slug = motion_file.stem
+        webp_file = webp_dir / f"{slug}.webp"
+        lottie_file = lottie_dir / f"{slug}.json" if lottie else None
+        paths = {"webp": webp_file}
+        if lottie_file is not None:
+            paths["lottie"] = lottie_file
+
+        camera_angle = exercises.get(slug, {}).get(
+            "camera_angle", config["camera_angles"]["default"]
+        )
+        movement_pattern = exercises.get(slug, {}).get("movement_pattern", "unknown")
+        camera = projection.camera_settings(config, movement_pattern)
+        tempo = tempo_settings(config, movement_pattern)
+        fps = motion_fps(motion_file, config["rendering"]["source_fps"])
+        inputs = {
+            "motion": hash_file(motion_file),
+            "fps": hash_value(fps),
+            "camera_angle": hash_value(camera_angle),
+            "camera": hash_value(camera),
+            "tempo": hash_value(tempo),
+            "config": config_hash,
+            "options": options_hash,
+        }
+
+        tier_files = [tier["path"] for tier in graph.get_meta("fused", slug).get("tiers", {}).values()]
+        if not force and not graph.is_stale("fused", slug, inputs, list(paths.values()) + tier_files):
+            # Up to date: manifest entry comes from recorded metadata, no file reads
+            animations[slug] = animation_entries(graph.get_meta("fused", slug), paths)
+            skipped_count += 1
+            continue
+
+        tasks.append({
+            "label": f"[{idx}/{len(motion_files)}] {slug}",
+            "slug": slug,
+            "motion_file": motion_file,
+            "fps": fps,
+            "camera_angle": camera_angle,
+            "camera": camera,
+            "tempo": tempo,
+            "config": config,
+            "webp_file": webp_file,
+            "lottie_file": lottie_file,
+            "paths": paths,
+            "inputs": inputs,
+            "threshold_degrees": threshold,
+            "min_displacement": min_displacement,
+            "stream": max_memory is not None,
+        })
+
+    print(f"Up to date: {skipped_count}, to render: {len(tasks)}\n")
+
+    jobs = resolve_jobs(jobs)
+    if max_memory is not None:
+        canvas_size = config["canvas"]["width"]
+        jobs = budget_jobs(jobs, max_memory, (
+            estimate_task_bytes(input_size(t["motion_file"]), factor=60.0 if lottie else 6.0,
+                                frames=STREAMED_FRAMES, canvas_size=canvas_size)
+            for t in tasks
+        ))
+    if jobs > 1:
+        order = {path: rank for rank, path in enumerate(longest_first(t["motion_file"] for t in tasks))}
+        tasks.sort(key=lambda t: order[t["motion_file"]])
+
+    error_count = 0
+    peak = 0
+    for result, captured in run_pool(render_fused, tasks, jobs):
+        if captured:
+            print(captured, end="")
+        peak = max(peak, result.get("peak_rss") or 0)
+
+        if not result["ok"]:
+            for fmt in result["paths"]:
+                catalog.mark_failed(result["slug"], fmt, result.get("error"), result.get("duration_ms"))
+            error_count += 1
+            continue
+
+        paths = result["paths"]
+        meta = {fmt: result[fmt] for fmt in paths}
+        meta["loop"] = result.get("loop")
+        meta["tempo"] = result.get("tempo")
+        meta["tiers"] = result["tiers"]
+        graph.record("fused", result["slug"], result["inputs"],
+                     list(paths.values()) + [tier["path"] for tier in result["tiers"].values()], meta=meta)
+        catalog.record(result["slug"], "motion", hash=result["inputs"]["motion"])
+        for fmt, path in paths.items():
+            catalog.record(result["slug"], fmt, path=path, size_bytes=meta[fmt]["file_size_bytes"],
+                           frame_count=meta[fmt]["frame_count"], duration_ms=result["duration_ms"])
+        animations[result["slug"]] = animation_entries(meta, paths)
+
+    graph.save()
+
+    # Stage 09, from known frame counts and sizes
+    print("\n🏗️  Building manifest...")
+    manifest = build_manifest(
+        animations=animations,
+        source_manifest=source_manifest,
+        cdn_base_url=cdn_base,
+    )
+    stats = calculate_statistics(manifest)
+    manifest["statistics"] = stats
+    print_statistics(stats)
+
+    output_path = PIPELINE_ROOT / output
+    write_manifest(manifest, output_path, pretty=pretty)
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    print(f"\nRendered: {len(tasks) - error_count}")
+    print(f"Skipped (up to date): {skipped_count}")
+    print(f"Errors: {error_count}")
+    if peak:
+        print(f"Peak RSS (largest exercise): {format_bytes(peak)}")
+    print(f"\n📄 Manifest: {output_path}")
+    print("=" * 60)
+
+    return manifest
@@ -0,0 +1,213 @@
+"""
+Seamless loop extraction: one clean repetition per clip.
+
+Clips hold 2-5 reps and the app loops the file anyway, so every extra rep
+is wasted frames, bytes and decode time on the phone. Stage 03 analyses the
+unit-box projection (what the renderers draw) and records the cycle in the
+projected/<slug>.json sidecar; stages 04/05 and the fused path render only
+frames [start, end).
+
+    period  autocorrelation of the mean-removed joint trajectories (all
+            joints and axes summed, computed with an FFT), normalised at
+            each lag by the energy of the two overlapping segments, so it
+            stays in [-1, 1]. The first peak within PEAK_TOLERANCE of the
+            highest one is taken, so two reps don't beat one.
+    cut     start frame s with the smallest pose jump between frame s and
+            frame s + period, plus the velocity jump, so the figure
+            neither teleports nor stutters where the loop wraps
+    error   mean joint distance across the seam in unit-box units
+            (fraction of the figure's size)
+
+Clips without a clear repetition (no peak above min_correlation, or a seam
+error above max_error) are rendered whole.
+
+Settings come from the "loop" config section:
+
+    "loop": {"enabled": true, "min_period_seconds": 0.5, "max_period_seconds": 8,
+             "min_correlation": 0.5, "max_error": 0.03}
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+DEFAULT_SETTINGS = {
+    'enabled': True,
+    'min_period_seconds': 0.5,
+    'max_period_seconds': 8.0,
+    'min_correlation': 0.5,
+    'max_error': 0.03,
+}
+
+# A later peak must beat the first one by this factor to be chosen
+PEAK_TOLERANCE = 0.9
+
+# Weight of the velocity jump relative to the position jump at the seam
+VELOCITY_WEIGHT = 1.0
+
+
+def loop_settings(config: Dict) -> Dict:
+    """Loop settings from config, with defaults and the source frame rate filled in."""
+    settings = dict(DEFAULT_SETTINGS, **config.get('loop', {}))
+    settings['source_fps'] = config['rendering']['source_fps']
+    return settings
+
+
+def autocorrelation(motion: np.ndarray) -> np.ndarray:
+    """
+    Normalised autocorrelation of a clip's joint trajectories.
+
+    Args:
+        motion: (T, J, D) motion
+
+    Returns:
+        (T,) correlation per lag in frames, 1.0 at lag 0 (zero where a
+        segment doesn't move)
+    """
+    num_frames = len(motion)
+    tracks = motion.reshape(num_frames, -1).astype(np.float64)
+    tracks = tracks - tracks.mean(axis=0)
+
+    # Zero-padded to 2T so the circular correlation equals the linear one
+    size = 1 << (2 * num_frames - 1).bit_length()
+    spectrum = np.fft.rfft(tracks, n=size, axis=0)
+    correlation = np.fft.irfft(np.abs(spectrum) ** 2, n=size, axis=0)[:num_frames].sum(axis=1)
+
+    # Energy of frames [0, T - k) and [k, T) for every lag k
+    energy = np.concatenate([[0.0], np.cumsum((tracks ** 2).sum(axis=1))])
+    lags = np.arange(num_frames)
+    head = energy[num_frames - lags]
+    tail = energy[num_frames] - energy[lags]
+    norm = np.sqrt(head * tail)
+    return np.divide(correlation, norm, out=np.zeros(num_frames), where=norm > 1e-12)
+
+
+def find_period(correlation: np.ndarray, min_lag: int, max_lag: int, min_correlation: float):
+    """
+    Pick the repetition period from an autocorrelation.
+
+    Args:
+        correlation: (T,) output of autocorrelation()
+        min_lag: Shortest period considered, in frames
+        max_lag: Longest period considered, in frames
+        min_correlation: Peaks below this don't count as repetition
+
+    Returns:
+        (period in frames, correlation at that lag), or (None, best correlation seen)
+    """
+    lags = np.arange(max(min_lag, 1), min(max_lag, len(correlation) - 2) + 1)
+    if len(lags) == 0:
+        return None, 0.0
+
+    values = correlation[lags]
+    peaks = lags[(values > correlation[lags - 1]) & (values >= correlation[lags + 1])]
+    peaks = peaks[correlation[peaks] >= min_correlation]
+    if len(peaks) == 0:
+        return None, float(values.max())
+
+    best = correlation[peaks].max()
+    period = int(peaks[np.argmax(correlation[peaks] >= PEAK_TOLERANCE * best)])
+    return period, float(correlation[period])
+
+
+def seam_costs(motion: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Position and velocity jump where the loop wraps, for every start frame.
+
+    Args:
+        motion: (T, J, D) motion
+        period: Cycle length in frames
+
+    Returns:
+        (position, cost) arrays over start frames s = 0 .. T - period - 2:
+        mean joint distance between frames s and s + period, and that plus
+        the weighted velocity jump
+    """
+    starts = len(motion) - period - 1
+    position = np.linalg.norm(motion[period:period + starts] - motion[:starts], axis=-1).mean(axis=1)
+    velocity = np.diff(motion, axis=0)
+    velocity_jump = np.linalg.norm(velocity[period:period + starts] - velocity[:starts], axis=-1).mean(axis=1)
+    return position, position + VELOCITY_WEIGHT * velocity_jump
+
+
+def repetition_period(motion: np.ndarray, settings: Dict):
+    """
+    Repetition period of a clip, within the configured period bounds.
+
+    Args:
+        motion: (T, J, D) motion
+        settings: Dictionary with source_fps, min_period_seconds,
+                  max_period_seconds and min_correlation (loop_settings(),
+                  tempo_settings())
+
+    Returns:
+        (period in frames, correlation at that lag), or (None, best correlation seen)
+    """
+    fps = settings['source_fps']
+    num_frames = len(motion)
+    min_lag = int(round(settings['min_period_seconds'] * fps))
+    # Long lags correlate only a few frames, which matches by chance: the
+    # overlap must cover a third of the clip (at least 1.5 reps)
+    max_lag = min(int(round(settings['max_period_seconds'] * fps)),
+                  num_frames - max(min_lag, num_frames // 3))
+    return find_period(autocorrelation(motion), min_lag, max_lag, settings['min_correlation'])
+
+
+def find_loop(motion: np.ndarray, settings: Dict) -> Dict:
+    """
+    Find one clean cycle of a repetitive clip.
+
+    Args:
+        motion: (T, J, 2) unit-box projection
+        settings: Output of loop_settings()
+
+    Returns:
+        Dictionary with looped; if True also start, end, period,
+        period_seconds, reps, correlation and error, otherwise reason
+    """
+    fps = settings['source_fps']
+    num_frames = len(motion)
+    period, correlation = repetition_period(motion, settings)
+    if period is None:
+        return {'looped': False, 'reason': f"no repetition (best correlation {correlation:.2f})"}
+
+    position, cost = seam_costs(motion, period)
+    start = int(np.argmin(cost))
+    error = float(position[start])
+    if error > settings['max_error']:
+        return {'looped': False, 'reason': f"seam error {error:.3f} above {settings['max_error']}"}
+
+    return {
+        'looped': True,
+        'start': start,
+        'end': start + period,
+        'period': period,
+        'period_seconds': round(period / fps, 3),
+        'reps': round(num_frames / period, 1),
+        'correlation': round(correlation, 3),
+        'error': round(error, 4),
+    }
+
+
+def loop_cycle(motion: np.ndarray, loop) -> np.ndarray:
+    """
+    The frames to render: the recorded cycle, or the whole clip if there is none.
+
+    Args:
+        motion: (T, ...) motion at the source frame rate
+        loop: "loop" entry of a projection sidecar (or None)
+
+    Returns:
+        motion[start:end] for a looped clip, otherwise motion
+    """
+    if loop and loop.get('looped'):
+        return motion[loop['start']:loop['end']]
+    return motion
+
+
+def describe_loop(loop: Dict) -> str:
+    """One-line summary for progress output."""
+    if not loop.get('looped'):
+        return f"whole clip ({loop['reason']})"
+    return (f"frames {loop['start']}-{loop['end']} of {loop['reps']} reps "
+            f"(period {loop['period_seconds']:.2f}s, seam error {loop['error'] * 100:.1f}%)")
@@ -0,0 +1,681 @@
+"""
+Generate Output Manifest (stage 09)
+
+Creates output/manifest.json with metadata about all rendered animations.
+
+Includes:
+- Version and timestamp
+- Total exercise count
+- Per-exercise metadata:
+  - WebP/Lottie paths
+  - Camera angle
+  - Frame count
+  - File sizes
+  - Movement pattern
+  - Loop cycle (period and seam error) for clips trimmed to one rep
+
+WebP frame counts are cached in the build graph keyed by file hash, so only
+new or re-rendered animations are decoded. Rendered files and their sizes
+come from the artifact catalog (pipeline.db) rather than a directory scan.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from PIL import Image
+
+from .build_graph import BuildGraph, atomic_write, hash_file
+from .catalog import Catalog, resolve_path
+from .config import PIPELINE_ROOT
+from .tracing import span, traced
+
+# Version of the manifest format
+MANIFEST_VERSION = "1.0.0"
+
+
+def load_source_manifest(manifest_path: str = "manifest.json") -> Dict:
+    """Load the source manifest (from step 02)."""
+    if not os.path.exists(manifest_path):
+        print(f"⚠️  Warning: Source manifest not found: {manifest_path}")
+        return {"exercises": {}}
+
+    with open(manifest_path, "r") as f:
+        return json.load(f)
+
+
+@traced("webp frame count", "step")
+def get_webp_frame_count(webp_path: str) -> Optional[int]:
+    """
+    Get frame count from animated WebP file.
+
+    Args:
+        webp_path: Path to WebP file
+
+    Returns:
+        Number of frames, or None if unable to read
+    """
+    try:
+        with Image.open(webp_path) as img:
+            if not getattr(img, "is_animated", False):
+                return 1  # Static image
+
+            frame_count = 0
+            try:
+                while True:
+                    img.seek(frame_count)
+                    frame_count += 1
+            except EOFError:
+                pass
+
+            return frame_count
+    except Exception as e:
+        print(f"  ⚠️  Failed to read {webp_path}: {e}")
+        return None
+
+
+def projected_sidecar(slug: str) -> Dict:
+    """Stage 03's projected/<slug>.json (empty if there is none)."""
+    try:
+        with open(PIPELINE_ROOT / "projected" / f"{slug}.json") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def webp_tiers(slug: str, webp_path: str, cdn_base_url: Optional[str] = None) -> Dict:
+    """
+    Lower-rate WebP tiers stage 04 wrote next to the main file.
+
+    Args:
+        slug: Exercise slug
+        webp_path: Main WebP path as written in the manifest
+        cdn_base_url: CDN base URL (optional)
+
+    Returns:
+        fps (as a string) -> entry with fps, path, file_size_bytes,
+        file_size_kb and url; empty without tiers
+    """
+    tiers = {}
+    directory = Path(webp_path).parent
+    for path in resolve_path(str(directory)).glob(f"*fps/{slug}.webp"):
+        fps = path.parent.name[:-len("fps")]
+        file_size = get_file_size(str(path))
+        tier = {
+            "fps": float(fps) if "." in fps else int(fps),
+            "path": str(directory / path.parent.name / path.name),
+            "file_size_bytes": file_size,
+            "file_size_kb": round(file_size / 1024, 1) if file_size else None,
+        }
+        if cdn_base_url:
+            tier["url"] = f"{cdn_base_url}/animations/{fps}fps/{slug}.webp"
+        tiers[fps] = tier
+    return dict(sorted(tiers.items(), key=lambda item: item[1]["fps"], reverse=True))
+
+
+def get_file_size(file_path: str) -> Optional[int]:
+    """Get file size in bytes."""
+    try:
+        return os.path.getsize(file_path)
+    except Exception:
+        return None
+
+
+@traced("manifest scan", "step")
+def scan_animations(
+    webp_dir: str = "output/webp",
+    lottie_dir: str = "output/lottie",
+    include_lottie: bool = False,
+) -> Dict[str, Dict]:
+    """
+    Scan animation directories for files.
+
+    Args:
+        webp_dir: Directory containing WebP files
+        lottie_dir: Directory containing Lottie JSON files
+        include_lottie: Whether to include Lottie files
+
+    Returns:
+        Dictionary mapping slug -> file info
+    """
+    animations = {}
+
+    # Scan WebP files
+    webp_path = Path(webp_dir)
+    if webp_path.exists():
+        for file_path in webp_path.glob("*.webp"):
+            slug = file_path.stem
+            animations[slug] = {
+                "webp": {
+                    "path": str(file_path),
+                    "exists": True,
+                }
+            }
+
+    # Scan Lottie files if requested
+    if include_lottie:
+        lottie_path = Path(lottie_dir)
+        if lottie_path.exists():
+            for file_path in lottie_path.glob("*.json"):
+                slug = file_path.stem
+                if slug not in animations:
+                    animations[slug] = {}
+
+                animations[slug]["lottie"] = {
+                    "path": str(file_path),
+                    "exists": True,
+                }
+
+    return animations
+
+
+@traced("manifest catalog", "step")
+def catalog_animations(
+    catalog: Catalog,
+    graph: BuildGraph,
+    webp_dir: str = "output/webp",
+    lottie_dir: str = "output/lottie",
+    include_lottie: bool = False,
+) -> Dict[str, Dict]:
+    """
+    List rendered animations from the artifact catalog.
+
+    Same shape as scan_animations(), with file sizes and WebP frame counts
+    filled in so build_manifest() opens nothing. Paths are relative to the
+    pipeline root. Files rendered before the catalog existed are backfilled
+    from a one-off directory scan.
+
+    Args:
+        catalog: Artifact catalog
+        graph: Build graph holding cached WebP frame counts
+        webp_dir: Directory containing WebP files
+        lottie_dir: Directory containing Lottie JSON files
+        include_lottie: Whether to include Lottie files
+
+    Returns:
+        Dictionary mapping slug -> file info
+    """
+    kinds = {"webp": (Path(webp_dir), "*.webp")}
+    if include_lottie:
+        kinds["lottie"] = (Path(lottie_dir), "*.json")
+
+    animations = {}
+    for kind, (directory, pattern) in kinds.items():
+        if not catalog.has(kind) and directory.exists():
+            added = catalog.backfill(kind, directory.glob(pattern))
+            print(f"   Backfilled {added} {kind} files into the catalog")
+
+        directory = directory.resolve()
+        for row in catalog.artifacts(kind):
+            path = resolve_path(row["path"])
+            if path.parent.resolve() != directory or not path.exists():
+                continue
+
+            entry = {
+                "path": manifest_path(path),
+                "exists": True,
+                "file_size_bytes": row["size_bytes"],
+            }
+            if kind == "webp":
+                entry["frame_count"] = cached_webp_frame_count(row["slug"], str(path), graph)
+            animations.setdefault(row["slug"], {})[kind] = entry
+
+    return animations
+
+
+def cached_webp_frame_count(slug: str, webp_path: str, graph: BuildGraph) -> Optional[int]:
+    """
+    Get WebP frame count, decoding the file only if it changed since last run.
+
+    Args:
+        slug: Exercise slug
+        webp_path: Path to WebP file
+        graph: Build graph holding cached frame counts
+
+    Returns:
+        Number of frames, or None if unable to read
+    """
+    inputs = {"webp": hash_file(webp_path)}
+    if not graph.is_stale("09", slug, inputs, [webp_path]):
+        frame_count = graph.get_meta("09", slug).get("frame_count")
+        if frame_count is not None:
+            return frame_count
+
+    frame_count = get_webp_frame_count(webp_path)
+    if frame_count is not None:
+        graph.record("09", slug, inputs, [webp_path], meta={"frame_count": frame_count})
+    return frame_count
+
+
+@traced("manifest build", "step")
+def build_manifest(
+    animations: Dict[str, Dict],
+    source_manifest: Dict,
+    cdn_base_url: Optional[str] = None,
+    graph: Optional[BuildGraph] = None,
+) -> Dict:
+    """
+    Build the output manifest.
+
+    Per-format entries may already carry "file_size_bytes" and "frame_count"
+    (e.g. from the fused pipeline, which knows them from rendering); those
+    files are not re-read. Likewise an animation's "loop" and "tempo"
+    entries; without them, the loop cycle and retiming come from the stage
+    03 projection sidecar.
+
+    Args:
+        animations: Scanned animation files
+        source_manifest: Source manifest from step 02
+        cdn_base_url: CDN base URL (optional)
+        graph: Build graph for cached frame counts (optional)
+
+    Returns:
+        Complete manifest dictionary
+    """
+    source_exercises = source_manifest.get("exercises", {})
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "total_exercises": len(animations),
+        "exercises": {},
+    }
+
+    # Add CDN base URL if provided
+    if cdn_base_url:
+        manifest["cdn_base_url"] = cdn_base_url
+
+    print(f"📊 Processing {len(animations)} animations...")
+
+    for slug, anim_data in animations.items():
+        exercise_info = source_exercises.get(slug, {})
+
+        exercise_manifest = {
+            "slug": slug,
+            "name": exercise_info.get("name", slug.replace("-", " ").title()),
+            "movement_pattern": exercise_info.get("movement_pattern", "unknown"),
+            "camera_angle": exercise_info.get("camera_angle", 0),
+        }
+
+        # Mirrored from another exercise's motion rather than generated
+        if exercise_info.get("derived_from"):
+            exercise_manifest["derived_from"] = exercise_info["derived_from"]
+
+        sidecar = {} if "loop" in anim_data and "tempo" in anim_data else projected_sidecar(slug)
+
+        # Retimed to the movement pattern's rep duration
+        tempo = anim_data["tempo"] if "tempo" in anim_data else sidecar.get("tempo")
+        if tempo and tempo.get("retimed"):
+            exercise_manifest["tempo"] = {
+                "source_frames": tempo["source_frames"],
+                "frames": tempo["frames"],
+                "ratio": tempo["ratio"],
+                "source_rep_seconds": tempo["source_rep_seconds"],
+                "rep_seconds": tempo["rep_seconds"],
+            }
+
+        # Rendered as one repetition: the app loops it
+        loop = anim_data["loop"] if "loop" in anim_data else sidecar.get("loop")
+        if loop and loop.get("looped"):
+            exercise_manifest["loop"] = {
+                "period_frames": loop["period"],
+                "period_seconds": loop["period_seconds"],
+                "source_range": [loop["start"], loop["end"]],
+                "source_reps": loop["reps"],
+                "loop_error": loop["error"],
+            }
+
+        # WebP metadata
+        if "webp" in anim_data and anim_data["webp"]["exists"]:
+            webp_path = anim_data["webp"]["path"]
+            file_size = anim_data["webp"].get("file_size_bytes")
+            if file_size is None:
+                file_size = get_file_size(webp_path)
+
+            frame_count = anim_data["webp"].get("frame_count")
+            if frame_count is None and graph is not None:
+                frame_count = cached_webp_frame_count(slug, webp_path, graph)
+            elif frame_count is None:
+                frame_count = get_webp_frame_count(webp_path)
+
+            webp_info = {
+                "path": webp_path,
+                "file_size_bytes": file_size,
+                "file_size_kb": round(file_size / 1024, 1) if file_size else None,
+                "frame_count": frame_count,
+                "format": "webp",
+            }
+
+            # Add CDN URL if base provided
+            if cdn_base_url:
+                webp_info["url"] = f"{cdn_base_url}/animations/{slug}.webp"
+
+            # Lower frame-rate tiers for low-end devices
+            tiers = webp_tiers(slug, webp_path, cdn_base_url)
+            if tiers:
+                webp_info["tiers"] = tiers
+
+            exercise_manifest["webp"] = webp_info
+
+        # Lottie metadata
+        if "lottie" in anim_data and anim_data["lottie"]["exists"]:
+            lottie_path = anim_data["lottie"]["path"]
+            file_size = anim_data["lottie"].get("file_size_bytes")
+            if file_size is None:
+                file_size = get_file_size(lottie_path)
+
+            lottie_info = {
+                "path": lottie_path,
+                "file_size_bytes": file_size,
+                "file_size_kb": round(file_size / 1024, 1) if file_size else None,
+                "format": "lottie",
+            }
+
+            # Add CDN URL if base provided
+            if cdn_base_url:
+                lottie_info["url"] = f"{cdn_base_url}/animations/{slug}.json"
+
+            exercise_manifest["lottie"] = lottie_info
+
+        manifest["exercises"][slug] = exercise_manifest
+
+    return manifest
+
+
+def calculate_statistics(manifest: Dict) -> Dict:
+    """Calculate summary statistics."""
+    exercises = manifest["exercises"]
+
+    stats = {
+        "total_exercises": len(exercises),
+        "webp_count": sum(1 for ex in exercises.values() if "webp" in ex),
+        "lottie_count": sum(1 for ex in exercises.values() if "lottie" in ex),
+        "total_webp_size_mb": 0.0,
+        "total_lottie_size_mb": 0.0,
+        "total_frames": 0,
+        "avg_frames_per_animation": 0.0,
+        "movement_patterns": {},
+        "camera_angles": {},
+    }
+
+    # Calculate sizes and counts
+    webp_sizes = []
+    lottie_sizes = []
+    frame_counts = []
+
+    for exercise in exercises.values():
+        # Movement pattern distribution
+        pattern = exercise.get("movement_pattern", "unknown")
+        stats["movement_patterns"][pattern] = stats["movement_patterns"].get(pattern, 0) + 1
+
+        # Camera angle distribution
+        angle = exercise.get("camera_angle", 0)
+        stats["camera_angles"][angle] = stats["camera_angles"].get(angle, 0) + 1
+
+        # WebP stats
+        if "webp" in exercise:
+            webp = exercise["webp"]
+            if webp.get("file_size_bytes"):
+                webp_sizes.append(webp["file_size_bytes"])
+                stats["total_webp_size_mb"] += webp["file_size_bytes"]
+            if webp.get("frame_count"):
+                frame_counts.append(webp["frame_count"])
+                stats["total_frames"] += webp["frame_count"]
+
+        # Lottie stats
+        if "lottie" in exercise:
+            lottie = exercise["lottie"]
+            if lottie.get("file_size_bytes"):
+                lottie_sizes.append(lottie["file_size_bytes"])
+                stats["total_lottie_size_mb"] += lottie["file_size_bytes"]
+
+    # Convert to MB
+    stats["total_webp_size_mb"] = round(stats["total_webp_size_mb"] / (1024 * 1024), 2)
+    stats["total_lottie_size_mb"] = round(stats["total_lottie_size_mb"] / (1024 * 1024), 2)
+
+    # Calculate averages
+    if frame_counts:
+        stats["avg_frames_per_animation"] = round(sum(frame_counts) / len(frame_counts), 1)
+
+    if webp_sizes:
+        stats["webp_stats"] = {
+            "min_size_kb": round(min(webp_sizes) / 1024, 1),
+            "max_size_kb": round(max(webp_sizes) / 1024, 1),
+            "avg_size_kb": round(sum(webp_sizes) / len(webp_sizes) / 1024, 1),
+        }
+
+    if lottie_sizes:
+        stats["lottie_stats"] = {
+            "min_size_kb": round(min(lottie_sizes) / 1024, 1),
+            "max_size_kb": round(max(lottie_sizes) / 1024, 1),
+            "avg_size_kb": round(sum(lottie_sizes) / len(lottie_sizes) / 1024, 1),
+        }
+
+    return stats
+
+
+def print_statistics(stats: Dict) -> None:
+    """Print summary statistics."""
+    print("\n" + "=" * 60)
+    print("📊 Manifest Statistics")
+    print("=" * 60)
+    print(f"Total exercises: {stats['total_exercises']}")
+    print(f"WebP animations: {stats['webp_count']}")
+    print(f"Lottie animations: {stats['lottie_count']}")
+    print(f"\nTotal WebP size: {stats['total_webp_size_mb']} MB")
+    print(f"Total Lottie size: {stats['total_lottie_size_mb']} MB")
+    print(f"\nTotal frames: {stats['total_frames']}")
+    print(f"Average frames per animation: {stats['avg_frames_per_animation']}")
+
+    if "webp_stats" in stats:
+        ws = stats["webp_stats"]
+        print(f"\nWebP file sizes:")
+        print(f"  Min: {ws['min_size_kb']} KB")
+        print(f"  Max: {ws['max_size_kb']} KB")
+        print(f"  Avg: {ws['avg_size_kb']} KB")
+
+    if "lottie_stats" in stats:
+        ls = stats["lottie_stats"]
+        print(f"\nLottie file sizes:")
+        print(f"  Min: {ls['min_size_kb']} KB")
+        print(f"  Max: {ls['max_size_kb']} KB")
+        print(f"  Avg: {ls['avg_size_kb']} KB")
+
+    print(f"\nMovement patterns:")
+    for pattern, count in sorted(stats["movement_patterns"].items(), key=lambda x: -x[1]):
+        print(f"  {pattern}: {count}")
+
+    print(f"\nCamera angles:")
+    for angle, count in sorted(stats["camera_angles"].items()):
+        print(f"  {angle}°: {count}")
+
+    print("=" * 60)
+
+
+def write_manifest(manifest: Dict, output: str, pretty: bool = False) -> None:
+    """
+    Write the output manifest atomically.
+
+    Args:
+        manifest: Manifest dictionary (with statistics)
+        output: Output path
+        pretty: Indent JSON instead of compact separators
+    """
+    os.makedirs(os.path.dirname(str(output)) or ".", exist_ok=True)
+
+    with span("json dump"), atomic_write(output, "w") as f:
+        if pretty:
+            json.dump(manifest, f, indent=2)
+        else:
+            json.dump(manifest, f, separators=(",", ":"))
+
+
+def manifest_path(path: Path) -> str:
+    """Path as written in the manifest: relative to the pipeline root when inside it."""
+    try:
+        return str(Path(path).resolve().relative_to(PIPELINE_ROOT.resolve()))
+    except ValueError:
+        return str(path)
+
+
+@traced("stage 09 (patch)")
+def patch_manifest(
+    slugs: Iterable[str],
+    source_manifest: Dict,
+    output: str = "output/manifest.json",
+    webp_dir: str = "output/webp",
+    lottie_dir: str = "output/lottie",
+    include_lottie: bool = False,
+    cdn_base: Optional[str] = None,
+    pretty: bool = False,
+    graph: Optional[BuildGraph] = None,
+    catalog: Optional[Catalog] = None,
+) -> Dict:
+    """
+    Update the entries for a few slugs in an existing output manifest.
+
+    Only the named slugs' files are stat'ed and decoded; every other entry
+    is kept as is and the statistics are recomputed from the manifest. Slugs
+    whose animations no longer exist are dropped. Falls back to a full run()
+    if there is no manifest yet.
+
+    Args:
+        slugs: Exercise slugs whose animations changed
+        source_manifest: Parsed source manifest from step 02
+        output: Output manifest path
+        webp_dir: WebP directory
+        lottie_dir: Lottie directory
+        include_lottie: Whether to include Lottie animations
+        cdn_base: CDN base URL (default: the one already in the manifest)
+        pretty: Pretty-print JSON output
+        graph: Build graph for cached frame counts
+        catalog: Artifact catalog (used for the full run() fallback)
+
+    Returns:
+        The manifest that was written
+    """
+    if not os.path.exists(output):
+        return run(source_manifest, output, webp_dir, lottie_dir, include_lottie, cdn_base, pretty, graph, catalog)
+
+    with open(output) as f:
+        manifest = json.load(f)
+    manifest.pop("statistics", None)
+    cdn_base = cdn_base or manifest.get("cdn_base_url")
+
+    animations = {}
+    for slug in slugs:
+        entry = {}
+        webp_path = Path(webp_dir) / f"{slug}.webp"
+        if webp_path.exists():
+            entry["webp"] = {"path": manifest_path(webp_path), "exists": True}
+        lottie_path = Path(lottie_dir) / f"{slug}.json"
+        if include_lottie and lottie_path.exists():
+            entry["lottie"] = {"path": manifest_path(lottie_path), "exists": True}
+
+        if entry:
+            animations[slug] = entry
+        else:
+            manifest["exercises"].pop(slug, None)
+
+    if graph is None:
+        graph = BuildGraph()
+    patch = build_manifest(animations, source_manifest, cdn_base_url=cdn_base, graph=graph)
+    graph.save()
+
+    manifest["exercises"].update(patch["exercises"])
+    manifest["generated_at"] = patch["generated_at"]
+    manifest["total_exercises"] = len(manifest["exercises"])
+    if cdn_base:
+        manifest["cdn_base_url"] = cdn_base
+    manifest["statistics"] = calculate_statistics(manifest)
+
+    write_manifest(manifest, output, pretty=pretty)
+    print(f"💾 Patched {len(animations)} entries in {output}")
+    return manifest
+
+
+@traced("stage 09")
+def run(
+    source_manifest: Dict,
+    output: str = "output/manifest.json",
+    webp_dir: str = "output/webp",
+    lottie_dir: str = "output/lottie",
+    include_lottie: bool = False,
+    cdn_base: Optional[str] = None,
+    pretty: bool = False,
+    graph: Optional[BuildGraph] = None,
+    catalog: Optional[Catalog] = None,
+) -> Dict:
+    """
+    List rendered animations and write the output manifest.
+
+    Args:
+        source_manifest: Parsed source manifest from step 02
+        output: Output manifest path
+        webp_dir: WebP directory
+        lottie_dir: Lottie directory
+        include_lottie: Whether to include Lottie animations
+        cdn_base: CDN base URL (optional)
+        pretty: Pretty-print JSON output
+        graph: Build graph to use (default: the pipeline's .build_graph.json)
+        catalog: Artifact catalog to list animations from (default: pipeline.db)
+
+    Returns:
+        The manifest that was written
+    """
+    if graph is None:
+        graph = BuildGraph()
+    if catalog is None:
+        catalog = Catalog()
+
+    # List rendered animations
+    print("\n🔍 Reading animation catalog...")
+    animations = catalog_animations(
+        catalog,
+        graph,
+        webp_dir=webp_dir,
+        lottie_dir=lottie_dir,
+        include_lottie=include_lottie,
+    )
+    print(f"   Found {len(animations)} animations")
+
+    # Build manifest
+    print("\n🏗️  Building manifest...")
+    manifest = build_manifest(
+        animations=animations,
+        source_manifest=source_manifest,
+        cdn_base_url=cdn_base,
+        graph=graph,
+    )
+    graph.save()
+
+    # Calculate statistics
+    print("\n📊 Calculating statistics...")
+    stats = calculate_statistics(manifest)
+    manifest["statistics"] = stats
+
+    # Print statistics
+    print_statistics(stats)
+
+    # Save manifest
+    print(f"\n💾 Saving manifest to {output}...")
+    write_manifest(manifest, output, pretty=pretty)
+
+    file_size = os.path.getsize(output)
+    print(f"   ✅ Saved ({file_size / 1024:.1f} KB)")
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("✅ Manifest Generation Complete!")
+    print("=" * 60)
+    print(f"📄 Manifest: {output}")
+    print(f"📊 Exercises: {manifest['total_exercises']}")
+    print(f"📦 Total size: {stats['total_webp_size_mb'] + stats['total_lottie_size_mb']:.2f} MB")
+    print("\n💡 Next steps:")
+    print("   1. Upload manifest.json to CDN")
+    print("   2. Use in mobile app for animation metadata")
+    print("   3. Implement version checking for updates")
+
+    return manifest
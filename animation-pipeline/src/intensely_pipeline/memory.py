@@ -0,0 +1,173 @@
+"""
+Memory budget for the per-exercise stages (--max-memory).
+
+A budget is honoured in three ways:
+
+    workers    budget_jobs() caps concurrent pool workers so that the
+               parent plus every worker's estimated peak fits
+    streaming  stage 04 draws WebP frames on demand while encoding instead
+               of holding every RGBA frame (render_webp.FrameStream)
+    chunking   08 runs inference over fixed-size frame chunks, and 03
+               projects clips that wouldn't fit through memory-mapped
+               chunks (streaming.py)
+
+Peak RSS is measured per exercise: on Linux the high-water mark is reset
+before each task (/proc/self/clear_refs) and read back afterwards (VmHWM),
+so a worker that handles several exercises reports each one separately.
+Elsewhere the process-lifetime peak from getrusage() is reported.
+"""
+
+import os
+import re
+import sys
+from typing import Iterable, Optional
+
+# Resident size of a worker that has imported NumPy and Pillow, before any
+# exercise is loaded (measured on Linux, rounded up)
+WORKER_BASE_BYTES = 64 * 1024 * 1024
+
+# Frames alive at once when streaming: the one being drawn plus the
+# encoder's previous/candidate canvases
+STREAMED_FRAMES = 4
+
+_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def parse_memory(spec: str) -> int:
+    """
+    Parse a memory size such as "512M", "2G" or "1.5G" (bytes if no unit).
+
+    Args:
+        spec: Size with an optional K/M/G/T suffix (case-insensitive, "B"/"iB" allowed)
+
+    Returns:
+        Size in bytes
+    """
+    match = re.fullmatch(r"\s*([0-9]*\.?[0-9]+)\s*([KMGT]?)(I?B)?\s*", spec.upper())
+    if not match or float(match.group(1)) <= 0:
+        raise ValueError(f"Invalid memory size '{spec}', expected e.g. 512M or 2G")
+    return int(float(match.group(1)) * _UNITS[match.group(2)])
+
+
+def format_bytes(size: Optional[int]) -> str:
+    """Human-readable size (MB with one decimal)."""
+    if size is None:
+        return "n/a"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def _status_kb(field: str) -> Optional[int]:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (None if unavailable)."""
+    kb = _status_kb("VmRSS")
+    return kb * 1024 if kb is not None else None
+
+
+def reset_peak() -> bool:
+    """
+    Reset this process's peak RSS so the next peak_rss() covers one task.
+
+    Returns:
+        True if the kernel supports resetting (Linux >= 4.0)
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss() -> Optional[int]:
+    """Peak resident set size in bytes since the last reset_peak() (or process start)."""
+    kb = _status_kb("VmHWM")
+    if kb is not None:
+        return kb * 1024
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def frame_bytes(canvas_size: int) -> int:
+    """Bytes held by one RGBA frame."""
+    return canvas_size * canvas_size * 4
+
+
+def estimate_task_bytes(input_bytes: int, factor: float = 4.0, frames: int = 0, canvas_size: int = 0) -> int:
+    """
+    Estimate one worker's peak RSS for one exercise.
+
+    Args:
+        input_bytes: Size of the exercise's input array on disk
+        factor: Copies of the input alive at once (loaded + intermediates)
+        frames: RGBA frames held at once
+        canvas_size: Frame width/height in pixels
+
+    Returns:
+        Estimated bytes, including the worker's import baseline
+    """
+    return int(WORKER_BASE_BYTES + factor * input_bytes + frames * frame_bytes(canvas_size))
+
+
+def budget_jobs(jobs: int, max_memory: Optional[int], task_bytes: Iterable[int]) -> int:
+    """
+    Cap the worker count so the parent plus all workers fit in the budget.
+
+    Workers are sized for the largest task, since any worker may get it.
+
+    Args:
+        jobs: Requested workers (already resolved, >= 1)
+        max_memory: Budget in bytes, or None for no cap
+        task_bytes: Estimated peak bytes of each task
+
+    Returns:
+        Worker count >= 1 (a warning is printed if even one may not fit)
+    """
+    task_bytes = list(task_bytes)
+    if max_memory is None or not task_bytes:
+        return jobs
+
+    largest = max(task_bytes)
+    parent = current_rss() or WORKER_BASE_BYTES
+    fits = (max_memory - parent) // largest
+
+    if fits < 1:
+        print(f"⚠ Largest exercise needs ~{format_bytes(largest)}, budget leaves "
+              f"{format_bytes(max(max_memory - parent, 0))}; running 1 worker")
+        return 1
+
+    if fits < jobs:
+        print(f"🧮 Memory budget {format_bytes(max_memory)}: {fits} of {jobs} workers "
+              f"(~{format_bytes(largest)} each)")
+    return min(jobs, fits)
+
+
+def input_size(path) -> int:
+    """
+    Size of an input array in bytes (0 if missing).
+
+    Compact projections (.npq) count as the float64 .npy they decode to,
+    so the per-stage factors apply unchanged.
+    """
+    try:
+        if str(path).endswith(".npq"):
+            from .compact import npy_equivalent_size
+            return npy_equivalent_size(path)
+        return os.path.getsize(path)
+    except OSError:
+        return 0
@@ -0,0 +1,116 @@
+"""
+Process-pool helpers for the per-exercise stages (03, 04, 05).
+
+Work is scheduled longest-first by frame count (the T dimension of each
+.npy or .npq, read from the file header without loading the array) so a single long
+clip starts early instead of holding the pool open at the end.
+
+Worker output (progress prints, tracebacks) is captured per task and handed
+back to the parent, which prints each exercise's block in one piece instead
+of interleaving lines from several workers. Trace spans recorded in a worker
+travel back the same way and are merged into the parent's trace.
+"""
+
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from . import tracing
+
+
+def resolve_jobs(jobs: int) -> int:
+    """
+    Turn a --jobs value into a worker count.
+
+    Args:
+        jobs: Requested workers (0 or negative = all cores)
+
+    Returns:
+        Worker count >= 1
+    """
+    if jobs is None or jobs <= 0:
+        if hasattr(os, "sched_getaffinity"):
+            return len(os.sched_getaffinity(0)) or 1
+        return os.cpu_count() or 1
+    return jobs
+
+
+def npy_frame_count(path) -> int:
+    """
+    Read the frame count (first dimension) of a .npy or .npq file from its header.
+
+    Args:
+        path: Path to .npy file (or compact .npq projection)
+
+    Returns:
+        Number of frames, or 0 if the header can't be read
+    """
+    try:
+        if str(path).endswith(".npq"):
+            from .compact import read_header
+            shape = read_header(path)["shape"]
+        else:
+            shape = np.load(path, mmap_mode="r").shape
+        return shape[0] if shape else 0
+    except (OSError, ValueError):
+        return 0
+
+
+def longest_first(paths: Iterable[Path]) -> List[Path]:
+    """
+    Order files by descending frame count (ties keep name order).
+
+    Args:
+        paths: .npy files to schedule
+
+    Returns:
+        Paths sorted longest clip first
+    """
+    return sorted(paths, key=lambda p: (-npy_frame_count(p), str(p)))
+
+
+def _run_captured(worker: Callable, task, trace: bool = False) -> Tuple[object, str, List]:
+    """Run one task, returning its result, everything it printed and its trace spans."""
+    if trace:
+        tracing.enable()
+        tracing.drain()  # Drop events inherited from the parent on fork
+
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        result = worker(task)
+    return result, buffer.getvalue(), tracing.drain() if trace else []
+
+
+def run_pool(worker: Callable, tasks: List, jobs: int = 1) -> Iterator[Tuple[object, str]]:
+    """
+    Run worker over tasks, in-process or on a process pool.
+
+    With one job the worker runs inline and prints live (captured output is
+    empty). With more, tasks are submitted in the given order and results
+    are yielded as they complete.
+
+    Args:
+        worker: Top-level (picklable) function taking one task
+        tasks: Task arguments, already in scheduling order
+        jobs: Number of worker processes
+
+    Yields:
+        (result, captured_output) per task
+    """
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield worker(task), ""
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        trace = tracing.enabled()
+        futures = [pool.submit(_run_captured, worker, task, trace) for task in tasks]
+        for future in as_completed(futures):
+            result, output, events = future.result()
+            tracing.extend(events)
+            yield result, output
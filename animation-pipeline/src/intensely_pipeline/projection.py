@@ -0,0 +1,1274 @@
+"""
+Project 3D SMPL-H motion data to 2D screen coordinates (stage 03).
+
+CRITICAL FEATURES:
+- Global bounding box across ALL frames (character stays centered)
+- Consistent Y baseline (feet don't float)
+- Proper camera angle projection
+- Canvas fitting with padding
+
+Output is resolution independent: projected/<slug>.npy holds coordinates
+in a unit box (centered, longest side of the global bounding box = 1, Y
+down) and projected/<slug>.json the world-space bbox and scale. Stages
+04/05 map to pixels at render time with to_canvas(), so one projection
+feeds every canvas size and canvas/padding changes only re-render.
+
+The camera is orthographic by default. Movement patterns listed under
+"camera.models" get a perspective camera instead (focal length, distance,
+elevation), which separates near and far limbs at 3/4 views. The camera
+aims at the clip's global 3D centre and stays fixed, and the result goes
+through the same global bounding box as orthographic clips.
+
+Joint jitter is filtered from the 3D motion before projecting (see
+smoothing.py), then retimed so one rep lasts its movement pattern's
+target duration (tempo.py, recorded in the sidecar's "tempo" entry).
+Repetitive clips are trimmed to one clean cycle at render time: the
+sidecar's "loop" entry (loop.py) gives the frames 04/05 draw.
+
+With "projection.storage" set to "compact", the array is written as
+projected/<slug>.npq instead (int16 fixed point, delta encoded, zlib/lzma;
+see compact.py). load_projected() and find_projected() handle either.
+
+Exercises derived from another one (manifest "derived_from", see
+variants.py) get their motion mirrored from the source before projecting.
+
+Each motion file carries its own frame rate (motion_data/<slug>.json, see
+frame_rate.py). Smoothing, tempo and loop analysis run in that time base, and
+the sidecar records it as "fps" so 04/05 resample from the real rate.
+
+Incremental: an exercise is re-projected only when its motion file or frame
+rate, its camera angle or model or the projection config changed (see
+build_graph.py).
+
+Clips too long to project in memory are streamed instead: two passes over
+memory-mapped chunks, into a preallocated output (see streaming.py).
+
+With contact sheets enabled, each clip is projected at every candidate
+angle in one batched pass (project_motion_angles); the current angle's
+slice is saved as before and the rest feed output/contact_sheets/<slug>.png.
+"""
+
+import json
+import time
+from collections import Counter
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .build_graph import BuildGraph, atomic_write, config_subset, hash_file, hash_value
+from .catalog import Catalog
+from .compact import COMPACT_SUFFIX, DEFAULT_CODEC, DEFAULT_STEPS_PER_UNIT, load_compact, save_compact
+from .config import PIPELINE_ROOT
+from .frame_rate import motion_fps
+from .loop import describe_loop, find_loop, loop_settings
+from .smoothing import smooth_motion, smoothing_settings
+from .tempo import describe_tempo, normalize_tempo, tempo_settings
+from .memory import budget_jobs, estimate_task_bytes, format_bytes, input_size, peak_rss, reset_peak
+from .parallel import longest_first, npy_frame_count, resolve_jobs, run_pool
+from .sharding import run_claimed, select_shard, shard_label, write_stats
+from .tracing import span, traced, traced_task
+from .variants import derive_variants
+
+# Config sections that affect projected output (canvas size and padding are
+# applied at render time)
+CONFIG_KEYS = ["projection"]
+
+# Config sections that affect contact sheets
+SHEET_CONFIG_KEYS = CONFIG_KEYS + ["canvas", "rendering", "smpl_h_skeleton", "contact_sheet"]
+
+# Layout of projected/*.npy; a change re-projects files written in an older one
+PROJECTION_FORMAT = "unit-box-v1"
+
+# Canvas padding when config["canvas"] has no "padding" (fraction per side)
+DEFAULT_PADDING = 0.15
+
+# projected/ file formats: plain float64 .npy, or compact .npq (compact.py)
+STORAGE_SUFFIXES = {"npy": ".npy", "compact": COMPACT_SUFFIX}
+
+# Streaming (streaming.py) when config["projection"]["stream"] leaves a key
+# out: clips of 10 minutes at 30 fps or more, ~1 MB of float64 input per chunk
+DEFAULT_STREAM = {'min_frames': 18000, 'chunk_frames': 4096}
+
+CAMERA_MODELS = ("orthographic", "perspective")
+
+# Perspective camera when config["camera"]["perspective"] leaves a key out:
+# 35 mm-equivalent focal length (mm), distance from the clip centre in
+# motion units (None = frame the clip with that lens), pitch in degrees
+DEFAULT_PERSPECTIVE = {'focal_length': 35.0, 'distance': None, 'elevation': 10.0}
+
+# Frame height of a 35 mm camera, for the focal length -> distance framing
+SENSOR_HEIGHT_MM = 24.0
+
+# Joints closer to the camera than this fraction of its distance are an error
+MIN_DEPTH_FRACTION = 0.1
+
+
+def get_rotation_matrix(angle_degrees):
+    """
+    Get rotation matrix for camera angle (rotation around Y-axis).
+
+    Args:
+        angle_degrees: Camera angle in degrees
+                      0° = front, 90° = side, 135° = 3/4 back, etc.
+
+    Returns:
+        3x3 rotation matrix
+    """
+    angle_rad = np.radians(angle_degrees)
+    cos_a = np.cos(angle_rad)
+    sin_a = np.sin(angle_rad)
+
+    # Rotation around Y-axis (vertical)
+    R = np.array([
+        [cos_a,  0, sin_a],
+        [0,      1, 0],
+        [-sin_a, 0, cos_a]
+    ])
+
+    return R
+
+
+def projection_matrix(camera_angle):
+    """
+    Rotation and orthographic projection as one (2, 3) matrix.
+
+    Args:
+        camera_angle: Camera angle in degrees
+
+    Returns:
+        2x3 matrix mapping (X, Y, Z) to screen-oriented world (X, Y)
+    """
+    # Only X and Y survive the projection, so rotate into those two rows only
+    R = get_rotation_matrix(camera_angle)[:2]
+
+    # Mirror X: SMPL-H +X = anatomical right, but screen convention when
+    # viewing face-on requires flipping so the character's right → screen-left.
+    # Without this, front-view exercises are mirrored and side-view arm
+    # directions are inverted.
+    R[0] *= -1
+
+    return R
+
+
+def camera_matrix(camera_angle, elevation=0.0):
+    """
+    Camera rotation as one (3, 3) matrix: yaw, the screen X mirror, then pitch.
+
+    Args:
+        camera_angle: Camera angle in degrees
+        elevation: Camera pitch in degrees (positive = above, looking down)
+
+    Returns:
+        3x3 matrix mapping (X, Y, Z) to (screen X, screen Y, depth towards
+        the camera); its first two rows equal projection_matrix() at
+        elevation 0
+    """
+    R = get_rotation_matrix(camera_angle)
+    R[0] *= -1  # Same mirror as projection_matrix()
+
+    pitch = np.radians(elevation)
+    cos_p = np.cos(pitch)
+    sin_p = np.sin(pitch)
+    P = np.array([
+        [1, 0,      0],
+        [0, cos_p, -sin_p],
+        [0, sin_p,  cos_p]
+    ])
+
+    return P @ R
+
+
+def camera_settings(config: Dict, movement_pattern: str) -> Dict:
+    """
+    Camera model for a movement pattern from config.
+
+        "camera": {"models": {"squat": "perspective", "default": "orthographic"},
+                   "perspective": {"focal_length": 35, "distance": null, "elevation": 10}}
+
+    A models entry is a model name or a dictionary with "model" plus
+    perspective overrides for that pattern.
+
+    Args:
+        config: Pipeline configuration
+        movement_pattern: Exercise movement pattern (e.g. "squat")
+
+    Returns:
+        {"model": "orthographic"}, or the perspective model with
+        focal_length, distance and elevation filled in
+
+    Raises:
+        ValueError: If the model is unknown or the focal length/distance isn't positive
+    """
+    camera = config.get('camera', {})
+    models = camera.get('models', {})
+    choice = models.get(movement_pattern, models.get('default', 'orthographic'))
+    if isinstance(choice, str):
+        choice = {'model': choice}
+
+    model = choice.get('model', 'orthographic')
+    if model not in CAMERA_MODELS:
+        raise ValueError(f"Unknown camera model {model!r} (expected one of {', '.join(CAMERA_MODELS)})")
+    if model == 'orthographic':
+        return {'model': model}
+
+    settings = dict(DEFAULT_PERSPECTIVE, **camera.get('perspective', {}))
+    settings.update((key, value) for key, value in choice.items() if key != 'model')
+    if settings['focal_length'] <= 0 or (settings['distance'] is not None and settings['distance'] <= 0):
+        raise ValueError("camera focal_length and distance must be positive")
+    return dict(settings, model=model)
+
+
+def describe_camera(camera: Optional[Dict]) -> str:
+    """One-line camera model summary for progress output."""
+    if not camera or camera['model'] == 'orthographic':
+        return "orthographic"
+    distance = f", {camera['distance']:g} units away" if camera['distance'] is not None else ""
+    return f"perspective {camera['focal_length']:g} mm{distance}, {camera['elevation']:g}° elevation"
+
+
+def orthographic_projection(points_3d, camera_angle):
+    """
+    Apply orthographic projection with camera rotation.
+
+    Args:
+        points_3d: (..., 3) array of 3D points (X, Y, Z) - one frame (J, 3)
+                   or a whole clip (T, J, 3)
+        camera_angle: Camera angle in degrees
+
+    Returns:
+        (..., 2) array of 2D points (X, Y) in world coordinates
+    """
+    return points_3d @ projection_matrix(camera_angle).T  # (..., 2)
+
+
+def perspective_placement(lo, hi, camera):
+    """
+    Where the perspective camera stands for a clip.
+
+    It aims at the centre of the clip's 3D bounding box (all frames), from
+    camera['distance'] or, if that is None, from the distance at which the
+    focal length frames the clip's largest extent.
+
+    Args:
+        lo: (3,) minimum XYZ over the whole clip
+        hi: (3,) maximum XYZ over the whole clip
+        camera: Perspective camera_settings()
+
+    Returns:
+        ((3,) target point, distance from it)
+    """
+    lo, hi = np.asarray(lo, dtype=np.float64), np.asarray(hi, dtype=np.float64)
+    distance = camera['distance']
+    if distance is None:
+        distance = camera['focal_length'] / SENSOR_HEIGHT_MM * max((hi - lo).max(), 1e-6)
+    return (lo + hi) / 2, distance
+
+
+def _perspective(motion_3d, view_T, camera, placement=None):
+    """
+    Pinhole projection of a whole clip with a fixed camera.
+
+    Points are scaled by distance / depth and shifted back, so points level
+    with the target keep their orthographic position.
+
+    Args:
+        motion_3d: (T, J, 3) motion
+        view_T: Transposed camera_matrix(), (3, 3), or (A, 1, 3, 3) for A angles
+        camera: Perspective camera_settings()
+        placement: perspective_placement() of the whole clip (default: from
+                   motion_3d, which must then be the whole clip)
+
+    Returns:
+        (T, J, 2), or (A, T, J, 2), projected points
+
+    Raises:
+        ValueError: If a joint is (nearly) at or behind the camera
+    """
+    if placement is None:
+        flat = motion_3d.reshape(-1, 3)
+        placement = perspective_placement(flat.min(axis=0), flat.max(axis=0), camera)
+    center, distance = placement
+
+    view = (motion_3d - center) @ view_T  # (..., T, J, 3)
+    depth = distance - view[..., 2:]
+    if depth.min() <= MIN_DEPTH_FRACTION * distance:
+        raise ValueError(f"Camera {distance:.2f} units away is inside the motion; increase camera distance")
+
+    return view[..., :2] * (distance / depth) + (center[np.newaxis] @ view_T)[..., :2]
+
+
+def perspective_projection(points_3d, camera_angle, camera, placement=None):
+    """
+    Apply perspective projection with camera rotation and elevation.
+
+    Without a placement the camera is placed from the array itself, so pass
+    a whole clip, not one frame at a time.
+
+    Args:
+        points_3d: (T, J, 3) array of 3D points
+        camera_angle: Camera angle in degrees
+        camera: Perspective camera_settings()
+        placement: perspective_placement() of the whole clip, when projecting
+                   part of it
+
+    Returns:
+        (T, J, 2) array of 2D points (X, Y) in world coordinates
+    """
+    return _perspective(points_3d, camera_matrix(camera_angle, camera['elevation']).T, camera, placement)
+
+
+def camera_projection(points_3d, camera_angle, camera: Optional[Dict] = None, placement=None):
+    """
+    Project with the configured camera model (orthographic if camera is None).
+
+    Args:
+        points_3d: (T, J, 3) array of 3D points
+        camera_angle: Camera angle in degrees
+        camera: camera_settings() for the exercise
+        placement: perspective_placement() of the whole clip, when projecting
+                   part of it (perspective only)
+
+    Returns:
+        (T, J, 2) array of 2D points (X, Y) in world coordinates
+    """
+    if camera and camera['model'] == 'perspective':
+        return perspective_projection(points_3d, camera_angle, camera, placement)
+    return orthographic_projection(points_3d, camera_angle)
+
+
+def bounding_box(points_2d):
+    """
+    Bounding box of already-projected points.
+
+    Args:
+        points_2d: (..., 2) array of 2D points, e.g. a projected (T, J, 2) clip
+
+    Returns:
+        Dictionary with min/max for X and Y, and Y baseline
+    """
+    flat = points_2d.reshape(-1, 2)  # (T*J, 2)
+    min_x, min_y = flat.min(axis=0)
+    max_x, max_y = flat.max(axis=0)
+
+    return {
+        'min_x': min_x,
+        'max_x': max_x,
+        'min_y': min_y,
+        'max_y': max_y,
+        'width': max_x - min_x,
+        'height': max_y - min_y,
+        # Y baseline: lowest point (feet) across all frames
+        'y_baseline': min_y,
+    }
+
+
+@traced("bbox", "step")
+def calculate_global_bounding_box(frames_3d, camera_angle, camera: Optional[Dict] = None):
+    """
+    Calculate bounding box across ALL frames (CRITICAL for stability).
+
+    project_motion_sequence() reuses its own projection instead; this is for
+    callers that only need the box.
+
+    Args:
+        frames_3d: (T, J, 3) - T frames, J joints, XYZ coordinates
+        camera_angle: Camera angle in degrees
+        camera: camera_settings() (default: orthographic)
+
+    Returns:
+        Dictionary with min/max for X and Y, and Y baseline
+    """
+    return bounding_box(camera_projection(frames_3d, camera_angle, camera))
+
+
+def unit_box(points_2d, bbox):
+    """
+    Map projected world points into the unit box of their bounding box.
+
+    The bbox center goes to (0, 0), its longer side spans 1 and Y is flipped
+    (screen Y goes down, 3D Y goes up), so every frame fits in
+    [-0.5, 0.5] x [-0.5, 0.5] with the aspect ratio kept.
+
+    Args:
+        points_2d: (..., 2) array of 2D points
+        bbox: Bounding box dictionary
+
+    Returns:
+        (..., 2) array of unit-box coordinates
+    """
+    extent = max(bbox['width'], bbox['height'])
+    if extent == 0:
+        print("  ⚠ Warning: Zero-size bounding box, using default scale")
+        extent = 1.0
+
+    center = np.array([
+        (bbox['min_x'] + bbox['max_x']) / 2,
+        (bbox['min_y'] + bbox['max_y']) / 2,
+    ])
+    return (points_2d - center) * np.array([1.0, -1.0]) / extent
+
+
+def canvas_padding(config: Dict) -> float:
+    """Padding per side as a fraction of the canvas (config canvas.padding)."""
+    return config['canvas'].get('padding', DEFAULT_PADDING)
+
+
+def to_canvas(motion_unit, canvas_size, padding_percent=DEFAULT_PADDING):
+    """
+    Map unit-box coordinates to pixels (render time).
+
+    Args:
+        motion_unit: (..., 2) unit-box coordinates from stage 03
+        canvas_size: Canvas width/height in pixels
+        padding_percent: Padding as fraction of canvas (default 15%)
+
+    Returns:
+        (..., 2) array of screen coordinates (0, 0) = top-left
+    """
+    padding = int(canvas_size * padding_percent)
+    usable_size = canvas_size - 2 * padding
+    return motion_unit * usable_size + canvas_size / 2
+
+
+def normalize_to_canvas(points_2d, bbox, canvas_size, padding_percent=DEFAULT_PADDING):
+    """
+    Normalize 2D points to fit canvas with padding and Y-axis flip.
+
+    Args:
+        points_2d: (..., 2) array of 2D points
+        bbox: Bounding box dictionary
+        canvas_size: Canvas width/height in pixels
+        padding_percent: Padding as fraction of canvas (default 15%)
+
+    Returns:
+        (..., 2) array of screen coordinates (0, 0) = top-left
+    """
+    return to_canvas(unit_box(points_2d, bbox), canvas_size, padding_percent)
+
+
+def projection_meta(bbox, camera_angle, shape, loop: Optional[Dict] = None,
+                    camera: Optional[Dict] = None, tempo: Optional[Dict] = None,
+                    fps: Optional[float] = None) -> Dict:
+    """
+    Sidecar metadata for a unit-box projection.
+
+    unit = (world - center) * (1, -1) * scale, and a renderer maps
+    pixel = unit * (canvas - 2 * padding_px) + canvas / 2.
+
+    Args:
+        bbox: World-space bounding box of the projection
+        camera_angle: Camera angle in degrees
+        shape: Shape of the saved (T, J, 2) array
+        loop: Loop cycle from find_loop() (None when loop extraction is off)
+        camera: camera_settings() used (default: orthographic)
+        tempo: Retiming from normalize_tempo() (None when tempo normalization is off)
+        fps: Frame rate of the motion file (frame_rate.motion_fps())
+
+    Returns:
+        JSON-serialisable dictionary
+    """
+    extent = max(bbox['width'], bbox['height'])
+    return {
+        'format': PROJECTION_FORMAT,
+        'fps': fps,
+        'camera_angle': camera_angle,
+        'camera': camera or {'model': 'orthographic'},
+        'frames': int(shape[0]),
+        'joints': int(shape[1]),
+        'bbox': {key: float(value) for key, value in bbox.items()},
+        'center': [float((bbox['min_x'] + bbox['max_x']) / 2), float((bbox['min_y'] + bbox['max_y']) / 2)],
+        'scale': float(1.0 / extent) if extent else 1.0,
+        'loop': loop,
+        'tempo': tempo,
+    }
+
+
+def meta_path(projected_file) -> Path:
+    """projected/<slug>.json next to projected/<slug>.npy (or .npq)."""
+    return Path(projected_file).with_suffix('.json')
+
+
+def storage_settings(config: Dict) -> Dict:
+    """
+    projected/ file format from config.
+
+        "projection": {"storage": "compact", "compact": {"codec": "lzma", "steps_per_unit": 8192}}
+
+    Args:
+        config: Pipeline configuration
+
+    Returns:
+        Dictionary with storage ("npy" or "compact"), suffix, codec and steps_per_unit
+
+    Raises:
+        ValueError: If projection.storage is not a known format
+    """
+    projection = config.get('projection', {})
+    storage = projection.get('storage', 'npy')
+    if storage not in STORAGE_SUFFIXES:
+        raise ValueError(f"Unknown projection.storage {storage!r} (expected one of {', '.join(STORAGE_SUFFIXES)})")
+    compact = projection.get('compact', {})
+    return {
+        'storage': storage,
+        'suffix': STORAGE_SUFFIXES[storage],
+        'codec': compact.get('codec', DEFAULT_CODEC),
+        'steps_per_unit': compact.get('steps_per_unit', DEFAULT_STEPS_PER_UNIT),
+    }
+
+
+def stream_settings(config: Dict) -> Dict:
+    """
+    Chunked projection settings from config.
+
+        "projection": {"stream": {"min_frames": 18000, "chunk_frames": 4096}}
+
+    Args:
+        config: Pipeline configuration
+
+    Returns:
+        Dictionary with min_frames (clips this long are streamed) and chunk_frames
+    """
+    return dict(DEFAULT_STREAM, **config.get('projection', {}).get('stream', {}))
+
+
+def find_projected(projected_dir, slugs: Optional[Iterable[str]] = None) -> List[Path]:
+    """
+    Projected files in a directory, one per slug, in slug order.
+
+    Stage 03 removes the other format's file when it writes one, so a slug
+    normally has a single file; if both exist the newer one wins.
+
+    Args:
+        projected_dir: Directory of .npy/.npq projections
+        slugs: Only these slugs, without globbing the directory (watch mode)
+
+    Returns:
+        Paths sorted by slug
+    """
+    projected_dir = Path(projected_dir)
+    if slugs is not None:
+        candidates = [projected_dir / f"{slug}{suffix}" for slug in slugs for suffix in STORAGE_SUFFIXES.values()]
+        candidates = [path for path in candidates if path.exists()]
+    else:
+        candidates = [path for suffix in STORAGE_SUFFIXES.values() for path in projected_dir.glob(f"*{suffix}")]
+
+    by_slug = {}
+    for path in candidates:
+        current = by_slug.get(path.stem)
+        if current is None or path.stat().st_mtime > current.stat().st_mtime:
+            by_slug[path.stem] = path
+    return [by_slug[slug] for slug in sorted(by_slug)]
+
+
+def load_projection_meta(projected_file) -> Dict:
+    """
+    Read the sidecar of a unit-box projection written by stage 03.
+
+    Args:
+        projected_file: Path to projected/<slug>.npy or .npq
+
+    Returns:
+        Sidecar dictionary (format, bbox, scale, loop, ...)
+
+    Raises:
+        ValueError: If the file is from before the unit-box format (re-run stage 03)
+    """
+    try:
+        with open(meta_path(projected_file)) as f:
+            meta = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        meta = {}
+    if meta.get('format') != PROJECTION_FORMAT:
+        raise ValueError(f"{Path(projected_file).name} is not a {PROJECTION_FORMAT} projection; re-run stage 03")
+    return meta
+
+
+def load_projected(projected_file) -> np.ndarray:
+    """
+    Load a unit-box projection written by stage 03.
+
+    Args:
+        projected_file: Path to projected/<slug>.npy, or a compact .npq
+
+    Returns:
+        (T, J, 2) unit-box coordinates (float32 for .npq)
+
+    Raises:
+        ValueError: If the file is from before the unit-box format (re-run stage 03)
+    """
+    load_projection_meta(projected_file)
+    if Path(projected_file).suffix == COMPACT_SUFFIX:
+        return load_compact(projected_file)
+    return np.load(projected_file)
+
+
+@traced("projection", "step")
+def project_motion_unit(motion_3d, camera_angle, camera: Optional[Dict] = None):
+    """
+    Project entire motion sequence into the unit box of its global bounding box.
+
+    The clip is projected once as a single (T, J, 3) array; the global
+    bounding box and the unit-box fit both reuse that projection.
+
+    Args:
+        motion_3d: (T, J, 3) - T frames, J joints, XYZ
+        camera_angle: Camera angle in degrees
+        camera: camera_settings() (default: orthographic)
+
+    Returns:
+        ((T, J, 2) unit-box coordinates, world-space bounding box)
+    """
+    points_2d = camera_projection(motion_3d, camera_angle, camera)  # (T, J, 2)
+
+    # CRITICAL: Calculate global bounding box across ALL frames
+    with span("bbox"):
+        bbox = bounding_box(points_2d)
+
+    # Normalize every frame using the GLOBAL bounding box
+    return unit_box(points_2d, bbox), bbox
+
+
+def project_motion_sequence(motion_3d, camera_angle, canvas_size, padding_percent=DEFAULT_PADDING,
+                            camera: Optional[Dict] = None):
+    """
+    Project entire motion sequence with global normalization, in pixels.
+
+    Args:
+        motion_3d: (T, J, 3) - T frames, J joints, XYZ
+        camera_angle: Camera angle in degrees
+        canvas_size: Canvas size in pixels
+        padding_percent: Padding as fraction of canvas (default 15%)
+        camera: camera_settings() (default: orthographic)
+
+    Returns:
+        (T, J, 2) - Projected and normalized 2D coordinates
+    """
+    motion_unit, bbox = project_motion_unit(motion_3d, camera_angle, camera)
+    return to_canvas(motion_unit, canvas_size, padding_percent), bbox
+
+
+@traced("projection (angles)", "step")
+def project_motion_angles(motion_3d, camera_angles, camera: Optional[Dict] = None):
+    """
+    Project a motion sequence at several camera angles in one batched pass.
+
+    Each angle gets its own global bounding box and unit-box fit, exactly as
+    project_motion_unit() would give it, so any slice can be saved as that
+    angle's projection.
+
+    Args:
+        motion_3d: (T, J, 3) - T frames, J joints, XYZ
+        camera_angles: A camera angles in degrees
+        camera: camera_settings() (default: orthographic)
+
+    Returns:
+        ((A, T, J, 2) unit-box coordinates, list of A bounding boxes)
+    """
+    # (A, 1, 3, 2) against (1, T, J, 3): every angle in one matmul
+    if camera and camera['model'] == 'perspective':
+        R = np.stack([camera_matrix(angle, camera['elevation']) for angle in camera_angles])
+        points_2d = _perspective(motion_3d, R.transpose(0, 2, 1)[:, np.newaxis], camera)  # (A, T, J, 2)
+    else:
+        R = np.stack([projection_matrix(angle) for angle in camera_angles])
+        points_2d = motion_3d[np.newaxis] @ R.transpose(0, 2, 1)[:, np.newaxis]  # (A, T, J, 2)
+
+    flat = points_2d.reshape(len(camera_angles), -1, 2)
+    mins, maxs = flat.min(axis=1), flat.max(axis=1)  # (A, 2)
+    sizes = maxs - mins
+    bboxes = [
+        {
+            'min_x': lo[0], 'max_x': hi[0], 'min_y': lo[1], 'max_y': hi[1],
+            'width': size[0], 'height': size[1], 'y_baseline': lo[1],
+        }
+        for lo, hi, size in zip(mins, maxs, sizes)
+    ]
+
+    # Same fit as unit_box(), with per-angle center and extent
+    extent = sizes.max(axis=1)
+    if (extent == 0).any():
+        print("  ⚠ Warning: Zero-size bounding box, using default scale")
+        extent = np.where(extent == 0, 1.0, extent)
+
+    center = (mins + maxs) / 2
+    normalized = (points_2d - center[:, np.newaxis, np.newaxis]) * np.array([1.0, -1.0])
+    normalized /= extent[:, np.newaxis, np.newaxis, np.newaxis]
+
+    return normalized, bboxes
+
+
+def visualize_projection(slug, motion_2d, bbox, canvas_size, sample_frames=5):
+    """
+    Print ASCII visualization of projection (optional preview).
+
+    Args:
+        slug: Exercise slug
+        motion_2d: (T, J, 2) projected coordinates
+        bbox: Bounding box info
+        canvas_size: Canvas size
+        sample_frames: Number of frames to show
+    """
+    num_frames = motion_2d.shape[0]
+    frame_indices = np.linspace(0, num_frames - 1, sample_frames, dtype=int)
+
+    print(f"\n  Preview of {slug} (showing {sample_frames} frames):")
+    print(f"  Global bbox: {bbox['width']:.2f}x{bbox['height']:.2f} units")
+    print(f"  Y baseline: {bbox['y_baseline']:.2f}")
+    print()
+
+    for frame_idx in frame_indices:
+        frame_2d = motion_2d[frame_idx]
+
+        # Create simple ASCII visualization
+        grid_size = 40
+        grid = [[' ' for _ in range(grid_size)] for _ in range(grid_size)]
+
+        # Map points to grid
+        for point in frame_2d:
+            x = int(point[0] / canvas_size * grid_size)
+            y = int(point[1] / canvas_size * grid_size)
+
+            # Clamp to grid bounds
+            x = max(0, min(grid_size - 1, x))
+            y = max(0, min(grid_size - 1, y))
+
+            grid[y][x] = '●'
+
+        # Print grid
+        print(f"  Frame {frame_idx + 1}/{num_frames}:")
+        print("  +" + "-" * grid_size + "+")
+        for row in grid:
+            print("  |" + "".join(row) + "|")
+        print("  +" + "-" * grid_size + "+")
+        print()
+
+
+def print_camera(task):
+    """Print the exercise's camera angle and model."""
+    if not task['in_manifest']:
+        print(f"  ⚠ Warning: {task['slug']} not in manifest, using default angle")
+
+    camera_angle = task['camera_angle']
+    angle_name = {0: 'front', 45: '3/4 front', 90: 'side', 135: '3/4 back'}.get(
+        camera_angle, f'{camera_angle}°'
+    )
+    print(f"  Camera: {angle_name} ({camera_angle}°), {describe_camera(task['camera'])}")
+
+
+def project_exercise_streamed(task, result, start):
+    """
+    Streamed branch of project_exercise(): chunked projection straight to disk.
+
+    Args:
+        task: project_exercise() task with stream = frames per chunk
+        result: project_exercise() result, filled in here
+        start: perf_counter() at the start of the task
+
+    Returns:
+        The result dictionary
+    """
+    # Imported here: streaming.py builds on this module
+    from .streaming import project_motion_streamed
+
+    output_file = task['output_file']
+    print_camera(task)
+    print(f"  Streaming in chunks of {task['stream']} frames")
+    bbox, shape = project_motion_streamed(task['motion_file'], output_file, task['camera_angle'],
+                                          task['camera'], task['smoothing'], task['stream'])
+    print(f"  Motion: {shape[0]} frames, {shape[1]} joints")
+    print(f"  Projected: {bbox['width']:.1f}x{bbox['height']:.1f} units (unit box)")
+
+    if task['tempo']['enabled']:
+        result['tempo'] = {'retimed': False, 'reason': "streamed projection"}
+        print(f"  Tempo: {describe_tempo(result['tempo'])}")
+    if task['loop'] is not None:
+        result['loop'] = {'looped': False, 'reason': "streamed projection"}
+        print(f"  Loop: {describe_loop(result['loop'])}")
+
+    with atomic_write(meta_path(output_file), "w") as f:
+        json.dump(projection_meta(bbox, task['camera_angle'], shape, result['loop'], task['camera'],
+                                  result['tempo'], task['fps']), f, indent=2)
+    for suffix in STORAGE_SUFFIXES.values():
+        if suffix != output_file.suffix:
+            output_file.with_suffix(suffix).unlink(missing_ok=True)
+    print(f"  ✓ Saved {output_file.name} (+ {meta_path(output_file).name})")
+
+    if task['preview']:
+        print("  (No preview for streamed clips)")
+
+    result['ok'] = True
+    result['source_frames'] = result['frames'] = shape[0]
+    result['duration_ms'] = (time.perf_counter() - start) * 1000
+    result['peak_rss'] = peak_rss()
+    print(f"  Peak RSS: {format_bytes(result['peak_rss'])}")
+    return result
+
+
+@traced_task("project")
+def project_exercise(task):
+    """
+    Project one exercise and save it (runs inline or in a pool worker).
+
+    Args:
+        task: Dictionary with slug, motion_file, fps, output_file, camera_angle,
+              camera (camera_settings()), in_manifest, inputs, storage (storage_settings()),
+              smoothing (smoothing_settings()), tempo (tempo_settings()),
+              loop (loop_settings(), or None when off), the last three
+              timed at the motion file's fps,
+              canvas_size and padding (preview and contact sheet only),
+              preview, a progress label, stream (frames per chunk, or
+              None to project in memory),
+              project (whether the projection is stale) and, for contact
+              sheets, sheet_file, sheet_angles and config
+
+    Returns:
+        Dictionary with slug, ok flag, camera_angle, inputs, motion_file,
+        output_file, source_frames, frames (after retiming), project, loop, tempo, sheet_ok, duration_ms,
+        peak_rss and error (if any)
+    """
+    start = time.perf_counter()
+    reset_peak()
+    slug = task['slug']
+    camera_angle = task['camera_angle']
+    canvas_size = task['canvas_size']
+    padding = task['padding']
+    output_file = task['output_file']
+    result = {
+        'slug': slug,
+        'ok': False,
+        'camera_angle': camera_angle,
+        'inputs': task['inputs'],
+        'motion_file': task['motion_file'],
+        'output_file': output_file,
+        'source_frames': 0,
+        'frames': 0,
+        'project': task['project'],
+        'loop': None,
+        'tempo': None,
+        'sheet_ok': False,
+    }
+    sheet_file = task.get('sheet_file')
+
+    print(task['label'])
+
+    try:
+        if task.get('stream'):
+            return project_exercise_streamed(task, result, start)
+
+        # Load motion data
+        with span("load npy"):
+            motion_3d = np.load(task['motion_file'])  # Expected: (T, J, 3)
+
+        # Validate shape
+        if motion_3d.ndim != 3 or motion_3d.shape[2] != 3:
+            raise ValueError(f"Invalid shape {motion_3d.shape}, expected (T, J, 3)")
+
+        num_frames, num_joints = motion_3d.shape[0], motion_3d.shape[1]
+        print(f"  Motion: {num_frames} frames, {num_joints} joints @ {task['fps']}fps")
+
+        print_camera(task)
+
+        # Filter jitter before the bounding box and projection
+        if task['smoothing']['enabled']:
+            with span("smoothing"):
+                motion_3d = smooth_motion(motion_3d, task['smoothing'])
+            print(f"  Smoothed: {task['smoothing']['method']}")
+
+        # One rep at the movement pattern's target duration
+        if task['tempo']['enabled']:
+            with span("tempo"):
+                motion_3d, result['tempo'] = normalize_tempo(motion_3d, task['tempo'])
+            print(f"  Tempo: {describe_tempo(result['tempo'])}")
+
+        # Project to 2D with global bounding box
+        if sheet_file is not None:
+            angles = task['sheet_angles']
+            motion_by_angle, bboxes = project_motion_angles(motion_3d, angles, task['camera'])
+            current = angles.index(camera_angle)
+            motion_unit, bbox = motion_by_angle[current], bboxes[current]
+            print(f"  Angles: {', '.join(f'{a}°' for a in angles)} (one pass)")
+        else:
+            motion_unit, bbox = project_motion_unit(motion_3d, camera_angle, task['camera'])
+
+        print(f"  Projected: {bbox['width']:.1f}x{bbox['height']:.1f} units")
+        print(f"  Normalized to unit box (pixels are mapped at render time)")
+
+        # Find one clean cycle for the renderers
+        if task['project'] and task['loop'] is not None:
+            with span("loop"):
+                result['loop'] = find_loop(motion_unit, task['loop'])
+            print(f"  Loop: {describe_loop(result['loop'])}")
+
+        # Save projected data and its bbox/scale sidecar (atomically, so a
+        # killed run leaves no partial file)
+        if task['project']:
+            with span("save npy"):
+                storage = task['storage']
+                with atomic_write(output_file) as f:
+                    if storage['storage'] == 'compact':
+                        save_compact(f, motion_unit, storage['steps_per_unit'], storage['codec'])
+                    else:
+                        np.save(f, motion_unit)
+                with atomic_write(meta_path(output_file), "w") as f:
+                    json.dump(projection_meta(bbox, camera_angle, motion_unit.shape, result['loop'],
+                                              task['camera'], result['tempo'], task['fps']), f, indent=2)
+                # A file left in the other format would shadow this one for 04/05
+                for suffix in STORAGE_SUFFIXES.values():
+                    if suffix != output_file.suffix:
+                        output_file.with_suffix(suffix).unlink(missing_ok=True)
+            print(f"  ✓ Saved {output_file.name} (+ {meta_path(output_file).name})")
+
+        # Optional preview
+        if task['preview']:
+            visualize_projection(slug, to_canvas(motion_unit, canvas_size, padding), bbox, canvas_size)
+
+        result['ok'] = True
+        result['source_frames'] = num_frames
+        result['frames'] = len(motion_unit)
+
+        if sheet_file is not None:
+            # Imported here so plain projection runs don't load Pillow
+            from .contact_sheet import render_contact_sheet
+
+            with span("contact sheet"):
+                sheet = render_contact_sheet(to_canvas(motion_by_angle, canvas_size, padding), angles,
+                                             canvas_size, task['config'], camera_angle)
+                with atomic_write(sheet_file) as f:
+                    sheet.save(f, format='PNG')
+            print(f"  ✓ Saved contact sheet {sheet_file.name}")
+            result['sheet_ok'] = True
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        result['error'] = str(e)
+        import traceback
+        traceback.print_exc()
+
+    result['duration_ms'] = (time.perf_counter() - start) * 1000
+    result['peak_rss'] = peak_rss()
+    print(f"  Peak RSS: {format_bytes(result['peak_rss'])}")
+    return result
+
+
+def stream_fraction(task: Dict) -> float:
+    """Share of a task's input held in memory at once (1.0 unless streamed)."""
+    if not task.get('stream') or not task['frames']:
+        return 1.0
+    return min(1.0, 2 * task['stream'] / task['frames'])
+
+
+@traced("stage 03")
+def run(
+    config: Dict,
+    manifest: Dict,
+    motion_dir: Optional[Path] = None,
+    output_dir: Optional[Path] = None,
+    limit: Optional[int] = None,
+    force: bool = False,
+    jobs: int = 1,
+    preview: bool = False,
+    graph: Optional[BuildGraph] = None,
+    catalog: Optional[Catalog] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    claim: bool = False,
+    slugs: Optional[Iterable[str]] = None,
+    max_memory: Optional[int] = None,
+    contact_sheets: bool = False,
+    sheet_dir: Optional[Path] = None,
+    stream: bool = False,
+) -> Dict:
+    """
+    Project every motion file to 2D.
+
+    Args:
+        config: Parsed pipeline configuration
+        manifest: Parsed source manifest (camera angles, movement patterns)
+        motion_dir: Directory of 3D .npy files (default: motion_data/)
+        output_dir: Directory for projected .npy/.npq files (default: projected/)
+        limit: Only process the first N files
+        force: Re-project even if inputs are unchanged
+        jobs: Worker processes (0 = all cores)
+        preview: Print an ASCII preview of each projection
+        graph: Build graph to use (default: the pipeline's .build_graph.json)
+        catalog: Artifact catalog to record results in (default: pipeline.db)
+        shard: (index, count) - only process slugs in this shard
+        claim: Claim each slug through a lock file before projecting it
+        slugs: Only these slugs, without globbing the directory (watch mode)
+        max_memory: RAM budget in bytes: cap workers to fit (default: no budget)
+        contact_sheets: Also project every candidate angle and draw a contact sheet
+        sheet_dir: Directory for contact sheet PNGs (default: output/contact_sheets/)
+        stream: Stream every clip through memory-mapped chunks (default: only
+                clips of projection.stream.min_frames or more, and with
+                max_memory, clips whose in-memory projection doesn't fit)
+
+    Returns:
+        Dictionary with total, processed, skipped, claimed_elsewhere,
+        errors and contact_sheets counts
+    """
+    stats = {"total": 0, "processed": 0, "skipped": 0, "claimed_elsewhere": 0, "errors": 0, "contact_sheets": 0}
+    canvas_size = config['canvas']['width']
+    exercises = manifest['exercises']
+
+    # Setup directories
+    motion_data_dir = Path(motion_dir) if motion_dir else PIPELINE_ROOT / "motion_data"
+    output_dir = Path(output_dir) if output_dir else PIPELINE_ROOT / "projected"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    sheet_dir = Path(sheet_dir) if sheet_dir else PIPELINE_ROOT / "output" / "contact_sheets"
+    if contact_sheets:
+        from .contact_sheet import candidate_angles
+        sheet_dir.mkdir(parents=True, exist_ok=True)
+        sheet_config_hash = hash_value(config_subset(config, SHEET_CONFIG_KEYS))
+
+    # Mirrored left/right variants get their motion from the source first
+    derived = derive_variants(config, exercises, motion_data_dir, force=force, slugs=slugs,
+                              graph=graph, catalog=catalog)
+    if slugs is not None:
+        slugs = sorted(set(slugs) | set(derived))
+
+    # Find motion data files
+    if slugs is not None:
+        motion_files = sorted(path for path in (motion_data_dir / f"{slug}.npy" for slug in slugs) if path.exists())
+    else:
+        motion_files = sorted(motion_data_dir.glob("*.npy"))
+
+    if not motion_files:
+        print(f"\n❌ No .npy files found in {motion_data_dir}")
+        print("   Run motion generation on RunPod first.")
+        return stats
+
+    print(f"✓ Found {len(motion_files)} motion files")
+
+    if shard is not None:
+        motion_files = select_shard(motion_files, shard, key=lambda path: path.stem)
+        print(f"  (Shard {shard[0]}/{shard[1]}: {len(motion_files)} files)")
+
+    if limit:
+        motion_files = motion_files[:limit]
+        print(f"  (Limited to {limit} files for testing)")
+
+    # Process each motion file
+    print("\n" + "=" * 60)
+    print("Processing Motion Data")
+    print("=" * 60 + "\n")
+
+    processed_count = 0
+    skipped_count = 0
+    claimed_elsewhere = 0
+    error_count = 0
+    sheet_count = 0
+    camera_angles_used = []
+    looped_count = 0
+    retimed_count = 0
+
+    if graph is None:
+        graph = BuildGraph()
+    if catalog is None:
+        catalog = Catalog()
+    catalog.sync_exercises(exercises)
+    config_hash = hash_value(config_subset(config, CONFIG_KEYS))
+    storage = storage_settings(config)
+    loop = loop_settings(config)
+    loop_hash = hash_value(loop)
+    smoothing = smoothing_settings(config)
+    streaming = stream_settings(config)
+    tasks = []
+
+    for idx, motion_file in enumerate(motion_files, 1):
+        slug = motion_file.stem
+        output_file = output_dir / f"{slug}{storage['suffix']}"
+
+        # Get camera angle from manifest
+        in_manifest = slug in exercises
+        if in_manifest:
+            camera_angle = exercises[slug]['camera_angle']
+        else:
+            camera_angle = config['camera_angles']['default']
+        movement_pattern = exercises.get(slug, {}).get('movement_pattern', 'unknown')
+        camera = camera_settings(config, movement_pattern)
+        tempo = tempo_settings(config, movement_pattern)
+        fps = motion_fps(motion_file, config['rendering']['source_fps'])
+
+        inputs = {
+            "motion": hash_file(motion_file),
+            "fps": hash_value(fps),
+            "camera_angle": hash_value(camera_angle),
+            "camera": hash_value(camera),
+            "config": config_hash,
+            "format": PROJECTION_FORMAT,
+            "loop": loop_hash,
+            "smoothing": hash_value(smoothing),
+            "tempo": hash_value(tempo),
+        }
+
+        sheet = {}
+        if contact_sheets:
+            sheet_angles = candidate_angles(config, camera_angle)
+            sheet_inputs = dict(inputs, angles=hash_value(sheet_angles), config=sheet_config_hash)
+            sheet_file = sheet_dir / f"{slug}.png"
+            if force or graph.is_stale("03-sheet", slug, sheet_inputs, [sheet_file]):
+                sheet = {'sheet_file': sheet_file, 'sheet_angles': sheet_angles,
+                         'sheet_inputs': sheet_inputs, 'config': config}
+
+        # Long clips are projected in chunks; compact storage and contact
+        # sheets need the whole clip in memory
+        frames = npy_frame_count(motion_file)
+        streamed = storage['storage'] == 'npy' and not sheet and (
+            stream or frames >= streaming['min_frames'] or (
+                max_memory is not None
+                and estimate_task_bytes(input_size(motion_file), factor=6.0) > max_memory
+            )
+        )
+        if streamed:
+            # No loop extraction or retiming when streamed, so switching modes re-projects
+            inputs["streamed"] = True
+
+        # Skip if inputs unchanged since the last successful projection
+        project = force or graph.is_stale("03", slug, inputs, [output_file, meta_path(output_file)])
+        if not project:
+            if catalog.get(slug, "projected") is None:
+                # Built before the catalog existed
+                catalog.record(slug, "motion", path=motion_file, hash=inputs["motion"])
+                catalog.record(slug, "projected", path=output_file, camera_angle=camera_angle,
+                               source_hash=inputs["motion"])
+            if not sheet:
+                print(f"[{idx}/{len(motion_files)}] {slug} - SKIP (up to date)")
+                skipped_count += 1
+                continue
+
+        tasks.append({
+            'label': f"[{idx}/{len(motion_files)}] {slug}",
+            'slug': slug,
+            'motion_file': motion_file,
+            'output_file': output_file,
+            'camera_angle': camera_angle,
+            'camera': camera,
+            'in_manifest': in_manifest,
+            'inputs': inputs,
+            'canvas_size': canvas_size,
+            'padding': canvas_padding(config),
+            'storage': storage,
+            'fps': fps,
+            # Filter cutoffs, rep durations and loop periods in this file's time base
+            'smoothing': dict(smoothing, source_fps=fps),
+            'tempo': dict(tempo, source_fps=fps),
+            'loop': dict(loop, source_fps=fps) if loop['enabled'] else None,
+            'preview': preview,
+            'project': project,
+            'stream': streaming['chunk_frames'] if streamed else None,
+            'frames': frames,
+            'claim': {"stage": "03"},
+            **sheet,
+        })
+
+    # Longest clips first so the pool doesn't idle on one straggler at the end
+    jobs = resolve_jobs(jobs)
+    if max_memory is not None:
+        # Loaded float32 motion plus float64 rotated/projected/normalized
+        # copies, per candidate angle when drawing a contact sheet; a
+        # streamed clip holds about one chunk of that
+        jobs = budget_jobs(jobs, max_memory, (
+            estimate_task_bytes(input_size(t['motion_file']) * stream_fraction(t),
+                                factor=6.0 * len(t.get('sheet_angles', [0])))
+            for t in tasks
+        ))
+    if jobs > 1:
+        order = {path: rank for rank, path in enumerate(longest_first(t['motion_file'] for t in tasks))}
+        tasks.sort(key=lambda t: order[t['motion_file']])
+        print(f"Running {len(tasks)} exercises on {min(jobs, max(len(tasks), 1))} workers\n")
+
+    by_slug = {t['slug']: t for t in tasks}
+    worker = partial(run_claimed, project_exercise) if claim else project_exercise
+    peak = 0
+    for result, output in run_pool(worker, tasks, jobs):
+        if output:
+            print(output, end='')
+        peak = max(peak, result.get('peak_rss') or 0)
+
+        if result.get('claimed_elsewhere'):
+            claimed_elsewhere += 1
+            continue
+
+        task = by_slug[result['slug']]
+        if result['sheet_ok']:
+            graph.record("03-sheet", result['slug'], task['sheet_inputs'], [task['sheet_file']])
+            catalog.record(result['slug'], "contact_sheet", path=task['sheet_file'],
+                           frame_count=result['frames'], camera_angle=result['camera_angle'],
+                           source_hash=result['inputs']['motion'])
+            sheet_count += 1
+        elif 'sheet_file' in task:
+            catalog.mark_failed(result['slug'], "contact_sheet", result.get('error'), result.get('duration_ms'))
+            if result['ok']:
+                error_count += 1
+
+        if result['ok'] and not result['project']:
+            continue
+        elif result['ok']:
+            graph.record("03", result['slug'], result['inputs'],
+                         [result['output_file'], meta_path(result['output_file'])])
+            catalog.record(result['slug'], "motion", path=result['motion_file'],
+                           hash=result['inputs']['motion'], frame_count=result['source_frames'])
+            catalog.record(result['slug'], "projected", path=result['output_file'],
+                           hash=hash_file(result['output_file']), frame_count=result['frames'],
+                           camera_angle=result['camera_angle'], source_hash=result['inputs']['motion'],
+                           duration_ms=result['duration_ms'])
+            camera_angles_used.append(result['camera_angle'])
+            if result['loop'] and result['loop']['looped']:
+                looped_count += 1
+            if result['tempo'] and result['tempo']['retimed']:
+                retimed_count += 1
+            processed_count += 1
+        else:
+            catalog.mark_failed(result['slug'], "projected", result.get('error'), result.get('duration_ms'))
+            error_count += 1
+
+    graph.save()
+
+    stats.update(
+        total=len(motion_files),
+        processed=processed_count,
+        skipped=skipped_count,
+        claimed_elsewhere=claimed_elsewhere,
+        errors=error_count,
+        contact_sheets=sheet_count,
+    )
+
+    # Summary statistics
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+
+    print(f"\nTotal files: {len(motion_files)}")
+    print(f"Processed: {processed_count}")
+    print(f"Skipped (up to date): {skipped_count}")
+    if claim:
+        print(f"Claimed by other nodes: {claimed_elsewhere}")
+    print(f"Errors: {error_count}")
+    if contact_sheets:
+        print(f"Contact sheets: {sheet_count} (in {sheet_dir})")
+    if peak:
+        print(f"Peak RSS (largest exercise): {format_bytes(peak)}")
+    if processed_count and loop['enabled']:
+        print(f"Trimmed to one loop: {looped_count} of {processed_count}")
+    if retimed_count:
+        print(f"Retimed to target tempo: {retimed_count} of {processed_count}")
+
+    if camera_angles_used:
+        angle_counts = Counter(camera_angles_used)
+        print(f"\nCamera angles used:")
+        angle_names = {0: 'front', 45: '3/4 front', 90: 'side', 135: '3/4 back'}
+        for angle, count in sorted(angle_counts.items()):
+            angle_name = angle_names.get(angle, f'{angle}°')
+            percentage = (count / len(camera_angles_used)) * 100
+            print(f"  {angle_name:12s} ({angle:3d}°): {count:3d} ({percentage:5.1f}%)")
+
+    if shard is not None or claim:
+        stats_path = write_stats("03", shard_label(shard, claim), stats,
+                                 claimed=len(tasks) - claimed_elsewhere if claim else None)
+        print(f"\n📊 Shard stats: {stats_path}")
+
+    print(f"\n📁 Output directory: {output_dir}")
+    print(f"✓ Ready for rendering!")
+    print("=" * 60)
+
+    return stats
@@ -0,0 +1,318 @@
+"""
+Batch rasterizer: draw every frame of a clip as one NumPy array.
+
+The PIL path (render_webp.render_frame) draws 21 bones and 22 joints per
+frame through ImageDraw, one Python call per shape per frame. This module
+draws the same stick figure for a whole chunk of frames at once:
+
+    shapes    every bone is a capsule (segment + half the bone width) and
+              every joint a disc; the head (joint 15) uses head_radius
+    coverage  signed distance from each pixel centre to the shape, mapped
+              to a 1px linear ramp (analytic anti-aliasing); without
+              anti-aliasing a pixel is in or out, like PIL
+    bones     each capsule is only evaluated in a strip that follows it,
+              moved per frame, so one gather/scatter draws a bone in every
+              frame of the chunk (21 NumPy passes per chunk, not per frame)
+    joints    discs never change shape, so each radius is rendered once per
+              style as sprites at SPRITE_SUBPIXELS² sub-pixel offsets
+              (disc_sprites); a joint is one blit per chunk of the sprite
+              nearest its sub-pixel position
+    box       all of this happens inside the box the figure touches in
+              that chunk
+    layers    bones and joints are each a union (max coverage, as uint8
+              levels); joints are composited over bones, both in their
+              config colour, by one table lookup per pixel
+
+Output is (T, H, W, 4) uint8 RGBA with a transparent background, straight
+(not premultiplied) alpha, ready for Image.fromarray().
+
+rendering.edge_antialias (default true) switches its edge smoothing.
+
+This is not wired into stage 04 or the fused path. scripts/benchmark_rasterizer.py
+compares it with the PIL path for speed and pixel agreement. It agrees
+with PIL, but hard-edged batches run slower than PIL's per-frame C drawing,
+so PIL stays the only renderer (see the README's "Batch rasterizer (not
+adopted)"). It is kept as the measured reference for that decision.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterator
+
+import numpy as np
+
+# SMPL-H head joint, drawn with rendering.head_radius
+HEAD_JOINT = 15
+
+# Frames rasterized per pass: bounds the coverage layers and float
+# temporaries to a few tens of MB on a 400×400 canvas
+CHUNK_FRAMES = 32
+
+# Coverage is stored as uint8 levels 0..COVERAGE_LEVELS, so compositing is
+# one lookup per pixel in a (levels + 1)² RGBA table
+COVERAGE_LEVELS = 64
+
+# PIL's ellipse bounds are inclusive: a radius-r joint covers the area of
+# a radius r + 0.4 disc, so joints are drawn that much larger to match
+JOINT_EDGE_PX = 0.4
+
+# Joint sprites are pre-rendered at this many sub-pixel offsets per axis,
+# so joint positions snap to the nearest 1/SPRITE_SUBPIXELS px
+SPRITE_SUBPIXELS = 4
+
+
+def hex_to_rgb_array(hex_color: str) -> np.ndarray:
+    """'#374151' -> float32 array [55, 65, 81]."""
+    return np.frombuffer(bytes.fromhex(hex_color.lstrip('#')), dtype=np.uint8).astype(np.float32)
+
+
+def raster_style(config: Dict) -> Dict:
+    """
+    Drawing parameters, parsed once per clip.
+
+    Args:
+        config: Pipeline configuration (rendering and smpl_h_skeleton sections)
+
+    Returns:
+        Dictionary with bone_color, joint_color (float32 RGB), bone_radius,
+        joint_radius, head_radius (px), bones ((B, 2) joint index pairs),
+        antialias and lut (composite_table())
+    """
+    rendering = config['rendering']
+    bones = [pair for group in config['smpl_h_skeleton']['bones'].values() for pair in group]
+    return {
+        'bone_color': hex_to_rgb_array(rendering['bone_color']),
+        'joint_color': hex_to_rgb_array(rendering['joint_color']),
+        'bone_radius': rendering['bone_width'] / 2,
+        'joint_radius': float(rendering['joint_radius']),
+        'head_radius': float(rendering['head_radius']),
+        'bones': np.array(bones, dtype=np.intp).reshape(-1, 2),
+        'antialias': rendering.get('edge_antialias', True),
+        'lut': composite_table(hex_to_rgb_array(rendering['joint_color']),
+                               hex_to_rgb_array(rendering['bone_color'])),
+    }
+
+
+def composite_table(joint_color: np.ndarray, bone_color: np.ndarray) -> np.ndarray:
+    """
+    RGBA of every (joint coverage, bone coverage) level pair, joints over bones.
+
+    Args:
+        joint_color, bone_color: float32 RGB
+
+    Returns:
+        ((levels + 1)²,) uint32 table of RGBA pixels (uint8 × 4 in memory
+        order), indexed by joint_level * (levels + 1) + bone_level
+    """
+    levels = np.arange(COVERAGE_LEVELS + 1, dtype=np.float32) / COVERAGE_LEVELS
+    joints, bones = np.meshgrid(levels, levels, indexing='ij')
+    alpha = joints + bones * (1.0 - joints)
+    share = np.divide(joints, alpha, out=np.zeros_like(alpha), where=alpha > 0)[..., None]
+    table = np.zeros(alpha.shape + (4,), dtype=np.uint8)
+    table[..., :3] = np.rint(bone_color + share * (joint_color - bone_color))
+    table[..., 3] = np.rint(alpha * 255.0)
+    table[alpha == 0] = 0
+    # One uint32 per entry: compositing gathers whole pixels
+    return table.reshape(-1, 4).view(np.uint32)[:, 0]
+
+
+def _coverage(distance: np.ndarray, antialias: bool) -> np.ndarray:
+    """uint8 coverage levels from signed distances to a shape's edge (negative inside)."""
+    if antialias:
+        # (0.5 - distance) clipped to [0, 1], scaled to levels
+        return np.clip((0.5 - distance) * COVERAGE_LEVELS + 0.5, 0, COVERAGE_LEVELS).astype(np.uint8)
+    return np.where(distance <= 0, np.uint8(COVERAGE_LEVELS), np.uint8(0))
+
+
+@lru_cache(maxsize=None)
+def disc_sprites(radius: float, antialias: bool) -> np.ndarray:
+    """
+    Coverage sprites of a disc at every sub-pixel offset, rendered once per style.
+
+    Args:
+        radius: Disc radius in pixels
+        antialias: 1px coverage ramp instead of a hard edge
+
+    Returns:
+        Read-only (K, K, S, S) uint8 coverage levels, K = SPRITE_SUBPIXELS.
+        Sprite [qy, qx] has the disc centred at (c + qx / K, c + qy / K),
+        c = (S - 2) // 2
+    """
+    centre = int(np.ceil(radius + 1.0))
+    size = 2 * centre + 2
+    offsets = np.arange(SPRITE_SUBPIXELS, dtype=np.float32) / SPRITE_SUBPIXELS
+    pixels = np.arange(size, dtype=np.float32) - centre
+    dy = pixels[None, None, :, None] - offsets[:, None, None, None]
+    dx = pixels[None, None, None, :] - offsets[None, :, None, None]
+    sprites = _coverage(np.hypot(dx, dy) - np.float32(radius), antialias)
+    sprites.setflags(write=False)
+    return sprites
+
+
+def _blit(layer: np.ndarray, positions: np.ndarray, sprites: np.ndarray):
+    """
+    Add a disc sprite centred at each frame's position to a coverage layer, in every frame.
+
+    Sprites that don't fit the layer are dropped: with the margin
+    _rasterize_chunk() leaves around the visible box, they can't touch it.
+
+    Args:
+        layer: (T, H, W) contiguous uint8 coverage levels, updated in place (union = max)
+        positions: (T, 2) disc centres in pixels
+        sprites: disc_sprites() of the disc's radius
+    """
+    num_frames, height, width = layer.shape
+    steps, size = sprites.shape[0], sprites.shape[-1]
+
+    # Whole-pixel origin and nearest sub-pixel sprite per frame
+    whole, sub = np.divmod(np.rint(positions * steps).astype(np.intp), steps)
+    origin = whole - (size - 2) // 2
+    stamps = sprites[sub[:, 1], sub[:, 0]]                          # (T, S, S)
+    fits = (origin.min(axis=1) >= 0) & (origin[:, 0] <= width - size) & (origin[:, 1] <= height - size)
+    if not fits.all():
+        stamps = stamps * fits[:, None, None]
+        origin = np.clip(origin, 0, [width - size, height - size])
+
+    rows = (np.arange(num_frames) * height)[:, None] + origin[:, 1:] + np.arange(size)   # (T, S)
+    index = (rows * width)[:, :, None] + (origin[:, :1] + np.arange(size))[:, None, :]
+    pixels = layer.reshape(-1)
+    pixels[index] = np.maximum(pixels[index], stamps)
+
+
+def _window(lo: np.ndarray, size: int, limit: int) -> np.ndarray:
+    """(T, size) pixel indices of windows starting at lo, shifted to stay on the canvas."""
+    start = np.clip(lo, 0, limit - size)
+    return start[:, None] + np.arange(size)
+
+
+def _stamp(layer: np.ndarray, a: np.ndarray, b: np.ndarray, radius: float, antialias: bool):
+    """
+    Add a capsule from a to b to a coverage layer, in every frame.
+
+    Args:
+        layer: (T, H, W) contiguous uint8 coverage levels, updated in place (union = max)
+        a, b: (T, 2) end points in pixels
+        radius: Capsule radius in pixels
+        antialias: 1px coverage ramp instead of a hard edge
+    """
+    pixels = layer.reshape(-1)
+
+    # Walk along the capsule's major axis (x, or y through a transposed view)
+    if np.abs(b[:, 1] - a[:, 1]).max() > np.abs(b[:, 0] - a[:, 0]).max():
+        layer, a, b = layer.transpose(0, 2, 1), a[:, ::-1], b[:, ::-1]
+
+    num_frames, height, width = layer.shape
+    reach = radius + 1.0
+    dx = b[:, 0] - a[:, 0]
+    dy = b[:, 1] - a[:, 1]
+
+    # Columns the capsule spans
+    lo = np.floor(np.minimum(a[:, 0], b[:, 0]) - reach).astype(np.intp)
+    size_x = min(int(np.ceil(np.abs(dx).max() + 2 * reach)) + 1, width)
+    xs = _window(lo, size_x, width)                                  # (T, size_x)
+    column = xs.astype(np.float32)
+
+    # In each column the capsule lies within reach * length / |dx| of the
+    # segment's centre line (clamped to its ends) and within its bounding
+    # box, so only a strip that tall is drawn, kept inside the box
+    safe_dx = np.where(np.abs(dx) < 1e-6, np.float32(1e-6), dx)
+    stretch = max((np.hypot(dx, dy) / np.abs(safe_dx)).max(), 1.0)
+    box_y = int(np.ceil(np.abs(dy).max() + 2 * reach)) + 1
+    size_y = min(2 * int(np.ceil(reach * stretch)) + 3, box_y, height)
+    along = np.clip((column - a[:, :1]) / safe_dx[:, None], 0.0, 1.0)
+    centre = np.rint(a[:, 1:] + along * dy[:, None]).astype(np.intp)
+    top = np.floor(np.minimum(a[:, 1:], b[:, 1:]) - reach).astype(np.intp)
+    start = np.clip(centre - size_y // 2, top, top + box_y - size_y)
+    ys = np.clip(start, 0, height - size_y)[:, :, None] + np.arange(size_y)   # (T, size_x, size_y)
+
+    # Distance from each pixel centre to the segment, relative to a
+    px = (column - a[:, :1])[:, :, None]                            # (T, size_x, 1)
+    py = ys.astype(np.float32) - a[:, 1:, None]                     # (T, size_x, size_y)
+    dx = dx[:, None, None]
+    dy = dy[:, None, None]
+    length_sq = np.maximum(dx * dx + dy * dy, np.float32(1e-12))
+    t = np.clip((px * dx + py * dy) / length_sq, 0.0, 1.0)
+    coverage = _coverage(np.hypot(px - t * dx, py - t * dy) - np.float32(radius), antialias)
+
+    # One flat index into the (contiguous) layer, whichever way it was walked
+    stride_t, stride_y, stride_x = (stride // layer.itemsize for stride in layer.strides)
+    index = ((np.arange(num_frames) * stride_t)[:, None, None] + ys * stride_y) + (xs * stride_x)[:, :, None]
+    pixels[index] = np.maximum(pixels[index], coverage)
+
+
+def _rasterize_chunk(motion_2d: np.ndarray, frames: np.ndarray, style: Dict):
+    """Draw one chunk of (t, J, 2) joint positions into zeroed (t, H, W, 4) uint8 frames."""
+    num_frames, num_joints = motion_2d.shape[:2]
+    canvas_size = frames.shape[1]
+    antialias = style['antialias']
+
+    # Only the box the figure touches in this chunk is drawn and composited
+    reach = max(style['head_radius'], style['joint_radius'], style['bone_radius']) + JOINT_EDGE_PX + 1.0
+    x0, y0 = np.maximum(np.floor(motion_2d.min(axis=(0, 1)) - reach).astype(int), 0)
+    x1, y1 = np.minimum(np.ceil(motion_2d.max(axis=(0, 1)) + reach).astype(int) + 1, canvas_size)
+    if x1 <= x0 or y1 <= y0:
+        return
+
+    # Layers have a sprite-wide margin, so any joint sprite touching the box fits
+    joint_sprites = disc_sprites(style['joint_radius'] + JOINT_EDGE_PX, antialias)
+    head_sprites = disc_sprites(style['head_radius'] + JOINT_EDGE_PX, antialias)
+    margin = max(joint_sprites.shape[-1], head_sprites.shape[-1])
+    motion_box = motion_2d - np.array([x0 - margin, y0 - margin], dtype=motion_2d.dtype)
+
+    bones_layer = np.zeros((num_frames, y1 - y0 + 2 * margin, x1 - x0 + 2 * margin), dtype=np.uint8)
+    joints_layer = np.zeros_like(bones_layer)
+
+    for joint_a, joint_b in style['bones']:
+        if joint_a >= num_joints or joint_b >= num_joints:
+            continue
+        _stamp(bones_layer, motion_box[:, joint_a], motion_box[:, joint_b], style['bone_radius'], antialias)
+
+    for joint in range(num_joints):
+        _blit(joints_layer, motion_box[:, joint], head_sprites if joint == HEAD_JOINT else joint_sprites)
+
+    # Joints over bones, both layers at once through the composite table
+    visible = (slice(None), slice(margin, -margin), slice(margin, -margin))
+    index = joints_layer[visible].astype(np.uint16) * (COVERAGE_LEVELS + 1) + bones_layer[visible]
+    frames.view(np.uint32)[:, y0:y1, x0:x1, 0] = style['lut'].take(index)
+
+
+def rasterize_chunks(motion_2d: np.ndarray, canvas_size: int, config: Dict,
+                     chunk_frames: int = CHUNK_FRAMES) -> Iterator[np.ndarray]:
+    """
+    Rasterize a clip chunk by chunk.
+
+    Args:
+        motion_2d: (T, J, 2) joint positions in canvas pixels
+        canvas_size: Canvas size in pixels
+        config: Pipeline configuration
+        chunk_frames: Frames per chunk
+
+    Yields:
+        (t, H, W, 4) uint8 RGBA arrays, t <= chunk_frames, in clip order
+    """
+    style = raster_style(config)
+    motion_2d = np.asarray(motion_2d, dtype=np.float32)
+    for start in range(0, len(motion_2d), chunk_frames):
+        chunk = motion_2d[start:start + chunk_frames]
+        frames = np.zeros((len(chunk), canvas_size, canvas_size, 4), dtype=np.uint8)
+        _rasterize_chunk(chunk, frames, style)
+        yield frames
+
+
+def rasterize_frames(motion_2d: np.ndarray, canvas_size: int, config: Dict) -> np.ndarray:
+    """
+    Rasterize every frame of a clip.
+
+    Args:
+        motion_2d: (T, J, 2) joint positions in canvas pixels
+        canvas_size: Canvas size in pixels
+        config: Pipeline configuration
+
+    Returns:
+        (T, H, W, 4) uint8 RGBA array
+    """
+    style = raster_style(config)
+    motion_2d = np.asarray(motion_2d, dtype=np.float32)
+    frames = np.zeros((len(motion_2d), canvas_size, canvas_size, 4), dtype=np.uint8)
+    for start in range(0, len(motion_2d), CHUNK_FRAMES):
+        _rasterize_chunk(motion_2d[start:start + CHUNK_FRAMES], frames[start:start + CHUNK_FRAMES], style)
+    return frames
@@ -0,0 +1,733 @@
+"""
+Render Lottie Animations (stage 05, alternative to WebP)
+
+Creates vector-based Lottie animations with aggressive keyframe optimization.
+
+IMPORTANT: Lottie can suffer performance issues if all 22 joints are updated
+every frame. This script aggressively simplifies keyframes by only adding them
+when motion direction changes significantly.
+
+Repetitive clips are rendered as the single cycle recorded by stage 03
+(see loop.py); the player loops it. Frames are resampled from the clip's own
+rate (projection sidecar "fps") to the render rate, and "fr" is the rate
+actually emitted (see frame_rate.py).
+"""
+
+import json
+import os
+import time
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from tqdm import tqdm
+
+from .build_graph import BuildGraph, atomic_write, config_subset, hash_file, hash_value
+from .catalog import Catalog
+from .config import load_config
+from .memory import budget_jobs, estimate_task_bytes, format_bytes, input_size, peak_rss, reset_peak
+from .parallel import longest_first, resolve_jobs, run_pool
+from .frame_rate import output_fps, projected_fps, resample_frames
+from .loop import loop_cycle
+from .projection import (
+    canvas_padding,
+    find_projected,
+    load_projected,
+    load_projection_meta,
+    meta_path,
+    to_canvas,
+)
+from .sharding import run_claimed, select_shard, shard_label, write_stats
+from .tracing import span, traced, traced_task
+
+# Config sections that affect Lottie output
+CONFIG_KEYS = ["canvas", "rendering", "smpl_h_skeleton"]
+
+
+def calculate_angle(v1: np.ndarray, v2: np.ndarray) -> float:
+    """
+    Calculate angle in degrees between two vectors.
+
+    Args:
+        v1: Vector 1 (2D)
+        v2: Vector 2 (2D)
+
+    Returns:
+        Angle in degrees (0-180)
+    """
+    # Normalize vectors
+    v1_norm = v1 / (np.linalg.norm(v1) + 1e-8)
+    v2_norm = v2 / (np.linalg.norm(v2) + 1e-8)
+
+    # Calculate angle
+    cos_angle = np.clip(np.dot(v1_norm, v2_norm), -1.0, 1.0)
+    angle = np.arccos(cos_angle)
+
+    return np.degrees(angle)
+
+
+def detect_keyframes(
+    joint_positions: np.ndarray,
+    threshold_degrees: float = 10.0,
+    min_displacement: float = 5.0,
+) -> List[int]:
+    """
+    Detect significant keyframes for a single joint.
+
+    Only adds keyframes when:
+    1. Direction changes by more than threshold_degrees
+    2. Joint moves more than min_displacement pixels
+
+    Args:
+        joint_positions: (T, 2) - XY positions across time
+        threshold_degrees: Angle change threshold in degrees
+        min_displacement: Minimum pixel movement to consider
+
+    Returns:
+        List of keyframe indices (always includes 0 and T-1)
+    """
+    T = len(joint_positions)
+    keyframes = [0]  # Always include first frame
+
+    if T < 3:
+        keyframes.append(T - 1)
+        return keyframes
+
+    # Calculate velocities (direction vectors)
+    velocities = np.diff(joint_positions, axis=0)  # (T-1, 2)
+
+    # Track last keyframe
+    last_keyframe_idx = 0
+
+    for i in range(1, T - 1):
+        # Check displacement since last keyframe
+        displacement = np.linalg.norm(
+            joint_positions[i] - joint_positions[last_keyframe_idx]
+        )
+
+        if displacement < min_displacement:
+            continue  # Joint hasn't moved enough
+
+        # Check direction change
+        if i > 0 and i < len(velocities):
+            v_prev = velocities[i - 1]
+            v_curr = velocities[i]
+
+            # Skip if either velocity is zero
+            if np.linalg.norm(v_prev) < 1e-8 or np.linalg.norm(v_curr) < 1e-8:
+                continue
+
+            angle = calculate_angle(v_prev, v_curr)
+
+            if angle > threshold_degrees:
+                keyframes.append(i)
+                last_keyframe_idx = i
+
+    # Always include last frame
+    keyframes.append(T - 1)
+
+    return keyframes
+
+
+@traced("keyframe detection", "step")
+def optimize_keyframes_for_animation(
+    projected_data: np.ndarray,
+    threshold_degrees: float = 10.0,
+    min_displacement: float = 5.0,
+) -> Dict[int, List[int]]:
+    """
+    Detect keyframes for all joints with aggressive optimization.
+
+    Args:
+        projected_data: (T, 22, 2) - All joint positions
+        threshold_degrees: Direction change threshold
+        min_displacement: Minimum movement threshold
+
+    Returns:
+        Dictionary mapping joint_idx -> list of keyframe indices
+    """
+    T, num_joints, _ = projected_data.shape
+
+    keyframe_map = {}
+
+    for joint_idx in range(num_joints):
+        joint_positions = projected_data[:, joint_idx, :]  # (T, 2)
+        keyframes = detect_keyframes(
+            joint_positions,
+            threshold_degrees=threshold_degrees,
+            min_displacement=min_displacement,
+        )
+        keyframe_map[joint_idx] = keyframes
+
+    return keyframe_map
+
+
+def hex_to_rgb_normalized(hex_color: str) -> List[float]:
+    """
+    Convert hex color to normalized RGB [0, 1].
+
+    Args:
+        hex_color: "#RRGGBB"
+
+    Returns:
+        [r, g, b] normalized to 0-1
+    """
+    hex_color = hex_color.lstrip("#")
+    r = int(hex_color[0:2], 16) / 255.0
+    g = int(hex_color[2:4], 16) / 255.0
+    b = int(hex_color[4:6], 16) / 255.0
+    return [r, g, b]
+
+
+@traced("lottie build", "step")
+def create_lottie_animation(
+    projected_data: np.ndarray,
+    keyframe_map: Dict[int, List[int]],
+    config: Dict,
+    fps: int = 15,
+) -> Dict:
+    """
+    Create Lottie JSON with optimized keyframes.
+
+    Args:
+        projected_data: (T, 22, 2) - Joint positions
+        keyframe_map: Keyframes per joint
+        config: Pipeline configuration
+        fps: Target frame rate
+
+    Returns:
+        Lottie JSON dictionary
+    """
+    T, num_joints, _ = projected_data.shape
+    canvas_size = config.get("canvas", {}).get("width", 400)
+    bone_color = hex_to_rgb_normalized(config["rendering"]["bone_color"])
+    joint_color = hex_to_rgb_normalized(config["rendering"]["joint_color"])
+    bone_width = config["rendering"]["bone_width"]
+    joint_radius = config["rendering"]["joint_radius"]
+    head_radius = config["rendering"]["head_radius"]
+
+    # Skeleton structure
+    skeleton = config.get("smpl_h_skeleton", {}).get("bones", {})
+
+    # Lottie frame rate and duration
+    duration_frames = T
+    duration_seconds = T / fps
+
+    # Initialize Lottie structure
+    lottie = {
+        "v": "5.7.4",  # Lottie version
+        "fr": fps,  # Frame rate
+        "ip": 0,  # In point (start frame)
+        "op": duration_frames,  # Out point (end frame)
+        "w": canvas_size,  # Width
+        "h": canvas_size,  # Height
+        "nm": "Exercise Animation",  # Name
+        "ddd": 0,  # 2D animation
+        "assets": [],  # No external assets
+        "layers": [],  # Will populate below
+    }
+
+    # Layer for bones (lines)
+    bone_layer = {
+        "ddd": 0,
+        "ind": 1,  # Layer index
+        "ty": 4,  # Shape layer
+        "nm": "Bones",
+        "sr": 1,  # Time stretch
+        "ks": {  # Transform (static, no animation)
+            "o": {"a": 0, "k": 100},  # Opacity 100%
+            "r": {"a": 0, "k": 0},  # Rotation 0
+            "p": {"a": 0, "k": [0, 0, 0]},  # Position [x, y, z]
+            "a": {"a": 0, "k": [0, 0, 0]},  # Anchor
+            "s": {"a": 0, "k": [100, 100, 100]},  # Scale 100%
+        },
+        "ao": 0,
+        "shapes": [],  # Will populate with bone shapes
+        "ip": 0,
+        "op": duration_frames,
+        "st": 0,
+        "bm": 0,
+    }
+
+    # Create a shape for each bone
+    bone_idx = 0
+    for bone_group_name, bone_pairs in skeleton.items():
+        for joint_a, joint_b in bone_pairs:
+            # Get keyframes for both joints
+            keyframes_a = keyframe_map[joint_a]
+            keyframes_b = keyframe_map[joint_b]
+
+            # Union of keyframes (bone updates when either joint moves)
+            keyframes_union = sorted(set(keyframes_a + keyframes_b))
+
+            # Create path shape for bone
+            bone_shape = {
+                "ty": "sh",  # Shape type: path
+                "ks": {
+                    "a": 1,  # Animated
+                    "k": [],  # Keyframes
+                },
+            }
+
+            # Add keyframes for bone path
+            for kf_idx in keyframes_union:
+                pos_a = projected_data[kf_idx, joint_a]
+                pos_b = projected_data[kf_idx, joint_b]
+
+                bone_shape["ks"]["k"].append({
+                    "i": {"x": [0.833], "y": [0.833]},  # Ease in
+                    "o": {"x": [0.167], "y": [0.167]},  # Ease out
+                    "t": kf_idx,  # Time (frame number)
+                    "s": [{
+                        "i": [[0, 0], [0, 0]],  # In tangent
+                        "o": [[0, 0], [0, 0]],  # Out tangent
+                        "v": [
+                            [pos_a[0], pos_a[1]],  # Start point
+                            [pos_b[0], pos_b[1]],  # End point
+                        ],
+                        "c": False,  # Not closed
+                    }],
+                })
+
+            # Stroke style
+            stroke = {
+                "ty": "st",  # Stroke
+                "c": {"a": 0, "k": bone_color + [1]},  # Color RGBA
+                "o": {"a": 0, "k": 100},  # Opacity
+                "w": {"a": 0, "k": bone_width},  # Width
+                "lc": 2,  # Line cap: round
+                "lj": 2,  # Line join: round
+            }
+
+            # Group shape + stroke
+            bone_group = {
+                "ty": "gr",  # Group
+                "it": [bone_shape, stroke, {"ty": "tr", "nm": "Transform"}],
+                "nm": f"Bone_{bone_idx}",
+                "np": 2,
+                "cix": 2,
+                "bm": 0,
+            }
+
+            bone_layer["shapes"].append(bone_group)
+            bone_idx += 1
+
+    lottie["layers"].append(bone_layer)
+
+    # Layer for joints (circles)
+    joint_layer = {
+        "ddd": 0,
+        "ind": 2,  # Layer index
+        "ty": 4,  # Shape layer
+        "nm": "Joints",
+        "sr": 1,
+        "ks": {
+            "o": {"a": 0, "k": 100},
+            "r": {"a": 0, "k": 0},
+            "p": {"a": 0, "k": [0, 0, 0]},
+            "a": {"a": 0, "k": [0, 0, 0]},
+            "s": {"a": 0, "k": [100, 100, 100]},
+        },
+        "ao": 0,
+        "shapes": [],
+        "ip": 0,
+        "op": duration_frames,
+        "st": 0,
+        "bm": 0,
+    }
+
+    # Create a circle for each joint
+    for joint_idx in range(num_joints):
+        keyframes = keyframe_map[joint_idx]
+        radius = head_radius if joint_idx == 15 else joint_radius
+
+        # Create ellipse shape (Lottie doesn't have simple circles in position)
+        # Instead, use a group with animated position
+
+        # Static circle shape
+        ellipse = {
+            "ty": "el",  # Ellipse
+            "p": {"a": 0, "k": [0, 0]},  # Center at origin (will move group)
+            "s": {"a": 0, "k": [radius * 2, radius * 2]},  # Size (diameter)
+        }
+
+        # Fill
+        fill = {
+            "ty": "fl",  # Fill
+            "c": {"a": 0, "k": joint_color + [1]},  # Color RGBA
+            "o": {"a": 0, "k": 100},  # Opacity
+        }
+
+        # Animated transform (position)
+        transform = {
+            "ty": "tr",
+            "p": {
+                "a": 1,  # Animated
+                "k": [],  # Keyframes
+            },
+            "a": {"a": 0, "k": [0, 0]},  # Anchor
+            "s": {"a": 0, "k": [100, 100]},  # Scale
+            "r": {"a": 0, "k": 0},  # Rotation
+            "o": {"a": 0, "k": 100},  # Opacity
+        }
+
+        # Add keyframes for joint position
+        for kf_idx in keyframes:
+            pos = projected_data[kf_idx, joint_idx]
+            transform["p"]["k"].append({
+                "i": {"x": [0.833], "y": [0.833]},
+                "o": {"x": [0.167], "y": [0.167]},
+                "t": kf_idx,
+                "s": [pos[0], pos[1]],  # Position [x, y]
+            })
+
+        # Group
+        joint_group = {
+            "ty": "gr",
+            "it": [ellipse, fill, transform],
+            "nm": f"Joint_{joint_idx}",
+            "np": 2,
+            "cix": 2,
+            "bm": 0,
+        }
+
+        joint_layer["shapes"].append(joint_group)
+
+    lottie["layers"].append(joint_layer)
+
+    return lottie
+
+
+def render_lottie_animation(
+    slug: str,
+    projected_dir: str = "projected",
+    output_dir: str = "output/lottie",
+    config: Dict = None,
+    threshold_degrees: float = 10.0,
+    min_displacement: float = 5.0,
+) -> Tuple[str, Dict]:
+    """
+    Render a single Lottie animation with keyframe optimization.
+
+    Args:
+        slug: Exercise slug
+        projected_dir: Directory with projected .npy/.npq files
+        output_dir: Output directory for Lottie JSON
+        config: Pipeline configuration
+        threshold_degrees: Direction change threshold
+        min_displacement: Minimum movement threshold
+
+    Returns:
+        Tuple of (output_path, stats)
+    """
+    if config is None:
+        config = load_config()
+
+    # Load projected data
+    found = find_projected(projected_dir, [slug])
+
+    if not found:
+        raise FileNotFoundError(f"Projected data not found: {os.path.join(projected_dir, slug)}.npy/.npq")
+    projected_path = found[0]
+
+    # Unit-box projection (stage 03), one loop cycle, mapped to this canvas.
+    # float64 so the values written to JSON are Python floats (compact .npq
+    # loads as float32)
+    with span("load npy"):
+        meta = load_projection_meta(projected_path)
+        motion_unit = load_projected(projected_path)
+        projected_data = to_canvas(
+            loop_cycle(motion_unit, meta.get("loop")).astype(np.float64),  # (T, 22, 2)
+            config.get("canvas", {}).get("width", 400),
+            canvas_padding(config),
+        )
+
+    # From the clip's own rate to the render rate (a loop cycle wraps around)
+    source_fps = projected_fps(meta, config)
+    target_fps = config["rendering"].get("target_fps", config["rendering"].get("fps", 15))
+    fps = output_fps(source_fps, target_fps)
+    projected_data = resample_frames(projected_data, source_fps, target_fps,
+                                     config["rendering"].get("antialias", True),
+                                     cyclic=len(projected_data) != len(motion_unit))
+    T, num_joints, _ = projected_data.shape
+
+    # Detect keyframes with aggressive optimization
+    keyframe_map = optimize_keyframes_for_animation(
+        projected_data,
+        threshold_degrees=threshold_degrees,
+        min_displacement=min_displacement,
+    )
+
+    # Calculate optimization stats
+    total_possible_keyframes = T * num_joints
+    total_optimized_keyframes = sum(len(kfs) for kfs in keyframe_map.values())
+    reduction_percent = (
+        (1 - total_optimized_keyframes / total_possible_keyframes) * 100
+    )
+
+    # Create Lottie animation
+    lottie_json = create_lottie_animation(
+        projected_data,
+        keyframe_map,
+        config,
+        fps=fps,
+    )
+
+    # Save to file
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, f"{slug}.json")
+
+    with span("json dump"), atomic_write(output_path, "w") as f:
+        json.dump(lottie_json, f, separators=(",", ":"))  # Compact JSON
+
+    # Get file size
+    file_size_kb = os.path.getsize(output_path) / 1024
+
+    stats = {
+        "frames": T,
+        "total_possible_keyframes": total_possible_keyframes,
+        "optimized_keyframes": total_optimized_keyframes,
+        "reduction_percent": reduction_percent,
+        "file_size_kb": file_size_kb,
+    }
+
+    return output_path, stats
+
+
+@traced_task("render lottie")
+def render_lottie_task(task: Dict) -> Dict:
+    """
+    Render one Lottie animation (runs inline or in a pool worker).
+
+    Args:
+        task: Keyword arguments for render_lottie_animation plus slug,
+              projected_file and inputs
+
+    Returns:
+        Dictionary with slug, ok flag, inputs, output_path, stats,
+        duration_ms, peak_rss and error (if any)
+    """
+    start = time.perf_counter()
+    reset_peak()
+    result = {"slug": task["slug"], "ok": False, "inputs": task["inputs"]}
+
+    try:
+        output_path, stats = render_lottie_animation(
+            slug=task["slug"],
+            projected_dir=task["projected_dir"],
+            output_dir=task["output_dir"],
+            config=task["config"],
+            threshold_degrees=task["threshold_degrees"],
+            min_displacement=task["min_displacement"],
+        )
+        result.update(ok=True, output_path=output_path, stats=stats)
+    except Exception as e:
+        print(f"\n❌ Error rendering {task['slug']}: {e}")
+        result["error"] = str(e)
+
+    result["duration_ms"] = (time.perf_counter() - start) * 1000
+    result["peak_rss"] = peak_rss()
+    return result
+
+
+@traced("stage 05")
+def run(
+    config: Dict,
+    projected_dir: str = "projected",
+    output_dir: str = "output/lottie",
+    limit: Optional[int] = None,
+    threshold_degrees: float = 10.0,
+    min_displacement: float = 5.0,
+    force: bool = False,
+    jobs: int = 1,
+    graph: Optional[BuildGraph] = None,
+    catalog: Optional[Catalog] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    claim: bool = False,
+    slugs: Optional[Iterable[str]] = None,
+    max_memory: Optional[int] = None,
+) -> Optional[Dict]:
+    """
+    Render every projected motion file to Lottie JSON.
+
+    Args:
+        config: Parsed pipeline configuration
+        projected_dir: Directory with projected .npy/.npq files
+        output_dir: Output directory for Lottie JSON
+        limit: Only process the first N files
+        threshold_degrees: Direction change threshold
+        min_displacement: Minimum movement threshold
+        force: Re-render even if inputs are unchanged
+        jobs: Worker processes (0 = all cores)
+        graph: Build graph to use (default: the pipeline's .build_graph.json)
+        catalog: Artifact catalog to record results in (default: pipeline.db)
+        shard: (index, count) - only render slugs in this shard
+        claim: Claim each slug through a lock file before rendering it
+        slugs: Only these slugs, without globbing the directory (watch mode)
+        max_memory: RAM budget in bytes: cap workers to fit (default: no budget)
+
+    Returns:
+        Aggregate stats, or None if projected_dir doesn't exist
+    """
+    # Get all projected files
+    projected_path = Path(projected_dir)
+    if not projected_path.exists():
+        print(f"❌ Error: Projected directory not found: {projected_dir}")
+        return None
+
+    projected_files = find_projected(projected_path, slugs)
+
+    if shard is not None:
+        projected_files = select_shard(projected_files, shard, key=lambda path: path.stem)
+        print(f"🧩 Shard {shard[0]}/{shard[1]}: {len(projected_files)} files")
+
+    if limit:
+        projected_files = projected_files[: limit]
+
+    print(f"🎬 Rendering {len(projected_files)} Lottie animations...")
+    print(f"⚙️  Optimization: threshold={threshold_degrees}°, min_displacement={min_displacement}px")
+    print(f"📁 Output: {output_dir}")
+    print()
+
+    # Track stats
+    total_stats = {
+        "total": len(projected_files),
+        "count": 0,
+        "total_frames": 0,
+        "total_possible_keyframes": 0,
+        "total_optimized_keyframes": 0,
+        "total_size_kb": 0.0,
+        "skipped": 0,
+        "claimed_elsewhere": 0,
+        "errors": 0,
+    }
+
+    if graph is None:
+        graph = BuildGraph()
+    if catalog is None:
+        catalog = Catalog()
+    config_hash = hash_value(config_subset(config, CONFIG_KEYS))
+    options_hash = hash_value({
+        "threshold": threshold_degrees,
+        "min_displacement": min_displacement,
+    })
+
+    tasks = []
+    for projected_file in projected_files:
+        slug = projected_file.stem
+        output_file = Path(output_dir) / f"{slug}.json"
+
+        sidecar = meta_path(projected_file)
+        inputs = {
+            "projected": hash_file(projected_file),
+            "meta": hash_file(sidecar) if sidecar.exists() else None,
+            "config": config_hash,
+            "options": options_hash,
+        }
+
+        # Skip if inputs unchanged since the last successful render
+        if not force and not graph.is_stale("05", slug, inputs, [output_file]):
+            total_stats["skipped"] += 1
+            if catalog.get(slug, "lottie") is None:
+                # Built before the catalog existed
+                catalog.record(slug, "lottie", path=output_file, source_hash=inputs["projected"],
+                               frame_count=graph.get_meta("05", slug).get("frame_count"))
+            continue
+
+        tasks.append({
+            "slug": slug,
+            "projected_file": projected_file,
+            "inputs": inputs,
+            "projected_dir": projected_dir,
+            "output_dir": output_dir,
+            "config": config,
+            "threshold_degrees": threshold_degrees,
+            "min_displacement": min_displacement,
+            "claim": {"stage": "05"},
+        })
+
+    # Longest clips first so the pool doesn't idle on one straggler at the end
+    jobs = resolve_jobs(jobs)
+    if max_memory is not None:
+        # The Lottie document is nested dicts/lists: far larger than the array
+        jobs = budget_jobs(jobs, max_memory, (
+            estimate_task_bytes(input_size(t["projected_file"]), factor=60.0) for t in tasks
+        ))
+    if jobs > 1:
+        order = {path: rank for rank, path in enumerate(longest_first(t["projected_file"] for t in tasks))}
+        tasks.sort(key=lambda t: order[t["projected_file"]])
+        print(f"⚙️  Workers: {min(jobs, max(len(tasks), 1))}")
+
+    # Process each file
+    worker = partial(run_claimed, render_lottie_task) if claim else render_lottie_task
+    results = run_pool(worker, tasks, jobs)
+    peak = 0
+    for result, output in tqdm(results, total=len(tasks), desc="Rendering"):
+        if output:
+            tqdm.write(output, end="")
+        peak = max(peak, result.get("peak_rss") or 0)
+        if result.get("peak_rss"):
+            tqdm.write(f"  {result['slug']}: peak RSS {format_bytes(result['peak_rss'])}")
+
+        if result.get("claimed_elsewhere"):
+            total_stats["claimed_elsewhere"] += 1
+            continue
+
+        if not result["ok"]:
+            catalog.mark_failed(result["slug"], "lottie", result.get("error"), result.get("duration_ms"))
+            total_stats["errors"] += 1
+            continue
+
+        stats = result["stats"]
+        graph.record("05", result["slug"], result["inputs"], [result["output_path"]],
+                     meta={"frame_count": stats["frames"]})
+        catalog.record(result["slug"], "lottie", path=result["output_path"], frame_count=stats["frames"],
+                       source_hash=result["inputs"]["projected"], duration_ms=result["duration_ms"])
+
+        # Update totals
+        total_stats["count"] += 1
+        total_stats["total_frames"] += stats["frames"]
+        total_stats["total_possible_keyframes"] += stats["total_possible_keyframes"]
+        total_stats["total_optimized_keyframes"] += stats["optimized_keyframes"]
+        total_stats["total_size_kb"] += stats["file_size_kb"]
+
+    graph.save()
+
+    # Print summary
+    print("\n" + "=" * 60)
+    print("✅ Rendering complete!")
+    print("=" * 60)
+    print(f"📊 Processed: {total_stats['count']} animations")
+    print(f"⏭️  Skipped (up to date): {total_stats['skipped']}")
+    if claim:
+        print(f"🔒 Claimed by other nodes: {total_stats['claimed_elsewhere']}")
+    if total_stats["errors"]:
+        print(f"❌ Errors: {total_stats['errors']}")
+    print(f"🎞️  Total frames: {total_stats['total_frames']}")
+    print(f"⚡ Keyframe optimization:")
+    print(f"   Before: {total_stats['total_possible_keyframes']:,} keyframes")
+    print(f"   After:  {total_stats['total_optimized_keyframes']:,} keyframes")
+
+    if total_stats["total_possible_keyframes"] > 0:
+        reduction = (
+            1 - total_stats["total_optimized_keyframes"] / total_stats["total_possible_keyframes"]
+        ) * 100
+        print(f"   Reduction: {reduction:.1f}%")
+
+    print(f"💾 Total size: {total_stats['total_size_kb']:.1f} KB")
+
+    if total_stats["count"] > 0:
+        avg_size = total_stats["total_size_kb"] / total_stats["count"]
+        print(f"📦 Average size: {avg_size:.1f} KB per animation")
+        print(f"🧠 Peak RSS (largest exercise): {format_bytes(peak)}")
+
+    if shard is not None or claim:
+        stats_path = write_stats("05", shard_label(shard, claim), total_stats,
+                                 claimed=len(tasks) - total_stats["claimed_elsewhere"] if claim else None)
+        print(f"📊 Shard stats: {stats_path}")
+
+    print(f"\n📁 Output directory: {output_dir}")
+    print("=" * 60)
+
+    return total_stats
@@ -0,0 +1,707 @@
+"""
+Render 2D motion data as animated WebP stick figures (stage 04).
+
+Draws bones and joints according to CLAUDE.md specifications:
+- Canvas: 400×400px, transparent background
+- Bones: dark gray (#374151), 4px width
+- Joints: blue accent (#3B82F6), 6px radius
+- Head: 14px radius
+- FPS: 15, resampled from each clip's own rate (the "fps" stage 03
+  records in the projection sidecar) by anti-aliased linear interpolation,
+  plus optional lower-rate tiers in output/webp/<fps>fps/ (see frame_rate.py)
+
+Projections are stored in a unit box (stage 03); the canvas size and
+padding from config are applied here, per render. Repetitive clips are
+rendered as the one cycle recorded in the projection sidecar (see loop.py).
+
+Incremental: an exercise is re-rendered only when its projected motion (or
+sidecar) or the canvas/rendering/skeleton config changed (see build_graph.py).
+
+With a memory budget (--max-memory), frames are drawn while the encoder
+consumes them instead of being collected first (see FrameStream), and the
+worker count is capped to fit the budget (see memory.py).
+"""
+
+import math
+import time
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from .build_graph import BuildGraph, atomic_write, config_subset, hash_file, hash_value
+from .catalog import Catalog
+from .config import PIPELINE_ROOT
+from .memory import STREAMED_FRAMES, budget_jobs, estimate_task_bytes, format_bytes, input_size, peak_rss, reset_peak
+from .parallel import longest_first, resolve_jobs, run_pool
+from .frame_rate import fps_tiers, output_fps, projected_fps, resample_frames, tier_path
+from .loop import loop_cycle
+from .projection import (
+    canvas_padding,
+    find_projected,
+    load_projected,
+    load_projection_meta,
+    meta_path,
+    to_canvas,
+)
+from .sharding import run_claimed, select_shard, shard_label, write_stats
+from .tracing import span, traced, traced_task
+
+# Config sections that affect rendered output
+CONFIG_KEYS = ["canvas", "rendering", "smpl_h_skeleton"]
+
+# Joint drawn with rendering.head_radius instead of joint_radius
+HEAD_JOINT = 15
+
+# Sub-pixel phases per axis of the anti-aliased joint sprites
+SPRITE_PHASES = 4
+
+
+def hex_to_rgb(hex_color):
+    """Convert hex color to RGB tuple."""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+def figure_style(config):
+    """
+    Resolve the drawing parameters once, rather than on every frame.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Dictionary with bone_color, bone_width, joint_color (RGB tuples),
+        joint_radius, head_radius, joint_antialias and bones (list of joint
+        index pairs)
+    """
+    rendering = config['rendering']
+    return {
+        'bone_color': hex_to_rgb(rendering['bone_color']),
+        'bone_width': rendering['bone_width'],
+        'joint_color': hex_to_rgb(rendering['joint_color']),
+        'joint_radius': rendering['joint_radius'],
+        'head_radius': rendering['head_radius'],
+        'joint_antialias': rendering.get('joint_antialias', False),
+        'bones': [tuple(bone) for bone_group in config['smpl_h_skeleton']['bones'].values()
+                  for bone in bone_group],
+    }
+
+
+@lru_cache(maxsize=None)
+def disc_sprite(width, height):
+    """
+    1-bit joint disc, rasterized once per size by PIL's own ellipse.
+
+    draw.ellipse truncates its bounding box to whole pixels, so a joint of
+    a given radius only ever covers one of a few box sizes. Stamping the
+    cached disc at the truncated corner is pixel-identical to drawing it.
+
+    Args:
+        width: Truncated bounding box width (x1 - x0)
+        height: Truncated bounding box height (y1 - y0)
+
+    Returns:
+        Mode '1' image of size (width + 1, height + 1)
+    """
+    sprite = Image.new('1', (width + 1, height + 1), 0)
+    ImageDraw.Draw(sprite).ellipse([0, 0, width, height], fill=1)
+    return sprite
+
+
+@lru_cache(maxsize=None)
+def smooth_disc_sprite(radius, color, phase_x, phase_y):
+    """
+    Anti-aliased RGBA joint disc, rendered once per style and sub-pixel phase.
+
+    The centre sits phase/SPRITE_PHASES of a pixel (plus half a phase step)
+    past the corner of the sprite's centre pixel, and the edge gets a 1px
+    coverage ramp. The disc's edge is at radius + 0.5, the same size as the
+    hard-edged disc_sprite() of that radius.
+
+    Args:
+        radius: Disc radius in pixels
+        color: RGB tuple
+        phase_x: Horizontal sub-pixel phase (0 to SPRITE_PHASES - 1)
+        phase_y: Vertical sub-pixel phase (0 to SPRITE_PHASES - 1)
+
+    Returns:
+        (sprite, margin): RGBA image, and the offset from its corner to the
+        pixel holding the centre
+    """
+    margin = math.ceil(radius) + 2
+    pixels = np.arange(2 * margin + 1) + 0.5
+    dx = pixels - (margin + (phase_x + 0.5) / SPRITE_PHASES)
+    dy = pixels - (margin + (phase_y + 0.5) / SPRITE_PHASES)
+    coverage = np.clip(radius + 1.0 - np.hypot(dx[None, :], dy[:, None]), 0.0, 1.0)
+
+    rgba = np.empty(coverage.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = color
+    rgba[..., 3] = np.round(coverage * 255)
+    return Image.fromarray(rgba, 'RGBA'), margin
+
+
+def composite_joint(image, x, y, radius, color):
+    """Alpha-composite the anti-aliased sprite nearest to (x, y) onto image."""
+    cell_x, cell_y = math.floor(x), math.floor(y)
+    phase_x = min(int((x - cell_x) * SPRITE_PHASES), SPRITE_PHASES - 1)
+    phase_y = min(int((y - cell_y) * SPRITE_PHASES), SPRITE_PHASES - 1)
+    sprite, margin = smooth_disc_sprite(radius, color, phase_x, phase_y)
+
+    # alpha_composite() takes no negative destination: crop the sprite instead
+    left, top = cell_x - margin, cell_y - margin
+    crop_x, crop_y = max(0, -left), max(0, -top)
+    if crop_x < sprite.width and crop_y < sprite.height:
+        image.alpha_composite(sprite, (left + crop_x, top + crop_y), (crop_x, crop_y))
+
+
+def draw_stick_figure(draw, joints_2d, config, style=None, image=None):
+    """
+    Draw stick figure on PIL ImageDraw object.
+
+    Bones are drawn as lines; joints are stamped from cached disc sprites
+    (see disc_sprite). With rendering.joint_antialias, joints are
+    alpha-composited from anti-aliased sprites at SPRITE_PHASES² sub-pixel
+    phases instead (see smooth_disc_sprite), which needs the image itself.
+
+    Args:
+        draw: PIL ImageDraw object
+        joints_2d: (22, 2) array of joint positions
+        config: Configuration dictionary
+        style: figure_style(config), when drawing many frames
+        image: The RGBA image draw paints on (for anti-aliased joints)
+
+    Raises:
+        ValueError: If joints are anti-aliased and no image is given
+    """
+    if style is None:
+        style = figure_style(config)
+    if style['joint_antialias'] and image is None:
+        raise ValueError("Anti-aliased joints (rendering.joint_antialias) need the image")
+    points = [tuple(pos) for pos in np.asarray(joints_2d).tolist()]
+
+    # Draw bones (behind joints)
+    for joint_a, joint_b in style['bones']:
+        if joint_a >= len(points) or joint_b >= len(points):
+            continue
+        draw.line([points[joint_a], points[joint_b]], fill=style['bone_color'], width=style['bone_width'])
+
+    # Stamp joints (on top of bones); the head gets a larger radius
+    for joint_idx, (x, y) in enumerate(points):
+        radius = style['head_radius'] if joint_idx == HEAD_JOINT else style['joint_radius']
+        if style['joint_antialias']:
+            composite_joint(image, x, y, radius, style['joint_color'])
+            continue
+        x0, y0 = int(x - radius), int(y - radius)
+        sprite = disc_sprite(int(x + radius) - x0, int(y + radius) - y0)
+        draw.bitmap((x0, y0), sprite, fill=style['joint_color'])
+
+
+@traced("draw frame", "frame")
+def render_frame(joints_2d, canvas_size, config, style=None):
+    """
+    Render a single frame as PIL Image.
+
+    Args:
+        joints_2d: (22, 2) array of joint positions
+        canvas_size: Canvas size in pixels
+        config: Configuration dictionary
+        style: figure_style(config), when rendering many frames
+
+    Returns:
+        PIL Image with RGBA
+    """
+    # Create image with transparency
+    img = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+
+    # Draw stick figure
+    draw_stick_figure(draw, joints_2d, config, style, img)
+
+    return img
+
+
+def render_frames(motion_2d, canvas_size, config):
+    """
+    Render every frame of a clip, resolving the figure style once.
+
+    Args:
+        motion_2d: (T, J, 2) array of joint positions
+        canvas_size: Canvas size in pixels
+        config: Configuration dictionary
+
+    Returns:
+        List of PIL Images with RGBA
+    """
+    style = figure_style(config)
+    return [render_frame(frame_joints, canvas_size, config, style) for frame_joints in motion_2d]
+
+
+class FrameStream:
+    """
+    Frames drawn on demand, so encoding never holds more than one of them.
+
+    Pillow's animated WebP writer treats any appended image with n_frames
+    as a multi-frame image and walks it with seek(), reading the current
+    frame's pixels before moving on. This object looks like such an image:
+    seek(i) draws frame i, and every other attribute is the current frame's.
+    Indexing and len() work too, for preview_frames().
+
+    Output is byte-identical to saving a list of the same frames.
+    """
+
+    def __init__(self, motion_2d, canvas_size, config):
+        self.motion_2d = motion_2d
+        self.canvas_size = canvas_size
+        self.config = config
+        self.n_frames = len(motion_2d)
+        self.is_animated = self.n_frames > 1
+        self._index = None
+        self._frame = None
+        self._style = figure_style(config)
+
+    def _render(self, index):
+        return render_frame(self.motion_2d[index], self.canvas_size, self.config, self._style)
+
+    def seek(self, index):
+        if index != self._index:
+            self._frame = self._render(index)
+            self._index = index
+
+    def tell(self):
+        return self._index or 0
+
+    def __len__(self):
+        return self.n_frames
+
+    def __getitem__(self, index):
+        return self._render(index)
+
+    def __getattr__(self, name):
+        # Only called for attributes not found above: delegate to the current frame
+        if name.startswith("__") or name in ("motion_2d", "_frame", "_index", "_style"):
+            raise AttributeError(name)
+        if self._frame is None:
+            self.seek(0)
+        return getattr(self._frame, name)
+
+
+@traced("webp encode", "step")
+def save_as_webp(frames, output_path, fps, loop=0):
+    """
+    Save frames as animated WebP.
+
+    Written atomically: the file only appears at output_path once the
+    encoder has finished.
+
+    Args:
+        frames: List of PIL Images, or a FrameStream to draw frames while
+                encoding
+        output_path: Output file path
+        fps: Frames per second
+        loop: Loop count (0 = infinite)
+    """
+    if not len(frames):
+        raise ValueError("No frames to save")
+
+    if isinstance(frames, FrameStream):
+        # First frame is a real image (it carries the save call); the rest
+        # are drawn one at a time as the encoder seeks through them
+        frames = [frames[0], FrameStream(frames.motion_2d[1:], frames.canvas_size, frames.config)]
+
+    # Calculate duration per frame in milliseconds
+    duration_ms = int(1000 / fps)
+
+    # Save as animated WebP
+    with atomic_write(output_path) as f:
+        frames[0].save(
+            f,
+            format='WEBP',
+            save_all=True,
+            append_images=frames[1:],
+            duration=duration_ms,
+            loop=loop,
+            lossless=True,  # Preserve quality for stick figures
+            quality=100,    # Maximum quality
+            method=6        # Best compression (slower but smaller)
+        )
+
+
+def encoded_frame_count(path):
+    """
+    Count the frames in a written WebP, from its header.
+
+    libwebp merges identical consecutive frames into one longer frame, so
+    this can be fewer than were drawn. It is the count stage 09 reports.
+
+    Args:
+        path: WebP file path
+
+    Returns:
+        Number of frames in the file
+    """
+    with Image.open(path) as img:
+        return getattr(img, 'n_frames', 1)
+
+
+def preview_frames(frames, num_frames=5):
+    """
+    Display ASCII preview of frames (optional).
+
+    Args:
+        frames: List of PIL Images
+        num_frames: Number of frames to preview
+    """
+    print(f"\nPreviewing first {num_frames} frames:\n")
+
+    num_to_show = min(num_frames, len(frames))
+    frame_indices = np.linspace(0, len(frames) - 1, num_to_show, dtype=int)
+
+    for idx in frame_indices:
+        frame = frames[idx]
+
+        # Convert to grayscale for ASCII
+        frame_gray = frame.convert('L')
+        pixels = np.array(frame_gray)
+
+        # Downsample for ASCII display
+        step = 10
+        ascii_chars = ' .:-=+*#%@'
+
+        print(f"Frame {idx + 1}/{len(frames)}:")
+        print("+" + "-" * (pixels.shape[1] // step) + "+")
+
+        for y in range(0, pixels.shape[0], step):
+            row = "|"
+            for x in range(0, pixels.shape[1], step):
+                pixel_val = pixels[y:y+step, x:x+step].mean()
+                char_idx = int(pixel_val / 255 * (len(ascii_chars) - 1))
+                row += ascii_chars[char_idx]
+            row += "|"
+            print(row)
+
+        print("+" + "-" * (pixels.shape[1] // step) + "+")
+        print()
+
+
+def remove_stale_tiers(output_file, tiers: Dict):
+    """Delete this clip's tier files for rates no longer rendered."""
+    for path in output_file.parent.glob(f"*fps/{output_file.name}"):
+        if str(path) not in {tier['path'] for tier in tiers.values()}:
+            path.unlink(missing_ok=True)
+
+
+@traced_task("render webp")
+def render_exercise(task):
+    """
+    Render one exercise to animated WebP (runs inline or in a pool worker).
+
+    Args:
+        task: Dictionary with slug, projected_file, output_file, inputs,
+              config, preview, stream flag and a progress label
+
+    Returns:
+        Dictionary with slug, ok flag, frames rendered, frame_count (frames
+        in the encoded file), inputs, output_file, tiers (fps -> {path,
+        frame_count}), duration_ms, peak_rss and error (if any)
+    """
+    start = time.perf_counter()
+    reset_peak()
+    config = task['config']
+    canvas_size = config['canvas']['width']
+    target_fps = config['rendering']['fps']
+    output_file = task['output_file']
+    result = {
+        'slug': task['slug'],
+        'ok': False,
+        'frames': 0,
+        'inputs': task['inputs'],
+        'output_file': output_file,
+        'tiers': {},
+    }
+
+    print(task['label'])
+
+    try:
+        # Load projected motion and map the unit box to this canvas
+        with span("load npy"):
+            motion_unit = load_projected(task['projected_file'])  # (T, J, 2)
+            meta = load_projection_meta(task['projected_file'])
+            loop = meta.get('loop')
+        source_fps = projected_fps(meta, config)
+        fps = output_fps(source_fps, target_fps)
+
+        if motion_unit.ndim != 3 or motion_unit.shape[2] != 2:
+            raise ValueError(f"Invalid shape {motion_unit.shape}, expected (T, J, 2)")
+
+        num_frames_orig = motion_unit.shape[0]
+        num_joints = motion_unit.shape[1]
+
+        print(f"  Original: {num_frames_orig} frames, {num_joints} joints @ {source_fps}fps")
+
+        # One clean cycle of a repetitive clip (stage 03's loop analysis)
+        motion_unit = loop_cycle(motion_unit, loop)
+        if len(motion_unit) != num_frames_orig:
+            print(f"  Loop: frames {loop['start']}-{loop['end']} "
+                  f"({loop['period_seconds']:.2f}s of {loop['reps']} reps)")
+        motion_2d = to_canvas(motion_unit, canvas_size, canvas_padding(config))
+
+        # Resample to target FPS (a loop cycle wraps around)
+        antialias = config['rendering'].get('antialias', True)
+        cyclic = len(motion_unit) != num_frames_orig
+        motion_subsampled = resample_frames(motion_2d, source_fps, target_fps, antialias, cyclic)
+        num_frames_final = motion_subsampled.shape[0]
+
+        print(f"  Resampled: {num_frames_final} frames @ {fps}fps")
+
+        # Render frames (drawn during encoding when streaming)
+        if task.get('stream'):
+            frames = FrameStream(motion_subsampled, canvas_size, config)
+        else:
+            frames = render_frames(motion_subsampled, canvas_size, config)
+
+            print(f"  Rendered: {len(frames)} frames")
+
+        # Save as animated WebP
+        save_as_webp(frames, output_file, fps, loop=0)
+
+        # Get file size and the frame count after libwebp merged repeats
+        file_size_kb = output_file.stat().st_size / 1024
+        frame_count = encoded_frame_count(output_file)
+
+        print(f"  ✓ Saved {output_file.name} ({file_size_kb:.1f} KB, {frame_count} frames)")
+
+        # Preview if requested
+        if task['preview']:
+            preview_frames(frames, task['preview'])
+
+        # Lower-rate tiers for low-end devices
+        for tier in fps_tiers(config, fps):
+            tier_file = tier_path(output_file, tier)
+            tier_file.parent.mkdir(exist_ok=True)
+            tier_motion = resample_frames(motion_2d, source_fps, tier, antialias, cyclic)
+            with span("render tier"):
+                save_as_webp(FrameStream(tier_motion, canvas_size, config), tier_file, tier, loop=0)
+            tier_frames = encoded_frame_count(tier_file)
+            result['tiers'][str(tier)] = {'path': str(tier_file), 'frame_count': tier_frames}
+            print(f"  ✓ Saved {tier}fps/{tier_file.name} "
+                  f"({tier_file.stat().st_size / 1024:.1f} KB, {tier_frames} frames)")
+        remove_stale_tiers(output_file, result['tiers'])
+
+        result['ok'] = True
+        result['frames'] = len(frames)
+        result['frame_count'] = frame_count
+
+    except Exception as e:
+        print(f"  ✗ Error: {e}")
+        result['error'] = str(e)
+        import traceback
+        traceback.print_exc()
+
+    result['duration_ms'] = (time.perf_counter() - start) * 1000
+    result['peak_rss'] = peak_rss()
+    print(f"  Peak RSS: {format_bytes(result['peak_rss'])}")
+    return result
+
+
+@traced("stage 04")
+def run(
+    config: Dict,
+    projected_dir: Optional[Path] = None,
+    output_dir: Optional[Path] = None,
+    limit: Optional[int] = None,
+    force: bool = False,
+    jobs: int = 1,
+    preview: Optional[int] = None,
+    graph: Optional[BuildGraph] = None,
+    catalog: Optional[Catalog] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    claim: bool = False,
+    slugs: Optional[Iterable[str]] = None,
+    max_memory: Optional[int] = None,
+) -> Dict:
+    """
+    Render every projected motion file to animated WebP.
+
+    Args:
+        config: Parsed pipeline configuration
+        projected_dir: Directory of projected .npy/.npq files (default: projected/)
+        output_dir: Directory for WebP files (default: output/webp/)
+        limit: Only process the first N files
+        force: Re-render even if inputs are unchanged
+        jobs: Worker processes (0 = all cores)
+        preview: ASCII-preview N frames of the first exercise
+        graph: Build graph to use (default: the pipeline's .build_graph.json)
+        catalog: Artifact catalog to record results in (default: pipeline.db)
+        shard: (index, count) - only render slugs in this shard
+        claim: Claim each slug through a lock file before rendering it
+        slugs: Only these slugs, without globbing the directory (watch mode)
+        max_memory: RAM budget in bytes: stream frames into the encoder and
+                    cap workers to fit (default: no budget)
+
+    Returns:
+        Dictionary with total, processed, skipped, claimed_elsewhere, errors
+        and frames counts
+    """
+    stats = {"total": 0, "processed": 0, "skipped": 0, "claimed_elsewhere": 0, "errors": 0, "frames": 0}
+
+    # Setup directories
+    projected_dir = Path(projected_dir) if projected_dir else PIPELINE_ROOT / "projected"
+    output_dir = Path(output_dir) if output_dir else PIPELINE_ROOT / "output" / "webp"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Find projected files
+    projected_files = find_projected(projected_dir, slugs)
+
+    if not projected_files:
+        print(f"\n❌ No projected files found in {projected_dir}")
+        print("   Run 03_project_to_2d.py first.")
+        return stats
+
+    print(f"✓ Found {len(projected_files)} projected files")
+
+    if shard is not None:
+        projected_files = select_shard(projected_files, shard, key=lambda path: path.stem)
+        print(f"  (Shard {shard[0]}/{shard[1]}: {len(projected_files)} files)")
+
+    if limit:
+        projected_files = projected_files[:limit]
+        print(f"  (Limited to {limit} files for testing)")
+
+    # Process each file
+    print("\n" + "=" * 60)
+    print("Rendering Animations")
+    print("=" * 60 + "\n")
+
+    processed_count = 0
+    skipped_count = 0
+    claimed_elsewhere = 0
+    error_count = 0
+    total_frames_rendered = 0
+
+    if graph is None:
+        graph = BuildGraph()
+    if catalog is None:
+        catalog = Catalog()
+    config_hash = hash_value(config_subset(config, CONFIG_KEYS))
+    tasks = []
+
+    for idx, projected_file in enumerate(projected_files, 1):
+        slug = projected_file.stem
+        output_file = output_dir / f"{slug}.webp"
+
+        sidecar = meta_path(projected_file)
+        inputs = {
+            "projected": hash_file(projected_file),
+            "meta": hash_file(sidecar) if sidecar.exists() else None,
+            "config": config_hash,
+        }
+
+        # Skip if inputs unchanged since the last successful render
+        tier_files = [tier['path'] for tier in graph.get_meta("04", slug).get("tiers", {}).values()]
+        if not force and not graph.is_stale("04", slug, inputs, [output_file] + tier_files):
+            print(f"[{idx}/{len(projected_files)}] {slug} - SKIP (up to date)")
+            skipped_count += 1
+            if catalog.get(slug, "webp") is None:
+                # Built before the catalog existed
+                catalog.record(slug, "webp", path=output_file, source_hash=inputs["projected"],
+                               frame_count=graph.get_meta("04", slug).get("frame_count"))
+            continue
+
+        tasks.append({
+            'label': f"[{idx}/{len(projected_files)}] {slug}",
+            'slug': slug,
+            'projected_file': projected_file,
+            'output_file': output_file,
+            'inputs': inputs,
+            'config': config,
+            'preview': preview if idx == 1 else None,  # Only preview first exercise
+            'stream': max_memory is not None,
+            'claim': {"stage": "04"},
+        })
+
+    # Longest clips first so the pool doesn't idle on one straggler at the end
+    jobs = resolve_jobs(jobs)
+    if max_memory is not None:
+        canvas_size = config['canvas']['width']
+        jobs = budget_jobs(jobs, max_memory, (
+            estimate_task_bytes(input_size(t['projected_file']), factor=2.0,
+                                frames=STREAMED_FRAMES, canvas_size=canvas_size)
+            for t in tasks
+        ))
+    if jobs > 1:
+        order = {path: rank for rank, path in enumerate(longest_first(t['projected_file'] for t in tasks))}
+        tasks.sort(key=lambda t: order[t['projected_file']])
+        print(f"Running {len(tasks)} exercises on {min(jobs, max(len(tasks), 1))} workers\n")
+
+    worker = partial(run_claimed, render_exercise) if claim else render_exercise
+    peak = 0
+    for result, output in run_pool(worker, tasks, jobs):
+        if output:
+            print(output, end='')
+        peak = max(peak, result.get('peak_rss') or 0)
+
+        if result.get('claimed_elsewhere'):
+            claimed_elsewhere += 1
+        elif result['ok']:
+            graph.record("04", result['slug'], result['inputs'],
+                         [result['output_file']] + [tier['path'] for tier in result['tiers'].values()],
+                         meta={"frame_count": result['frame_count'], "tiers": result['tiers']})
+            catalog.record(result['slug'], "webp", path=result['output_file'],
+                           frame_count=result['frame_count'], source_hash=result['inputs']['projected'],
+                           duration_ms=result['duration_ms'])
+            processed_count += 1
+            total_frames_rendered += result['frames']
+        else:
+            catalog.mark_failed(result['slug'], "webp", result.get('error'), result.get('duration_ms'))
+            error_count += 1
+
+    graph.save()
+
+    stats.update(
+        total=len(projected_files),
+        processed=processed_count,
+        skipped=skipped_count,
+        claimed_elsewhere=claimed_elsewhere,
+        errors=error_count,
+        frames=total_frames_rendered,
+    )
+
+    # Summary statistics
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+
+    print(f"\nTotal files: {len(projected_files)}")
+    print(f"Processed: {processed_count}")
+    print(f"Skipped (up to date): {skipped_count}")
+    if claim:
+        print(f"Claimed by other nodes: {claimed_elsewhere}")
+    print(f"Errors: {error_count}")
+
+    if processed_count > 0:
+        print(f"\nTotal frames rendered: {total_frames_rendered}")
+        print(f"Average frames per exercise: {total_frames_rendered / processed_count:.1f}")
+        print(f"Peak RSS (largest exercise): {format_bytes(peak)}")
+
+        # Calculate total output size
+        total_size = sum(f.stat().st_size for f in output_dir.glob("*.webp"))
+        total_size_mb = total_size / (1024 * 1024)
+        avg_size_kb = (total_size / 1024) / len(list(output_dir.glob("*.webp")))
+
+        print(f"\nOutput size:")
+        print(f"  Total: {total_size_mb:.1f} MB")
+        print(f"  Average per file: {avg_size_kb:.1f} KB")
+
+    if shard is not None or claim:
+        stats_path = write_stats("04", shard_label(shard, claim), stats,
+                                 claimed=len(tasks) - claimed_elsewhere if claim else None)
+        print(f"\n📊 Shard stats: {stats_path}")
+
+    print(f"\n📁 Output directory: {output_dir}")
+    print(f"✓ Ready for mobile app integration!")
+    print("=" * 60)
+
+    return stats
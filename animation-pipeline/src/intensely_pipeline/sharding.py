@@ -0,0 +1,384 @@
+"""
+Spread per-exercise work over several machines that mount the same volume.
+
+Two modes, usable together:
+
+    static   (--shard i/N)  each node keeps the slugs whose hash falls in
+                            shard i of N; no coordination at all
+    dynamic  (--claim)      nodes claim slugs one at a time by creating
+                            lock files; a node that dies stops heartbeating
+                            and its locks are reclaimed after a timeout
+
+There is no coordinator: the filesystem is the queue. Lock files live in
+.locks/<stage>/, and a slug finished with a given set of input hashes leaves
+a .done marker so late-starting nodes skip it. Each node writes its stage
+stats to shard_stats/<stage>/<node>.json; merge_stats() combines them.
+
+Under --claim every node walks the whole slug list, so a node reports only
+the slugs it claimed; the library size is recorded beside its stats and
+counted once when merging.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .build_graph import atomic_write, hash_value
+from .config import PIPELINE_ROOT
+
+LOCK_ROOT = PIPELINE_ROOT / ".locks"
+STATS_ROOT = PIPELINE_ROOT / "shard_stats"
+
+# A lock whose heartbeat is older than this belongs to a dead node
+STALE_AFTER = 300.0
+HEARTBEAT_INTERVAL = 30.0
+
+# Stats fields that describe the whole slug list rather than one node's work:
+# every --claim node counts them in full, so they are left out of its report
+LIBRARY_FIELDS = ("total", "skipped", "already_done", "claimed_elsewhere")
+
+
+def utc_now() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a shard spec of the form "i/N" (0 <= i < N).
+
+    Args:
+        spec: Shard spec, e.g. "2/8"
+
+    Returns:
+        (index, count)
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}', expected i/N (e.g. 0/4)")
+
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard '{spec}', need 0 <= i < N")
+    return index, count
+
+
+def shard_of(slug: str, count: int) -> int:
+    """
+    Deterministically assign a slug to one of `count` shards.
+
+    Uses SHA-1 rather than hash(), which is salted per process.
+    """
+    return int(hashlib.sha1(slug.encode("utf-8")).hexdigest()[:8], 16) % count
+
+
+def select_shard(items: Iterable, shard: Optional[Tuple[int, int]], key: Callable = lambda item: item) -> List:
+    """
+    Keep the items whose slug falls in the given shard.
+
+    Args:
+        items: Items to filter (e.g. motion file paths)
+        shard: (index, count), or None to keep everything
+        key: Maps an item to its slug
+
+    Returns:
+        Filtered list, in the original order
+    """
+    items = list(items)
+    if shard is None:
+        return items
+
+    index, count = shard
+    return [item for item in items if shard_of(key(item), count) == index]
+
+
+def node_id() -> str:
+    """Identify this process across machines (host-pid)."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def shard_label(shard: Optional[Tuple[int, int]], claim: bool) -> str:
+    """
+    Name this node's stats file.
+
+    Static shards are named after the shard so a re-run overwrites its own
+    file; dynamic workers are named after the node.
+    """
+    parts = []
+    if shard is not None:
+        parts.append(f"{shard[0]}-of-{shard[1]}")
+    if claim or shard is None:
+        parts.append(node_id())
+    return "_".join(parts)
+
+
+class LockDir:
+    """Lock files and done markers for one stage on a shared filesystem."""
+
+    def __init__(self, stage: str, root=LOCK_ROOT, stale_after: float = STALE_AFTER):
+        self.stage = stage
+        self.root = Path(root)
+        self.dir = self.root / stage
+        self.stale_after = stale_after
+        self.owner = node_id()
+        self.dir.mkdir(parents=True, exist_ok=True)
+
+    def _lock_path(self, slug: str) -> Path:
+        return self.dir / f"{slug}.lock"
+
+    def _done_path(self, slug: str) -> Path:
+        return self.dir / f"{slug}.done"
+
+    def is_done(self, slug: str, token: str) -> bool:
+        """Check whether some node already finished this slug with these inputs."""
+        try:
+            return self._done_path(slug).read_text().strip() == token
+        except OSError:
+            return False
+
+    def claim(self, slug: str, token: Optional[str] = None) -> bool:
+        """
+        Try to take the lock for a slug.
+
+        Args:
+            slug: Exercise slug
+            token: Input hash; if a done marker with this token exists the
+                   slug is not claimed
+
+        Returns:
+            True if this node now holds the lock
+        """
+        if token is not None and self.is_done(slug, token):
+            return False
+
+        for _ in range(2):
+            try:
+                fd = os.open(self._lock_path(slug), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                if not self._reclaim(slug):
+                    return False
+                continue
+
+            with os.fdopen(fd, "w") as f:
+                json.dump({
+                    "owner": self.owner,
+                    "claimed_at": utc_now(),
+                }, f)
+
+            # A node may have finished between the done check and the claim
+            if token is not None and self.is_done(slug, token):
+                self.release(slug)
+                return False
+            return True
+
+        return False
+
+    def _reclaim(self, slug: str) -> bool:
+        """
+        Remove a lock whose heartbeat has timed out.
+
+        The stale lock is renamed aside first, so of several nodes racing to
+        reclaim it exactly one succeeds. If the renamed file turns out to be
+        fresh (another node reclaimed and re-locked in between), it is put
+        back with a no-clobber link.
+
+        Returns:
+            True if the lock is gone and claiming may be retried
+        """
+        lock_path = self._lock_path(slug)
+        try:
+            age = time.time() - lock_path.stat().st_mtime
+        except FileNotFoundError:
+            return True
+
+        if age < self.stale_after:
+            return False
+
+        aside = lock_path.with_name(f"{lock_path.name}.{self.owner}.stale")
+        try:
+            os.rename(lock_path, aside)
+        except FileNotFoundError:
+            return True
+
+        try:
+            if time.time() - aside.stat().st_mtime < self.stale_after:
+                try:
+                    os.link(aside, lock_path)
+                except FileExistsError:
+                    pass
+                return False
+
+            print(f"  ⚠ Reclaimed stale lock for {slug} ({age:.0f}s without heartbeat)")
+            return True
+        finally:
+            aside.unlink(missing_ok=True)
+
+    def heartbeat(self, slug: str) -> None:
+        """Refresh a held lock's mtime so other nodes don't reclaim it."""
+        try:
+            os.utime(self._lock_path(slug))
+        except FileNotFoundError:
+            pass
+
+    def mark_done(self, slug: str, token: str) -> None:
+        """Leave a marker so other nodes skip this slug for these inputs."""
+        with atomic_write(self._done_path(slug), "w") as f:
+            f.write(token + "\n")
+
+    def release(self, slug: str) -> None:
+        """Drop a lock this node holds."""
+        lock_path = self._lock_path(slug)
+        try:
+            with open(lock_path) as f:
+                owner = json.load(f).get("owner")
+        except (OSError, json.JSONDecodeError):
+            return
+
+        if owner == self.owner:
+            lock_path.unlink(missing_ok=True)
+
+    @contextmanager
+    def held(self, slug: str, token: Optional[str] = None, interval: float = HEARTBEAT_INTERVAL) -> Iterator[bool]:
+        """
+        Claim a slug for the duration of a block, heartbeating in the background.
+
+        Yields:
+            True if the lock was taken; the block should skip the work otherwise
+        """
+        if not self.claim(slug, token):
+            yield False
+            return
+
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(interval):
+                self.heartbeat(slug)
+
+        thread = threading.Thread(target=beat, daemon=True)
+        thread.start()
+        try:
+            yield True
+        finally:
+            stop.set()
+            thread.join()
+            self.release(slug)
+
+
+def run_claimed(worker: Callable, task: Dict) -> Dict:
+    """
+    Run a per-exercise worker only if this node can claim the slug.
+
+    Wrap with functools.partial(run_claimed, worker) to hand to run_pool.
+    The task must carry slug, inputs and a "claim" dict of LockDir kwargs.
+
+    Returns:
+        The worker's result, or {"slug", "ok": False, "claimed_elsewhere": True}
+    """
+    locks = LockDir(**task["claim"])
+    token = hash_value(task["inputs"])
+
+    with locks.held(task["slug"], token) as claimed:
+        if not claimed:
+            print(f"{task.get('label', task['slug'])} - SKIP (claimed by another node)")
+            return {"slug": task["slug"], "ok": False, "claimed_elsewhere": True}
+
+        result = worker(task)
+        if result.get("ok"):
+            locks.mark_done(task["slug"], token)
+        return result
+
+
+def write_stats(stage: str, label: str, stats: Dict, root=STATS_ROOT,
+                claimed: Optional[int] = None) -> Path:
+    """
+    Write this node's stats for a stage.
+
+    Args:
+        stage: Stage key (e.g. "04")
+        label: Node label from shard_label()
+        stats: Stage stats as returned by the stage's run()
+        root: Stats directory
+        claimed: With --claim, the number of slugs this node claimed. Its
+                 report then drops LIBRARY_FIELDS, adds "claimed", and keeps
+                 the slug list's "total" aside as "library_total"
+
+    Returns:
+        Path of the written file
+    """
+    report = {
+        "stage": stage,
+        "node": label,
+        "host": socket.gethostname(),
+        "finished_at": utc_now(),
+        "stats": stats,
+    }
+    if claimed is not None:
+        report["stats"] = {key: value for key, value in stats.items() if key not in LIBRARY_FIELDS}
+        report["stats"]["claimed"] = claimed
+        report["library_total"] = stats.get("total", 0)
+
+    path = Path(root) / stage / f"{label}.json"
+    with atomic_write(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def _shard_group(label: str) -> str:
+    """The static shard ("i-of-N") a node label belongs to, or "" for none."""
+    head = label.split("_", 1)[0]
+    return head if "_" in label and "-of-" in head else ""
+
+
+def merge_stats(stage: str, root=STATS_ROOT) -> Optional[Dict]:
+    """
+    Combine every node's stats file for a stage.
+
+    Numeric fields are summed; the per-node breakdown is kept under "nodes".
+    --claim nodes that shared a slug list all report the same library_total,
+    so it is counted once per static shard (max over its nodes) and added
+    to "total".
+
+    Returns:
+        Merged stats (also written to shard_stats/<stage>.json), or None if
+        no node has reported yet
+    """
+    stage_dir = Path(root) / stage
+    files = sorted(stage_dir.glob("*.json")) if stage_dir.exists() else []
+    if not files:
+        return None
+
+    totals: Dict[str, float] = {}
+    library: Dict[str, int] = {}
+    nodes = {}
+    for path in files:
+        with open(path) as f:
+            report = json.load(f)
+        nodes[report["node"]] = report["stats"]
+        for key, value in report["stats"].items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                totals[key] = totals.get(key, 0) + value
+        if "library_total" in report:
+            group = _shard_group(report["node"])
+            library[group] = max(library.get(group, 0), report["library_total"])
+
+    if library:
+        totals["total"] = totals.get("total", 0) + sum(library.values())
+
+    merged = {
+        "stage": stage,
+        "merged_at": utc_now(),
+        "node_count": len(nodes),
+        "stats": totals,
+        "nodes": nodes,
+    }
+    with atomic_write(Path(root) / f"{stage}.json", "w") as f:
+        json.dump(merged, f, indent=2)
+    return merged
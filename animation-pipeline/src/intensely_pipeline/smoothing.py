@@ -0,0 +1,233 @@
+"""
+Temporal smoothing of joint trajectories (stage 03, before projection).
+
+HY-Motion and especially the GVHMR video path leave high-frequency joint
+jitter. It flips motion direction often enough to defeat the Lottie keyframe
+reduction (stage 05) and inflates lossless WebP frame deltas (stage 04).
+Stage 03 and the fused path filter the (T, J, 3) motion before projecting,
+so the global bounding box isn't widened by jitter either.
+
+    savgol    Savitzky-Golay: a least-squares polynomial fit over a sliding
+              window, applied to the whole array as one weighted sum over
+              window views. The first and last half-windows are evaluated
+              from the polynomial fitted to the first/last full window, so
+              the clip is neither shortened nor padded. Keeps peaks (the
+              bottom of a squat) better than a moving average.
+    one_euro  One-Euro filter (Casiez et al. 2012): a low-pass filter whose
+              cutoff rises with joint speed, so slow holds are smoothed hard
+              and fast reps keep their timing. It is recursive in time, so
+              only joints and axes are vectorized (one step per frame).
+
+Long clips projected in chunks (streaming.py) use smooth_chunks(), which
+gives the same result as smoothing the whole clip: Savitzky-Golay reads a
+half-window of neighbouring frames around each chunk, One-Euro carries its
+state from one chunk to the next.
+
+Settings come from the "smoothing" config section:
+
+    "smoothing": {"enabled": true, "method": "savgol", "window": 7, "order": 2,
+                  "min_cutoff": 1.5, "beta": 2.0, "d_cutoff": 1.0}
+"""
+
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+METHODS = ("savgol", "one_euro")
+
+DEFAULT_SETTINGS = {
+    'enabled': True,
+    'method': 'savgol',
+    # Savitzky-Golay: odd window length in frames, polynomial order
+    'window': 7,
+    'order': 2,
+    # One-Euro: minimum cutoff (Hz), speed coefficient (Hz per m/s), derivative cutoff (Hz)
+    'min_cutoff': 1.5,
+    'beta': 2.0,
+    'd_cutoff': 1.0,
+}
+
+
+def smoothing_settings(config: Dict) -> Dict:
+    """
+    Smoothing settings from config, with defaults and the source frame rate filled in.
+
+    Raises:
+        ValueError: If the method is unknown or the Savitzky-Golay window is invalid
+    """
+    settings = dict(DEFAULT_SETTINGS, **config.get('smoothing', {}))
+    settings['source_fps'] = config['rendering']['source_fps']
+    if settings['method'] not in METHODS:
+        raise ValueError(f"Unknown smoothing.method {settings['method']!r} (expected one of {', '.join(METHODS)})")
+    if settings['method'] == 'savgol' and (settings['window'] % 2 == 0 or settings['order'] >= settings['window']):
+        raise ValueError("smoothing.window must be odd and larger than smoothing.order")
+    return settings
+
+
+def savgol_weights(window: int, order: int) -> np.ndarray:
+    """
+    Savitzky-Golay evaluation weights for every position in a window.
+
+    Args:
+        window: Odd window length in frames
+        order: Polynomial order
+
+    Returns:
+        (window, window) matrix: row i gives the fitted value at position i
+        as a weighted sum of the window's samples (the middle row is the
+        usual smoothing kernel)
+    """
+    positions = np.arange(window) - window // 2
+    vander = np.vander(positions, order + 1, increasing=True)  # (W, order + 1)
+    return vander @ np.linalg.pinv(vander)
+
+
+def savgol_filter(motion: np.ndarray, window: int, order: int) -> np.ndarray:
+    """
+    Savitzky-Golay filter along the first axis of a (T, ...) array.
+
+    Args:
+        motion: (T, ...) trajectories
+        window: Odd window length in frames (shrunk to fit short clips)
+        order: Polynomial order
+
+    Returns:
+        Filtered float64 array of the same shape
+    """
+    motion = np.asarray(motion, dtype=np.float64)
+    num_frames = len(motion)
+    window = min(window, num_frames if num_frames % 2 else num_frames - 1)
+    if window <= order:
+        return motion.copy()
+
+    half = window // 2
+    weights = savgol_weights(window, order)
+    smoothed = np.empty_like(motion)
+
+    # Interior: the middle row over every full window, in one call
+    windows = sliding_window_view(motion, window, axis=0)  # (T - W + 1, ..., W)
+    smoothed[half:num_frames - half] = windows @ weights[half]
+
+    # Edges: the first and last windows' polynomial, evaluated off-centre
+    smoothed[:half] = np.tensordot(weights[:half], motion[:window], axes=1)
+    smoothed[num_frames - half:] = np.tensordot(weights[half + 1:], motion[-window:], axes=1)
+    return smoothed
+
+
+def _alpha(cutoff, fps: float):
+    """Exponential smoothing factor for a cutoff frequency in Hz."""
+    tau = 1.0 / (2 * np.pi * cutoff)
+    return 1.0 / (1.0 + tau * fps)
+
+
+def one_euro_filter(motion: np.ndarray, fps: float, min_cutoff: float, beta: float, d_cutoff: float) -> np.ndarray:
+    """
+    One-Euro filter along the first axis of a (T, J, D) array.
+
+    The cutoff adapts per joint to its filtered speed (norm over D), so all
+    axes of a joint are smoothed alike.
+
+    Args:
+        motion: (T, J, D) trajectories
+        fps: Frame rate of the clip
+        min_cutoff: Cutoff in Hz when a joint is still
+        beta: Cutoff increase in Hz per unit/s of joint speed
+        d_cutoff: Cutoff in Hz for the speed estimate
+
+    Returns:
+        Filtered float64 array of the same shape
+    """
+    return _one_euro(motion, fps, min_cutoff, beta, d_cutoff)[0]
+
+
+def _one_euro(motion, fps, min_cutoff, beta, d_cutoff, state: Optional[Tuple] = None):
+    """
+    One-Euro filter over consecutive frames, resumable across chunks.
+
+    Args:
+        motion: (T, J, D) trajectories
+        fps, min_cutoff, beta, d_cutoff: As for one_euro_filter()
+        state: (last filtered frame, speed estimate) from the previous chunk,
+               or None at the start of the clip
+
+    Returns:
+        (filtered float64 array, state after the last frame)
+    """
+    motion = np.asarray(motion, dtype=np.float64)
+    smoothed = np.empty_like(motion)
+    if state is None:
+        previous, velocity = motion[0], np.zeros_like(motion[0])
+        smoothed[0] = previous
+        first = 1
+    else:
+        previous, velocity = state
+        first = 0
+    alpha_d = _alpha(d_cutoff, fps)
+
+    for t in range(first, len(motion)):
+        velocity = alpha_d * (motion[t] - previous) * fps + (1 - alpha_d) * velocity
+        speed = np.linalg.norm(velocity, axis=-1, keepdims=True)  # (J, 1)
+        alpha = _alpha(min_cutoff + beta * speed, fps)
+        previous = smoothed[t] = alpha * motion[t] + (1 - alpha) * previous
+    return smoothed, (previous, velocity)
+
+
+def smooth_motion(motion: np.ndarray, settings: Dict) -> np.ndarray:
+    """
+    Apply the configured filter to a whole clip.
+
+    Args:
+        motion: (T, J, D) motion
+        settings: Output of smoothing_settings()
+
+    Returns:
+        Filtered array (float64), or the input unchanged when smoothing is off
+    """
+    if not settings['enabled']:
+        return motion
+    if settings['method'] == 'one_euro':
+        return one_euro_filter(motion, settings['source_fps'], settings['min_cutoff'],
+                               settings['beta'], settings['d_cutoff'])
+    return savgol_filter(motion, settings['window'], settings['order'])
+
+
+def smooth_chunks(
+    read: Callable[[int, int], np.ndarray],
+    num_frames: int,
+    settings: Dict,
+    chunk_frames: int,
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Smooth a clip chunk by chunk, with the same result as smooth_motion().
+
+    Args:
+        read: read(start, stop) returns frames [start, stop) of the clip
+        num_frames: Clip length in frames
+        settings: Output of smoothing_settings()
+        chunk_frames: Frames per chunk
+
+    Yields:
+        (start frame, filtered (chunk, J, D) float64 array) in clip order
+    """
+    state = None
+    window = settings['window']
+    half = window // 2
+
+    for start in range(0, num_frames, chunk_frames):
+        stop = min(start + chunk_frames, num_frames)
+        if not settings['enabled']:
+            yield start, np.asarray(read(start, stop), dtype=np.float64)
+        elif settings['method'] == 'one_euro':
+            smoothed, state = _one_euro(read(start, stop), settings['source_fps'], settings['min_cutoff'],
+                                        settings['beta'], settings['d_cutoff'], state)
+            yield start, smoothed
+        else:
+            # Half a window either side, and at least one full window, so every
+            # frame of the chunk sees the same window as in the whole clip
+            lo, hi = max(0, start - half), min(num_frames, stop + half)
+            if hi - lo < window:
+                lo = max(0, hi - window)
+                hi = min(num_frames, lo + window)
+            smoothed = savgol_filter(read(lo, hi), window, settings['order'])
+            yield start, smoothed[start - lo:stop - lo]
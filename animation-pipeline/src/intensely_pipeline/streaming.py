@@ -0,0 +1,161 @@
+"""
+Chunked streaming projection for long clips (stage 03).
+
+project_motion_unit() holds the whole clip and several float64 copies of
+it in memory. Multi-minute captures from 08_video_to_motion.py or stitched
+workout flows are instead projected from a memory-mapped input, a chunk of
+frames at a time, so peak memory depends on the chunk size, not the clip:
+
+    bounds  (perspective only) 3D min/max of the clip, to place the camera
+    bbox    global 2D min/max of the projected chunks
+    write   each chunk projected again and fitted into the unit box of that
+            global bbox, straight into a preallocated .npy memmap
+
+The result is identical to project_motion_unit() (with smoothing applied
+the same way, see smoothing.smooth_chunks). The input and output maps are
+reopened per chunk, so pages of finished chunks don't stay resident.
+
+Streamed clips skip loop extraction: the autocorrelation needs the whole
+clip, and long captures aren't single-exercise loops anyway. Compact
+(.npq) storage encodes frames last, so it needs the whole clip too;
+streaming writes .npy only.
+
+Settings come from the "projection" config section (stream_settings() in
+projection.py):
+
+    "projection": {"stream": {"min_frames": 18000, "chunk_frames": 4096}}
+
+Clips of min_frames or more are always streamed; 03_project_to_2d.py
+--stream streams every clip, and --max-memory streams clips whose
+in-memory projection wouldn't fit the budget.
+"""
+
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .build_graph import atomic_write
+from .projection import DEFAULT_STREAM, bounding_box, camera_projection, perspective_placement, unit_box
+from .smoothing import smooth_chunks
+from .tracing import span
+
+
+def read_frames(path, start: int, stop: int) -> np.ndarray:
+    """
+    Copy frames [start, stop) out of a .npy file through a memory map.
+
+    The map is dropped on return, so its pages don't count towards the
+    process's resident memory once the next chunk is read.
+
+    Args:
+        path: Path to a (T, ...) .npy file
+        start: First frame
+        stop: One past the last frame
+
+    Returns:
+        The frames as an in-memory array
+    """
+    motion = np.load(path, mmap_mode='r')
+    chunk = np.array(motion[start:stop])
+    del motion
+    return chunk
+
+
+def motion_chunks(motion_file, num_frames: int, chunk_frames: int,
+                  smoothing: Optional[Dict] = None) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    A motion file as float64 chunks, smoothed as smooth_motion() would.
+
+    Args:
+        motion_file: Path to a (T, J, 3) .npy file
+        num_frames: T
+        chunk_frames: Frames per chunk
+        smoothing: smoothing_settings() (default: no smoothing)
+
+    Yields:
+        (start frame, (chunk, J, 3) float64 array)
+    """
+    def read(start, stop):
+        return read_frames(motion_file, start, stop)
+
+    if smoothing is not None:
+        yield from smooth_chunks(read, num_frames, smoothing, chunk_frames)
+        return
+    for start in range(0, num_frames, chunk_frames):
+        yield start, read(start, min(start + chunk_frames, num_frames)).astype(np.float64)
+
+
+def project_motion_streamed(
+    motion_file,
+    output_file,
+    camera_angle,
+    camera: Optional[Dict] = None,
+    smoothing: Optional[Dict] = None,
+    chunk_frames: int = DEFAULT_STREAM['chunk_frames'],
+) -> Tuple[Dict, Tuple[int, int, int]]:
+    """
+    Project a motion file into its unit box, chunk by chunk, straight to disk.
+
+    Args:
+        motion_file: Path to a (T, J, 3) .npy file
+        output_file: Path for the (T, J, 2) float64 .npy (written atomically)
+        camera_angle: Camera angle in degrees
+        camera: camera_settings() (default: orthographic)
+        smoothing: smoothing_settings() (default: no smoothing)
+        chunk_frames: Frames per chunk
+
+    Returns:
+        (world-space bounding box, shape of the saved array)
+
+    Raises:
+        ValueError: If the input isn't (T, J, 3)
+    """
+    shape = np.load(motion_file, mmap_mode='r').shape
+    if len(shape) != 3 or shape[2] != 3:
+        raise ValueError(f"Invalid shape {shape}, expected (T, J, 3)")
+    num_frames, num_joints = shape[0], shape[1]
+    out_shape = (num_frames, num_joints, 2)
+
+    def chunks():
+        return motion_chunks(motion_file, num_frames, chunk_frames, smoothing)
+
+    # The perspective camera is placed from the whole clip's 3D bounds
+    placement = None
+    if camera and camera['model'] == 'perspective':
+        with span("stream 3d bounds"):
+            lo = np.full(3, np.inf)
+            hi = np.full(3, -np.inf)
+            for _, chunk in chunks():
+                flat = chunk.reshape(-1, 3)
+                lo = np.minimum(lo, flat.min(axis=0))
+                hi = np.maximum(hi, flat.max(axis=0))
+        placement = perspective_placement(lo, hi, camera)
+
+    # Pass 1: global bounding box
+    with span("stream bbox"):
+        lo = np.full(2, np.inf)
+        hi = np.full(2, -np.inf)
+        for _, chunk in chunks():
+            flat = camera_projection(chunk, camera_angle, camera, placement).reshape(-1, 2)
+            lo = np.minimum(lo, flat.min(axis=0))
+            hi = np.maximum(hi, flat.max(axis=0))
+        bbox = bounding_box(np.stack([lo, hi]))
+
+    # Pass 2: unit-box fit, chunk by chunk into a preallocated .npy
+    frame_bytes = num_joints * 2 * np.dtype(np.float64).itemsize
+    with span("stream write"), atomic_write(output_file) as f:
+        header = {'descr': np.lib.format.dtype_to_descr(np.dtype(np.float64)),
+                  'fortran_order': False, 'shape': out_shape}
+        np.lib.format.write_array_header_1_0(f, header)
+        offset = f.tell()
+        f.truncate(offset + num_frames * frame_bytes)
+        f.flush()
+
+        for start, chunk in chunks():
+            out = np.memmap(f, dtype=np.float64, mode='r+', offset=offset + start * frame_bytes,
+                            shape=(len(chunk), num_joints, 2))
+            out[:] = unit_box(camera_projection(chunk, camera_angle, camera, placement), bbox)
+            out.flush()
+            del out
+
+    return bbox, out_shape
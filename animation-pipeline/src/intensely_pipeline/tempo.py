@@ -0,0 +1,160 @@
+"""
+Tempo normalization: retime clips to a target rep duration (stage 03).
+
+HY-Motion clips vary a lot in speed. A squat that crawls through each rep
+over 6 seconds costs twice the frames and bytes of a 3-second one, teaches
+nothing extra and looks out of place next to the rest of the library.
+Stage 03 and the fused path retime the (T, J, 3) motion after smoothing and
+before projecting, so loop extraction and rendering see the new timing:
+
+    period  repetition period of the 3D clip, from the same normalised
+            autocorrelation as loop extraction (loop.repetition_period),
+            within the loop section's period bounds
+    ratio   target rep seconds / measured rep seconds for the exercise's
+            movement pattern, clamped to [min_ratio, max_ratio]; clips
+            within tolerance of the target are left untouched
+    retime  linear interpolation of every joint trajectory at evenly
+            spaced fractional frame positions, as one gather and blend
+            over the whole array (first and last frames are kept exactly)
+
+Clips without a clear repetition (holds, one-off movements) keep their
+timing. Streamed clips (streaming.py) aren't retimed: the period needs the
+whole clip. The frame counts before and after go in the projected/<slug>.json
+sidecar under "tempo", and from there in the output manifest.
+
+Settings come from the "tempo" config section; a movement pattern mapped
+to null (planks and other holds) is never retimed. It is off by default,
+and by default only shortens slow clips (max_ratio 1.0); a max_ratio above
+1 also stretches fast ones, at the cost of more frames:
+
+    "tempo": {"enabled": true, "rep_seconds": {"squat": 3.0, "anti-extension": null, "default": 3.0},
+              "tolerance": 0.15, "min_ratio": 0.25, "max_ratio": 1.0}
+"""
+
+import math
+from typing import Dict, Tuple
+
+import numpy as np
+
+from .loop import loop_settings, repetition_period
+
+DEFAULT_SETTINGS = {
+    'enabled': False,
+    # Target seconds per rep, per movement pattern ("default" for the rest)
+    'rep_seconds': {'default': 3.0},
+    # Clips within this fraction of the target keep their timing
+    'tolerance': 0.15,
+    # Bounds of target / measured duration (< 1 speeds a clip up)
+    'min_ratio': 0.25,
+    'max_ratio': 1.0,
+}
+
+# Loop settings the period search shares with loop extraction
+PERIOD_KEYS = ["min_period_seconds", "max_period_seconds", "min_correlation"]
+
+
+def tempo_settings(config: Dict, movement_pattern: str) -> Dict:
+    """
+    Tempo settings for an exercise's movement pattern.
+
+    Args:
+        config: Pipeline configuration
+        movement_pattern: Exercise movement pattern from the manifest
+
+    Returns:
+        Dictionary with enabled, target_seconds (None when the pattern is
+        never retimed), tolerance, min_ratio, max_ratio, source_fps and the
+        loop section's period bounds
+
+    Raises:
+        ValueError: If the ratio bounds don't contain 1
+    """
+    section = config.get('tempo', {})
+    settings = dict(DEFAULT_SETTINGS, **section)
+    targets = dict(DEFAULT_SETTINGS['rep_seconds'], **section.get('rep_seconds', {}))
+    if not settings['min_ratio'] <= 1.0 <= settings['max_ratio']:
+        raise ValueError("tempo.min_ratio must be at most 1 and tempo.max_ratio at least 1")
+
+    loop = loop_settings(config)
+    target = targets.get(movement_pattern, targets['default'])
+    return {
+        'enabled': bool(settings['enabled']) and target is not None,
+        'target_seconds': target,
+        'tolerance': settings['tolerance'],
+        'min_ratio': settings['min_ratio'],
+        'max_ratio': settings['max_ratio'],
+        'source_fps': loop['source_fps'],
+        **{key: loop[key] for key in PERIOD_KEYS},
+    }
+
+
+def retime(motion: np.ndarray, num_frames: int) -> np.ndarray:
+    """
+    Resample a clip to a new frame count by linear interpolation.
+
+    Args:
+        motion: (T, J, D) motion, T >= 2
+        num_frames: Output frame count, >= 2
+
+    Returns:
+        (num_frames, J, D) array of the input dtype; the first and last
+        frames equal the input's
+    """
+    positions = np.linspace(0.0, len(motion) - 1, num_frames)
+    lower = np.minimum(positions.astype(np.intp), len(motion) - 2)
+    weight = (positions - lower)[:, None, None]
+    retimed = motion[lower] * (1.0 - weight) + motion[lower + 1] * weight
+    return retimed.astype(motion.dtype, copy=False)
+
+
+def normalize_tempo(motion: np.ndarray, settings: Dict) -> Tuple[np.ndarray, Dict]:
+    """
+    Retime a clip so one rep lasts the pattern's target duration.
+
+    Args:
+        motion: (T, J, 3) motion at the source frame rate
+        settings: Output of tempo_settings()
+
+    Returns:
+        (motion, tempo): the retimed clip (the input itself when unchanged)
+        and a dictionary with retimed; if True also source_frames, frames,
+        ratio, source_rep_seconds and rep_seconds, otherwise reason
+    """
+    fps = settings['source_fps']
+    num_frames = len(motion)
+    period, correlation = repetition_period(motion, settings)
+    if period is None:
+        return motion, {'retimed': False, 'reason': f"no repetition (best correlation {correlation:.2f})"}
+
+    measured = period / fps
+    ratio = settings['target_seconds'] / measured
+    if abs(ratio - 1.0) <= settings['tolerance']:
+        return motion, {'retimed': False, 'reason': f"rep {measured:.2f}s within tolerance"}
+
+    # Round to whole frames, then clamp the count so the applied ratio stays in bounds too
+    bounded = min(max(ratio, settings['min_ratio']), settings['max_ratio'])
+    frames = int(round((num_frames - 1) * bounded)) + 1
+    frames = min(frames, math.floor((num_frames - 1) * settings['max_ratio']) + 1)
+    frames = max(frames, math.ceil((num_frames - 1) * settings['min_ratio']) + 1, 2)
+    if frames == num_frames:
+        why = "within one frame" if bounded == ratio else "outside the ratio bounds"
+        return motion, {'retimed': False, 'reason': f"rep {measured:.2f}s {why}"}
+
+    # Frame positions are evenly spaced end to end, so the applied ratio is exact
+    applied = (frames - 1) / (num_frames - 1)
+    return retime(motion, frames), {
+        'retimed': True,
+        'source_frames': num_frames,
+        'frames': frames,
+        'ratio': round(applied, 4),
+        'source_rep_seconds': round(measured, 3),
+        'rep_seconds': round(measured * applied, 3),
+    }
+
+
+def describe_tempo(tempo: Dict) -> str:
+    """One-line summary for progress output."""
+    if not tempo.get('retimed'):
+        return f"unchanged ({tempo['reason']})"
+    return (f"{tempo['source_frames']} → {tempo['frames']} frames "
+            f"(rep {tempo['source_rep_seconds']:.2f}s → {tempo['rep_seconds']:.2f}s)")
@@ -0,0 +1,181 @@
+"""
+Opt-in timing spans written as Chrome trace-event JSON.
+
+Open the output in https://ui.perfetto.dev (or chrome://tracing) to see, per
+stage and per exercise, how long loading, projection, drawing, WebP encoding,
+keyframe detection and JSON writing take.
+
+Tracing is off unless start() is called with a path (the scripts' --trace
+option) or INTENSELY_TRACE is set. When off, span() returns a shared no-op
+context manager, so instrumented code pays one function call per span.
+
+Spans recorded in pool workers are returned with each task's result by
+parallel.run_pool() and merged here, so one file covers every process.
+"""
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .build_graph import atomic_write
+
+# Environment variable naming the trace file (alternative to --trace)
+TRACE_ENV = "INTENSELY_TRACE"
+
+_enabled = False
+_events: List[Dict] = []
+_output: Optional[Path] = None
+_main_pid = os.getpid()
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class _Span:
+    """Records one complete ("X") event on exit."""
+
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name: str, cat: str, args: Dict):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = repr(exc)
+
+        _events.append({
+            "name": self.name,
+            "cat": self.cat,
+            "ph": "X",
+            "ts": self.start / 1000,
+            "dur": (end - self.start) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "args": self.args,
+        })
+        return False
+
+
+def enabled() -> bool:
+    """Whether spans are being recorded in this process."""
+    return _enabled
+
+
+def enable() -> None:
+    """Record spans in this process (pool workers; see start() for scripts)."""
+    global _enabled
+    _enabled = True
+
+
+def span(name: str, cat: str = "step", **args):
+    """
+    Time a block.
+
+    Args:
+        name: Span name shown in the trace viewer
+        cat: Category ("stage", "exercise", "step", "frame")
+        **args: Extra fields shown when the span is selected
+
+    Returns:
+        Context manager (a no-op when tracing is off)
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, cat, args)
+
+
+def traced(name: str, cat: str = "stage") -> Callable:
+    """Decorator: wrap every call of a function in a span."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def traced_task(name: str) -> Callable:
+    """Decorator for per-exercise workers: one span per task, named after its slug."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(task):
+            with span(f"{name} {task['slug']}", "exercise", slug=task["slug"]):
+                return func(task)
+        return wrapper
+    return decorator
+
+
+def drain() -> List[Dict]:
+    """Remove and return the events recorded so far in this process."""
+    events = _events[:]
+    _events.clear()
+    return events
+
+
+def extend(events: List[Dict]) -> None:
+    """Merge events recorded in another process."""
+    _events.extend(events)
+
+
+def start(path: Optional[str] = None) -> bool:
+    """
+    Turn tracing on for this run and write the trace at exit.
+
+    Args:
+        path: Trace file (default: $INTENSELY_TRACE; neither set = stay off)
+
+    Returns:
+        True if tracing was enabled
+    """
+    global _output
+    path = path or os.environ.get(TRACE_ENV)
+    if not path:
+        return False
+
+    enable()
+    _output = Path(path)
+    atexit.register(save)
+    print(f"⏱  Tracing to {_output}")
+    return True
+
+
+def save(path: Optional[Path] = None) -> Optional[Path]:
+    """
+    Write the recorded events as Chrome trace-event JSON.
+
+    Args:
+        path: Output file (default: the one passed to start())
+
+    Returns:
+        Path written, or None if there is nowhere to write
+    """
+    path = Path(path) if path else _output
+    if path is None:
+        return None
+
+    pids = sorted({event["pid"] for event in _events} | {_main_pid})
+    metadata = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "args": {"name": "pipeline" if pid == _main_pid else f"worker {pid}"},
+        }
+        for pid in pids
+    ]
+
+    with atomic_write(path, "w") as f:
+        json.dump({"traceEvents": metadata + _events, "displayTimeUnit": "ms"}, f)
+    return path
@@ -0,0 +1,192 @@
+"""
+Derived left/right variants: mirror one generated motion instead of two.
+
+Unilateral exercises (curtsy lunges, single-leg work, side planks) need a
+left and a right version. Rather than a second HY-Motion generation or a
+second recording, the right version can be declared as the mirror of the
+left one in manifest.json:
+
+    "side-plank-right": {..., "derived_from": {"slug": "side-plank-left", "transform": "mirror"}}
+
+Step 02 writes no prompt file for a derived exercise, so it never becomes
+a GPU job. Stage 03 and the fused path write motion_data/<variant>.npy from
+the source's motion before projecting, in one vectorized CPU pass:
+
+    mirror  reflect across the sagittal plane (X -> -X) and swap every
+            left_*/right_* joint pair of config smpl_h_skeleton.joints
+
+Derivation is incremental like the stages (build graph stage "variants"):
+a variant is rewritten only when its source motion, frame rate or the
+skeleton changed. The variant also gets a copy of the source's frame rate
+sidecar.
+
+A motion file that the variant already has from a generation or recording
+is never overwritten; delete it to switch to the mirror. Declare variants
+with src/set_variant.py.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .build_graph import BuildGraph, atomic_write, hash_file, hash_value
+from .catalog import Catalog
+from .frame_rate import motion_fps, motion_meta_path, write_motion_fps
+
+MIRROR = "mirror"
+TRANSFORMS = (MIRROR,)
+
+# Lateral axis of the motion (SMPL-H: +X = the figure's right)
+LATERAL_AXIS = 0
+
+
+def mirror_permutation(config: Dict) -> np.ndarray:
+    """
+    Joint order of the mirrored skeleton.
+
+    Args:
+        config: Pipeline configuration (smpl_h_skeleton.joints)
+
+    Returns:
+        (J,) index array: mirrored joint i takes its data from joint perm[i]
+
+    Raises:
+        ValueError: If a left_*/right_* joint has no counterpart
+    """
+    names = {int(index): name for index, name in config['smpl_h_skeleton']['joints'].items()}
+    by_name = {name: index for index, name in names.items()}
+
+    permutation = np.arange(len(names))
+    for index, name in names.items():
+        side = re.match(r'(left|right)_(.+)', name)
+        if side:
+            other = f"{'right' if side.group(1) == 'left' else 'left'}_{side.group(2)}"
+            if other not in by_name:
+                raise ValueError(f"Joint {name} has no {other} counterpart to mirror to")
+            permutation[index] = by_name[other]
+    return permutation
+
+
+def mirror_motion(motion: np.ndarray, permutation: np.ndarray) -> np.ndarray:
+    """
+    Mirror a clip across the sagittal plane.
+
+    Args:
+        motion: (T, J, 3) motion
+        permutation: Output of mirror_permutation()
+
+    Returns:
+        (T, J, 3) mirrored motion, same dtype
+    """
+    mirrored = motion[:, permutation].copy()
+    mirrored[..., LATERAL_AXIS] *= -1
+    return mirrored
+
+
+def derived_variants(exercises: Dict) -> Dict[str, Dict]:
+    """
+    Exercises derived from another exercise's motion.
+
+    Args:
+        exercises: Source manifest exercises
+
+    Returns:
+        Variant slug -> derived_from entry ({"slug", "transform"})
+    """
+    return {slug: ex['derived_from'] for slug, ex in exercises.items() if ex.get('derived_from')}
+
+
+def mirrored_slug(slug: str) -> Optional[str]:
+    """
+    The other side's slug, swapping a whole "left"/"right" word.
+
+    Args:
+        slug: Exercise slug, e.g. "single-leg-deadlift-left"
+
+    Returns:
+        e.g. "single-leg-deadlift-right", or None if the slug names no side
+    """
+    words = slug.split('-')
+    swapped = [{'left': 'right', 'right': 'left'}.get(word, word) for word in words]
+    return '-'.join(swapped) if swapped != words else None
+
+
+def derive_variants(
+    config: Dict,
+    exercises: Dict,
+    motion_dir: Path,
+    force: bool = False,
+    slugs: Optional[Iterable[str]] = None,
+    graph: Optional[BuildGraph] = None,
+    catalog: Optional[Catalog] = None,
+) -> List[str]:
+    """
+    Write motion files for derived variants whose source motion exists.
+
+    Args:
+        config: Pipeline configuration
+        exercises: Source manifest exercises
+        motion_dir: motion_data/ directory (sources are read, variants written)
+        force: Rewrite even if inputs are unchanged
+        slugs: Only variants of these slugs or with these slugs (watch mode)
+        graph: Build graph to use (default: the pipeline's .build_graph.json)
+        catalog: Artifact catalog to record variant motion in (default: pipeline.db)
+
+    Returns:
+        Slugs of variants whose motion is in place (written or up to date)
+    """
+    variants = derived_variants(exercises)
+    if slugs is not None:
+        slugs = set(slugs)
+        variants = {slug: origin for slug, origin in variants.items() if slug in slugs or origin['slug'] in slugs}
+    if not variants:
+        return []
+
+    if graph is None:
+        graph = BuildGraph()
+    if catalog is None:
+        catalog = Catalog()
+    permutation = mirror_permutation(config)
+    skeleton_hash = hash_value(config['smpl_h_skeleton']['joints'])
+
+    ready, written, missing, own = [], 0, [], []
+    for slug, origin in sorted(variants.items()):
+        if origin.get('transform', MIRROR) not in TRANSFORMS:
+            print(f"  ⚠ {slug}: unknown transform {origin['transform']!r}, skipping")
+            continue
+        source_file = Path(motion_dir) / f"{origin['slug']}.npy"
+        output_file = Path(motion_dir) / f"{slug}.npy"
+        if not source_file.exists():
+            missing.append(slug)
+            continue
+        if output_file.exists() and not graph.get_meta("variants", slug):
+            own.append(slug)
+            continue
+
+        fps = motion_fps(source_file, config['rendering']['source_fps'])
+        inputs = {
+            "source": hash_file(source_file),
+            "fps": hash_value(fps),
+            "transform": MIRROR,
+            "skeleton": skeleton_hash,
+        }
+        outputs = [output_file, motion_meta_path(output_file)]
+        if force or graph.is_stale("variants", slug, inputs, outputs):
+            motion = np.load(source_file)
+            write_motion_fps(output_file, fps)
+            with atomic_write(output_file) as f:
+                np.save(f, mirror_motion(motion, permutation))
+            graph.record("variants", slug, inputs, outputs, meta={"source": origin['slug']})
+            catalog.record(slug, "motion", path=output_file, hash=hash_file(output_file),
+                           frame_count=len(motion), source_hash=inputs["source"])
+            written += 1
+        ready.append(slug)
+
+    graph.save()
+    print(f"✓ Derived variants: {written} mirrored, {len(ready) - written} up to date"
+          + (f", {len(missing)} waiting for source motion" if missing else ""))
+    for slug in own:
+        print(f"  ⚠ {slug} has its own motion file, not mirroring over it (delete it to use the mirror)")
+    return ready
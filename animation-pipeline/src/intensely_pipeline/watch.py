@@ -0,0 +1,300 @@
+"""
+Watch motion_data/ and push new or changed motion files through the pipeline.
+
+Motion arrives in bursts (download_results.sh, 08_video_to_motion.py, rework
+regenerations). The watcher collects changed .npy files until the directory
+has been quiet for a debounce interval, then runs only those slugs through
+projection, WebP (and optionally Lottie) rendering and patches
+output/manifest.json in place. Config, imports and the build graph stay warm
+between bursts.
+
+On Linux, changes come from inotify (through libc, no extra dependency);
+elsewhere, or with poll=True, the directory is re-scanned on an interval.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from . import manifest, projection, render_lottie, render_webp
+from .build_graph import BuildGraph
+from .catalog import Catalog
+from .config import PIPELINE_ROOT
+from .variants import derived_variants
+
+# inotify event masks (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+
+# struct inotify_event: int wd; uint32_t mask, cookie, len; char name[len]
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Report files finished writing to (or renamed into) a directory."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        # Atomic writers (atomic_write, rsync) rename into place: IN_MOVED_TO.
+        # Plain writers (np.save) close the file when done: IN_CLOSE_WRITE.
+        wd = libc.inotify_add_watch(self._fd, os.fsencode(self.directory), IN_CLOSE_WRITE | IN_MOVED_TO)
+        if wd < 0:
+            os.close(self._fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {self.directory}")
+
+    def wait(self, timeout: Optional[float]) -> Tuple[Set[str], bool]:
+        """
+        Block until files change or the timeout expires.
+
+        Args:
+            timeout: Seconds to wait (None = forever)
+
+        Returns:
+            (changed file names, overflowed) - on overflow events were lost
+            and the caller should rescan
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set(), False
+
+        names, overflowed = set(), False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    overflowed = True
+                elif name:
+                    names.add(os.fsdecode(name))
+
+        return names, overflowed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Fallback watcher: compare (mtime, size) snapshots on an interval."""
+
+    def __init__(self, directory: Path, interval: float = 1.0):
+        self.directory = Path(directory)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                snapshot[entry.name] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout: Optional[float]) -> Tuple[Set[str], bool]:
+        """Poll until files change or the timeout expires (see InotifyWatcher.wait)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            if remaining > 0:
+                time.sleep(remaining)
+
+            snapshot = self._scan()
+            changed = {
+                name for name, stamp in snapshot.items()
+                if self._snapshot.get(name) != stamp
+            }
+            self._snapshot = snapshot
+
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed, False
+
+    def close(self) -> None:
+        pass
+
+
+def make_watcher(directory: Path, poll: bool = False, interval: float = 1.0):
+    """
+    Create an inotify watcher, falling back to polling where unavailable.
+
+    Args:
+        directory: Directory to watch
+        poll: Force the polling watcher
+        interval: Polling interval in seconds
+
+    Returns:
+        InotifyWatcher or PollingWatcher
+    """
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError) as e:
+            print(f"⚠ inotify unavailable ({e}), polling every {interval}s")
+
+    return PollingWatcher(directory, interval)
+
+
+def motion_slug(name: str) -> Optional[str]:
+    """Slug for a finished motion file name, or None for temp/other files."""
+    if name.startswith(".") or not name.endswith(".npy"):
+        return None
+    return name[:-len(".npy")]
+
+
+def process_batch(
+    slugs: Set[str],
+    config: Dict,
+    source_manifest: Dict,
+    graph: BuildGraph,
+    catalog: Catalog,
+    lottie: bool = False,
+    cdn_base: Optional[str] = None,
+    pretty: bool = False,
+    jobs: int = 1,
+    max_memory: Optional[int] = None,
+) -> None:
+    """
+    Run a set of slugs through stages 03, 04 (05) and patch the manifest.
+
+    Each stage still checks the build graph, so a file that was touched but
+    not changed costs one hash.
+    """
+    start = time.perf_counter()
+    # New source motion brings its mirrored variants along (written by stage 03)
+    variants = derived_variants(source_manifest["exercises"])
+    slugs = sorted(set(slugs) | {slug for slug, origin in variants.items() if origin["slug"] in slugs})
+
+    projection.run(config, source_manifest, jobs=jobs, graph=graph, catalog=catalog, slugs=slugs,
+                   max_memory=max_memory)
+    render_webp.run(config, jobs=jobs, graph=graph, catalog=catalog, slugs=slugs, max_memory=max_memory)
+    if lottie:
+        render_lottie.run(
+            config,
+            projected_dir=PIPELINE_ROOT / "projected",
+            output_dir=PIPELINE_ROOT / "output" / "lottie",
+            jobs=jobs,
+            graph=graph,
+            catalog=catalog,
+            slugs=slugs,
+            max_memory=max_memory,
+        )
+
+    manifest.patch_manifest(
+        slugs,
+        source_manifest,
+        output=PIPELINE_ROOT / "output" / "manifest.json",
+        webp_dir=PIPELINE_ROOT / "output" / "webp",
+        lottie_dir=PIPELINE_ROOT / "output" / "lottie",
+        include_lottie=lottie,
+        cdn_base=cdn_base,
+        pretty=pretty,
+        graph=graph,
+        catalog=catalog,
+    )
+
+    print(f"\n⚡ {len(slugs)} exercise(s) ready in {time.perf_counter() - start:.1f}s: {', '.join(slugs)}")
+
+
+def run(
+    config: Dict,
+    source_manifest: Dict,
+    motion_dir: Optional[Path] = None,
+    lottie: bool = False,
+    cdn_base: Optional[str] = None,
+    pretty: bool = False,
+    jobs: int = 1,
+    debounce: float = 2.0,
+    poll: bool = False,
+    poll_interval: float = 1.0,
+    catch_up: bool = True,
+    max_memory: Optional[int] = None,
+) -> None:
+    """
+    Watch motion_dir until interrupted, processing each burst of changes.
+
+    Args:
+        config: Pipeline configuration (loaded once; restart to pick up edits)
+        source_manifest: Parsed source manifest from step 02
+        motion_dir: Directory to watch (default: motion_data/)
+        lottie: Also render Lottie and include it in the manifest
+        cdn_base: CDN base URL for manifest entries
+        pretty: Pretty-print manifest JSON
+        jobs: Worker processes per stage (0 = all cores)
+        debounce: Seconds of quiet before a burst is processed
+        poll: Use the polling watcher even where inotify is available
+        poll_interval: Polling interval in seconds
+        catch_up: First process every motion file that is out of date
+        max_memory: RAM budget in bytes for each stage (None = no budget)
+    """
+    motion_dir = Path(motion_dir) if motion_dir else PIPELINE_ROOT / "motion_data"
+    motion_dir.mkdir(parents=True, exist_ok=True)
+    graph = BuildGraph()
+    catalog = Catalog()
+
+    # Start watching before catching up so nothing landing meanwhile is missed
+    watcher = make_watcher(motion_dir, poll=poll, interval=poll_interval)
+    print(f"👀 Watching {motion_dir} ({type(watcher).__name__}, debounce {debounce}s)")
+
+    if catch_up:
+        all_slugs = {path.stem for path in motion_dir.glob("*.npy")}
+        if all_slugs:
+            print(f"\nCatching up on {len(all_slugs)} motion files...")
+            process_batch(all_slugs, config, source_manifest, graph, catalog, lottie, cdn_base, pretty, jobs,
+                          max_memory)
+
+    pending: Set[str] = set()
+    try:
+        while True:
+            names, overflowed = watcher.wait(debounce if pending else None)
+
+            if overflowed:
+                print("⚠ Event queue overflowed, rescanning motion_data/")
+                names |= {path.name for path in motion_dir.glob("*.npy")}
+
+            new = {slug for slug in map(motion_slug, names) if slug}
+            if new:
+                if not pending:
+                    print(f"\n📥 Change detected: {', '.join(sorted(new))}")
+                pending |= new
+                continue
+
+            # Quiet for a full debounce interval: process the burst
+            if pending:
+                batch, pending = pending, set()
+                try:
+                    process_batch(batch, config, source_manifest, graph, catalog, lottie, cdn_base, pretty, jobs,
+                                  max_memory)
+                except Exception as e:
+                    print(f"✗ Batch failed: {e}")
+                    import traceback
+                    traceback.print_exc()
+                print(f"\n👀 Watching {motion_dir}")
+
+    except KeyboardInterrupt:
+        print("\n⏹  Stopped watching")
+    finally:
+        watcher.close()
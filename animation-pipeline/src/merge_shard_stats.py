@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Merge Per-Shard Stats
+
+Each node run with --shard or --claim writes its stage stats to
+shard_stats/<stage>/<node>.json. This combines them into
+shard_stats/<stage>.json (numeric fields summed, per-node breakdown kept)
+and prints the totals. --claim nodes report only the slugs they claimed
+("claimed"); the library "total" they share is counted once.
+
+Usage:
+    # All stages that have reports
+    python src/merge_shard_stats.py
+
+    # One stage
+    python src/merge_shard_stats.py --stage 04
+
+    # Start a fresh run: remove per-node reports, lock files and done markers
+    python src/merge_shard_stats.py --clean
+"""
+
+import argparse
+import shutil
+
+from intensely_pipeline.sharding import LOCK_ROOT, STATS_ROOT, merge_stats
+
+# Stages that can be sharded ("convert" is scripts/convert_hymotion_to_npy.py)
+STAGES = ["convert", "03", "04", "05"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge per-shard stage stats")
+    parser.add_argument("--stage", choices=STAGES, help="Only merge this stage")
+    parser.add_argument("--clean", action="store_true",
+                        help="Delete per-node reports, lock files and done markers instead of merging")
+    args = parser.parse_args()
+
+    stages = [args.stage] if args.stage else STAGES
+
+    if args.clean:
+        for stage in stages:
+            for path in (STATS_ROOT / stage, LOCK_ROOT / stage):
+                if path.exists():
+                    shutil.rmtree(path)
+                    print(f"🗑️  Removed {path}")
+        return
+
+    print("=" * 60)
+    print("Shard Stats")
+    print("=" * 60)
+
+    merged_any = False
+    for stage in stages:
+        merged = merge_stats(stage)
+        if merged is None:
+            continue
+        merged_any = True
+
+        print(f"\nStage {stage} ({merged['node_count']} nodes)")
+        for key, value in merged["stats"].items():
+            if isinstance(value, float):
+                print(f"  {key:28s} {value:,.1f}")
+            else:
+                print(f"  {key:28s} {value:,}")
+
+    if not merged_any:
+        print(f"\n❌ No shard stats found in {STATS_ROOT}")
+        print("   Run a stage with --shard i/N or --claim first.")
+        return
+
+    print(f"\n📁 Merged reports: {STATS_ROOT}/<stage>.json")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Pipeline Command Dispatcher
+
+One entry point for every pipeline script. Each subcommand runs the
+corresponding script in this process with the remaining arguments, so
+`pipeline webp --jobs 4` behaves exactly like
+`python src/04_render_webp.py --jobs 4`.
+
+Nothing beyond the standard library is imported here: heavy dependencies
+(NumPy, Pillow, pandas, anthropic, torch, OpenCV, GVHMR) are imported by
+the scripts only once their arguments are parsed and the code path needs
+them. scripts/check_startup_budget.py guards this.
+
+Usage:
+    python src/pipeline.py --help
+    python src/pipeline.py <command> [args...]
+    python src/pipeline.py <command> --help
+
+    # Examples
+    python src/pipeline.py project --shard 0/4
+    python src/pipeline.py run --stages 03,04,05,09 --jobs 0
+    python src/pipeline.py status --missing webp
+"""
+
+import os
+import runpy
+import sys
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(os.path.dirname(SRC_DIR), "scripts")
+
+# Subcommand -> (script, one-line description), in pipeline order
+COMMANDS = {
+    "prompts": ("01_generate_prompts.py", "Generate prompts.json from the exercise CSV"),
+    "enrich": ("01b_enrich_prompts.py", "Enrich weak prompts with the Claude API"),
+    "batch": ("02_prepare_batch.py", "Write prompt files and the batch manifest"),
+    "convert": (os.path.join(SCRIPTS_DIR, "convert_hymotion_to_npy.py"), "Convert HY-Motion output to .npy"),
+    "video": ("08_video_to_motion.py", "Extract motion from video with GVHMR (GPU)"),
+    "project": ("03_project_to_2d.py", "Project 3D motion to 2D"),
+    "suggest-angles": ("suggest_camera_angles.py", "Propose camera angles from the motion"),
+    "angle": ("set_camera_angle.py", "Override an exercise's camera angle"),
+    "variant": ("set_variant.py", "Mirror one side of a unilateral exercise"),
+    "webp": ("04_render_webp.py", "Render animated WebP"),
+    "lottie": ("05_render_lottie.py", "Render Lottie JSON"),
+    "qa": ("06_qa_report.py", "Generate the QA review page"),
+    "regen": ("regen_helper.py", "Triage a QA rework list"),
+    "csv": ("07_update_csv.py", "Write CDN URLs into the exercise CSV"),
+    "manifest": ("09_generate_manifest.py", "Generate output/manifest.json"),
+    "run": ("run_pipeline.py", "Run stages 03-09 in one process"),
+    "fused": ("fused_pipeline.py", "Motion to WebP/Lottie/manifest in one pass"),
+    "watch": ("watch_pipeline.py", "Process new motion files as they arrive"),
+    "status": ("catalog_status.py", "Query the artifact catalog"),
+    "merge-stats": ("merge_shard_stats.py", "Merge per-shard stage stats"),
+}
+
+
+def print_help() -> None:
+    """Print usage and the command list."""
+    print("usage: pipeline <command> [args...]\n")
+    print("Intensely animation pipeline.\n")
+    print("commands:")
+    width = max(len(name) for name in COMMANDS)
+    for name, (_, description) in COMMANDS.items():
+        print(f"  {name:{width}s}  {description}")
+    print("\nRun 'pipeline <command> --help' for a command's options.")
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv or argv[0] in ("-h", "--help"):
+        print_help()
+        return 0
+
+    command, args = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"pipeline: unknown command '{command}'\n", file=sys.stderr)
+        print_help()
+        return 2
+
+    script = os.path.join(SRC_DIR, COMMANDS[command][0])
+    sys.argv = [script] + args
+    runpy.run_path(script, run_name="__main__")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
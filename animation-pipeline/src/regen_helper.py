@@ -18,10 +18,13 @@ For each flagged exercise, offers 3 choices:
 2. Rewrite prompt (manually or via Claude API) -> saves to prompts_regen/
 3. Flag for video recording -> appends to to_record.txt
 
-Progress is checkpointed so you can resume if interrupted.
+Progress is checkpointed in the pipeline.db catalog so you can resume if
+interrupted. Exercises flagged for video are also recorded there as
+requested "video" artifacts.
 """
 
 import argparse
+import importlib.util
 import json
 import os
 import sys
@@ -29,13 +32,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
-# Try to import rich library for better UI
-try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-    print("⚠️  Anthropic library not available. Install with: pip install anthropic")
+from intensely_pipeline.catalog import Catalog
+
+# The anthropic client is imported only when a prompt is rewritten via the API
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
 
 # Color codes for terminal
 class Colors:
@@ -59,11 +59,11 @@ def load_rework_list(json_path: str) -> Dict:
         return json.load(f)
 
 
-def load_checkpoint(checkpoint_path: str = ".regen_helper_checkpoint.json") -> Dict:
+def load_checkpoint(catalog: Catalog, name: str = "regen_helper") -> Dict:
     """Load checkpoint if it exists."""
-    if os.path.exists(checkpoint_path):
-        with open(checkpoint_path, 'r') as f:
-            return json.load(f)
+    checkpoint = catalog.get_state(name)
+    if checkpoint is not None:
+        return checkpoint
     return {
         "processed_slugs": [],
         "decisions": {},
@@ -72,12 +72,12 @@ def load_checkpoint(checkpoint_path: str = ".regen_helper_checkpoint.json") -> D
 
 
 def save_checkpoint(
+    catalog: Catalog,
     checkpoint: Dict,
-    checkpoint_path: str = ".regen_helper_checkpoint.json"
+    name: str = "regen_helper"
 ) -> None:
     """Save checkpoint."""
-    with open(checkpoint_path, 'w') as f:
-        json.dump(checkpoint, f, indent=2)
+    catalog.set_state(name, checkpoint)
 
 
 def load_current_prompt(slug: str, prompts_dir: str = "prompts") -> Optional[str]:
@@ -112,6 +112,8 @@ def rewrite_prompt_with_claude(
     if not ANTHROPIC_AVAILABLE:
         raise ImportError("Anthropic library required. Install with: pip install anthropic")
 
+    from anthropic import Anthropic
+
     client = Anthropic(api_key=api_key)
 
     prompt = f"""You are improving a motion prompt for AI-based exercise animation generation (HY-Motion 1.0).
@@ -266,6 +268,7 @@ def process_exercise(
     use_api: bool,
     api_key: Optional[str],
     checkpoint: Dict,
+    catalog: Catalog,
 ) -> str:
     """
     Process a single exercise.
@@ -343,6 +346,7 @@ def process_exercise(
     elif choice == '3':
         # Flag for video recording
         append_to_record_list(exercise_name, slug, movement_pattern, camera_angle)
+        catalog.record(slug, "video", status="requested", camera_angle=camera_angle)
         print(f"{Colors.GREEN}✓ Added to recording list: to_record.txt{Colors.END}")
 
         checkpoint['decisions'][slug] = {
@@ -416,8 +420,8 @@ def main():
     parser.add_argument(
         "--checkpoint",
         type=str,
-        default=".regen_helper_checkpoint.json",
-        help="Path to checkpoint file",
+        default="regen_helper",
+        help="Checkpoint name (state key in pipeline.db)",
     )
 
     args = parser.parse_args()
@@ -451,7 +455,8 @@ def main():
     print(f"Claude API: {'Enabled' if args.use_api else 'Disabled'}")
 
     # Load checkpoint
-    checkpoint = load_checkpoint(args.checkpoint) if args.resume else {
+    catalog = Catalog()
+    checkpoint = load_checkpoint(catalog, args.checkpoint) if args.resume else {
         "processed_slugs": [],
         "decisions": {},
         "last_index": -1,
@@ -477,6 +482,7 @@ def main():
                 args.use_api,
                 api_key,
                 checkpoint,
+                catalog,
             )
 
             if decision == 'quit':
@@ -486,19 +492,19 @@ def main():
             # Update checkpoint
             checkpoint['processed_slugs'].append(slug)
             checkpoint['last_index'] = i
-            save_checkpoint(checkpoint, args.checkpoint)
+            save_checkpoint(catalog, checkpoint, args.checkpoint)
 
     except KeyboardInterrupt:
         print(f"\n\n{Colors.YELLOW}Interrupted. Saving progress...{Colors.END}")
-        save_checkpoint(checkpoint, args.checkpoint)
+        save_checkpoint(catalog, checkpoint, args.checkpoint)
 
     # Print summary
     print_summary(checkpoint, len(exercises))
 
     # Clean up checkpoint if all processed
     if len(checkpoint['processed_slugs']) == len(exercises):
-        if os.path.exists(args.checkpoint):
-            os.remove(args.checkpoint)
+        if catalog.get_state(args.checkpoint) is not None:
+            catalog.delete_state(args.checkpoint)
             print(f"\n{Colors.GREEN}✓ All exercises processed. Checkpoint removed.{Colors.END}")
     else:
         print(f"\n{Colors.YELLOW}💾 Progress saved. Run with --resume to continue.{Colors.END}")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Run Pipeline Stages 03 → 09 in One Process
+
+Chains projection, WebP, Lottie and manifest generation without starting a
+new interpreter per stage. Config and the source manifest are loaded once and
+the build graph is shared, so unchanged exercises are skipped in every stage.
+
+Usage:
+    # Stages 03, 04 and 09 (default)
+    python src/run_pipeline.py
+
+    # Include Lottie, 8 workers per stage, CDN URLs in the manifest
+    python src/run_pipeline.py --stages 03,04,05,09 --include-lottie --jobs 8 \\
+        --cdn-base https://cdn.intensely.app
+
+    # Fused in-memory path instead of separate stages
+    python src/run_pipeline.py --fused
+
+Output:
+    projected/*.npy, output/webp/*.webp, output/lottie/*.json, output/manifest.json
+"""
+
+import argparse
+
+from intensely_pipeline import tracing
+from intensely_pipeline.config import STAGES, load_config, load_manifest
+from intensely_pipeline.memory import parse_memory
+from intensely_pipeline.sharding import parse_shard
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run pipeline stages 03-09 in a single process"
+    )
+    parser.add_argument(
+        "--stages",
+        type=str,
+        default="03,04,09",
+        help=f"Comma-separated stages to run (default: 03,04,09; available: {','.join(STAGES)})",
+    )
+    parser.add_argument(
+        "--fused",
+        action="store_true",
+        help="Use the fused in-memory path instead of separate stages",
+    )
+    parser.add_argument("--limit", type=int, help="Limit number of files per stage (for testing)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if inputs are unchanged")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes per stage (default: 1, 0 = all cores)")
+    parser.add_argument("--max-memory", type=parse_memory, metavar="SIZE",
+                        help="RAM budget, e.g. 2G: stream frames and cap workers to fit")
+    parser.add_argument("--cdn-base", type=str, help="CDN base URL for manifest entries")
+    parser.add_argument("--include-lottie", action="store_true",
+                        help="Include Lottie animations in the manifest")
+    parser.add_argument("--pretty", action="store_true", help="Pretty-print manifest JSON")
+    parser.add_argument("--shard", type=parse_shard, metavar="i/N",
+                        help="Stages 03-05: only process slugs in shard i of N")
+    parser.add_argument("--claim", action="store_true",
+                        help="Stages 03-05: claim slugs through lock files")
+    parser.add_argument("--trace", type=str, metavar="FILE",
+                        help="Write Chrome trace-event JSON timings to FILE (view in Perfetto)")
+    args = parser.parse_args()
+    tracing.start(args.trace)
+
+    # Imported after argument parsing so --help doesn't load NumPy/Pillow
+    from intensely_pipeline.driver import run_fused, run_stages
+
+    print("=" * 60)
+    print("Exercise Animation Pipeline - Stages 03-09")
+    print("=" * 60)
+
+    config = load_config()
+    source_manifest = load_manifest()
+    print(f"✓ Loaded config and manifest ({len(source_manifest['exercises'])} exercises)")
+
+    options = dict(
+        limit=args.limit,
+        force=args.force,
+        jobs=args.jobs,
+        cdn_base=args.cdn_base,
+        include_lottie=args.include_lottie,
+        pretty=args.pretty,
+        max_memory=args.max_memory,
+    )
+    if args.fused:
+        timings = run_fused(config, source_manifest, **options)
+    else:
+        stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+        timings = run_stages(config, source_manifest, stages, shard=args.shard, claim=args.claim, **options)
+
+    print("\n" + "=" * 60)
+    print("TIMINGS")
+    print("=" * 60)
+    for stage, seconds in timings.items():
+        print(f"  {stage}: {seconds:.1f}s")
+    print(f"  total: {sum(timings.values()):.1f}s")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
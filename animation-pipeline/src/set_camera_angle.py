@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Override an Exercise's Camera Angle
+
+After reviewing an exercise's contact sheet (03 --contact-sheets writes
+output/contact_sheets/<slug>.png), store the angle that reads best in
+manifest.json. The override is kept when 02_prepare_batch.py rebuilds the
+manifest, and the changed angle makes stage 03 re-project just that
+exercise on its next run.
+
+Usage:
+    # Use the side view for push-up
+    python src/set_camera_angle.py push-up 90
+
+    # Back to the movement-pattern default from prompts.json
+    python src/set_camera_angle.py push-up --clear
+
+    # List current overrides
+    python src/set_camera_angle.py --list
+"""
+
+import argparse
+import json
+import sys
+
+from intensely_pipeline.catalog import Catalog
+from intensely_pipeline.config import PIPELINE_ROOT, load_config, load_manifest, save_manifest
+
+
+def default_angle(slug: str, config: dict) -> int:
+    """Camera angle step 01 assigned from the movement pattern."""
+    prompts_path = PIPELINE_ROOT / "prompts.json"
+    if prompts_path.exists():
+        with open(prompts_path) as f:
+            prompt = json.load(f).get(slug, {})
+        if "camera_angle" in prompt:
+            return prompt["camera_angle"]
+    return config["camera_angles"]["default"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store a reviewer's camera angle pick in manifest.json")
+    parser.add_argument("slug", nargs="?", help="Exercise slug")
+    parser.add_argument("angle", nargs="?", type=int, help="Camera angle in degrees (0 = front, 90 = side)")
+    parser.add_argument("--clear", action="store_true", help="Remove the override for SLUG")
+    parser.add_argument("--list", action="store_true", help="List exercises with an override")
+    args = parser.parse_args()
+
+    manifest = load_manifest()
+    exercises = manifest["exercises"]
+
+    if args.list:
+        overrides = {slug: ex for slug, ex in exercises.items() if "camera_angle_override" in ex}
+        for slug, ex in sorted(overrides.items()):
+            print(f"  {slug:40s} {ex['camera_angle_override']:3d}°  ({ex.get('camera_angle_source', 'reviewer')})")
+        print(f"\n{len(overrides)} camera angle overrides")
+        return
+
+    if not args.slug or (args.angle is None) == (not args.clear):
+        parser.error("give SLUG and ANGLE, SLUG --clear, or --list")
+    if args.slug not in exercises:
+        print(f"❌ {args.slug} not in manifest.json")
+        sys.exit(1)
+
+    exercise = exercises[args.slug]
+    previous = exercise["camera_angle"]
+    if args.clear:
+        exercise.pop("camera_angle_override", None)
+        exercise.pop("camera_angle_source", None)
+        exercise["camera_angle"] = default_angle(args.slug, load_config())
+    else:
+        exercise["camera_angle_override"] = args.angle % 360
+        exercise["camera_angle_source"] = "reviewer"
+        exercise["camera_angle"] = args.angle % 360
+
+    save_manifest(manifest)
+    with Catalog() as catalog:
+        catalog.sync_exercises({args.slug: exercise})
+
+    print(f"✓ {args.slug}: {previous}° → {exercise['camera_angle']}°")
+    if exercise["camera_angle"] != previous:
+        print("  Stage 03 will re-project it on the next run.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Declare Mirrored Left/Right Variants
+
+A unilateral exercise's other side doesn't need its own HY-Motion
+generation or recording: mark it as the mirror of the side that has
+motion, and stage 03 (or fused mode) writes its motion_data/<slug>.npy by
+reflecting the source across the sagittal plane and swapping left/right
+joints (intensely_pipeline/variants.py).
+
+The declaration is stored in manifest.json as "derived_from" and kept when
+02_prepare_batch.py rebuilds the manifest, which then writes no prompt
+file for the variant. A variant that isn't in the manifest yet is added
+with the source's movement pattern and camera angle.
+
+Usage:
+    # side-plank-right is side-plank-left mirrored
+    python src/set_variant.py side-plank-right --mirror-of side-plank-left
+
+    # Pair every "...-left-..."/"...-right-..." slug: right mirrors left
+    python src/set_variant.py --auto
+
+    # Generate it again instead
+    python src/set_variant.py side-plank-right --clear
+
+    # List variants
+    python src/set_variant.py --list
+"""
+
+import argparse
+import sys
+
+from intensely_pipeline.catalog import Catalog
+from intensely_pipeline.config import load_manifest, save_manifest
+
+# Source entry fields a new variant entry copies (its name comes from its slug)
+COPIED_KEYS = ["movement_pattern", "camera_angle"]
+
+
+def declare(exercises: dict, slug: str, source: str) -> dict:
+    """
+    Mark slug as the mirror of source, adding its manifest entry if needed.
+
+    Returns:
+        The variant's manifest entry
+    """
+    exercise = exercises.setdefault(slug, {
+        "prompt": "",
+        "word_count": 0,
+        "enriched": False,
+        **{key: exercises[source][key] for key in COPIED_KEYS if key in exercises[source]},
+    })
+    exercise["derived_from"] = {"slug": source, "transform": "mirror"}
+    return exercise
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mirror one side of a unilateral exercise instead of generating it")
+    parser.add_argument("slug", nargs="?", help="Variant exercise slug (e.g. side-plank-right)")
+    parser.add_argument("--mirror-of", metavar="SOURCE", help="Exercise whose motion is mirrored")
+    parser.add_argument("--auto", action="store_true",
+                        help="Mirror every right-side slug from its left-side counterpart")
+    parser.add_argument("--clear", action="store_true", help="Remove the variant declaration for SLUG")
+    parser.add_argument("--list", action="store_true", help="List derived variants")
+    args = parser.parse_args()
+
+    # Imported after argument parsing so --help doesn't load NumPy
+    from intensely_pipeline.variants import derived_variants, mirrored_slug
+
+    manifest = load_manifest()
+    exercises = manifest["exercises"]
+
+    if args.list:
+        variants = derived_variants(exercises)
+        for slug, origin in sorted(variants.items()):
+            print(f"  {slug:40s} ← {origin['slug']} ({origin.get('transform', 'mirror')})")
+        print(f"\n{len(variants)} derived variants ({len(exercises) - len(variants)} generated)")
+        return
+
+    if args.auto:
+        pairs = {}
+        for slug in exercises:
+            other = mirrored_slug(slug)
+            if "right" in slug.split("-") and other in exercises and not exercises[other].get("derived_from"):
+                pairs[slug] = other
+        changed = {slug: declare(exercises, slug, source) for slug, source in sorted(pairs.items())}
+    else:
+        if not args.slug or bool(args.mirror_of) == args.clear:
+            parser.error("give SLUG --mirror-of SOURCE, SLUG --clear, --auto or --list")
+        if args.clear:
+            if args.slug not in exercises:
+                print(f"❌ {args.slug} not in manifest.json")
+                sys.exit(1)
+            exercises[args.slug].pop("derived_from", None)
+            changed = {args.slug: exercises[args.slug]}
+        else:
+            if args.mirror_of not in exercises:
+                print(f"❌ {args.mirror_of} not in manifest.json")
+                sys.exit(1)
+            if exercises[args.mirror_of].get("derived_from") or args.mirror_of == args.slug:
+                print(f"❌ {args.mirror_of} is itself derived; mirror an exercise that has its own motion")
+                sys.exit(1)
+            changed = {args.slug: declare(exercises, args.slug, args.mirror_of)}
+
+    manifest["total_count"] = len(exercises)
+    save_manifest(manifest)
+    with Catalog() as catalog:
+        catalog.sync_exercises(changed)
+
+    for slug, exercise in changed.items():
+        if exercise.get("derived_from"):
+            print(f"✓ {slug} ← mirror of {exercise['derived_from']['slug']}")
+        else:
+            print(f"✓ {slug}: generated again (re-run 02_prepare_batch.py for its prompt file; "
+                  f"the mirrored motion stays until new motion replaces it)")
+    if not changed:
+        print("No left/right pairs found")
+    elif any(exercise.get("derived_from") for exercise in changed.values()):
+        print("  Stage 03 writes their motion from the source; 02_prepare_batch.py drops their prompt files.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Suggest Camera Angles from the Motion
+
+Step 01 picks each exercise's camera angle from its movement pattern alone.
+Once motion_data/ exists, this sweeps 72 yaw angles over every clip in one
+batched projection, scores each view by projected joint spread and
+left/right limb overlap, and proposes the best angle with a confidence
+(see intensely_pipeline/angle_selection.py).
+
+Every proposal is stored in manifest.json as "angle_suggestion". Low-
+confidence picks are flagged and show up on the QA page (status filter
+"Angle flagged"), so they're reviewed before rendering rather than after.
+
+Usage:
+    # Analyse and report (manifest.json gets the suggestions, angles unchanged)
+    python src/suggest_camera_angles.py
+
+    # Also switch confident suggestions in (never over a reviewer's pick)
+    python src/suggest_camera_angles.py --apply
+
+    # Stricter flagging, finer sweep
+    python src/suggest_camera_angles.py --threshold 0.4 --angles 144
+
+Incremental: a clip is re-analysed only when its motion file or the sweep
+settings changed.
+"""
+
+import argparse
+
+from intensely_pipeline.build_graph import BuildGraph, hash_file, hash_value
+from intensely_pipeline.catalog import Catalog
+from intensely_pipeline.config import PIPELINE_ROOT, load_config, load_manifest, save_manifest
+
+# Confident suggestions closer than this to the current view aren't worth a re-render
+MIN_CHANGE = 15
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Propose camera angles from the 3D motion")
+    parser.add_argument("--apply", action="store_true",
+                        help="Set confident suggestions as the exercise's camera angle")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Flag picks with confidence below this for QA (default: 0.25)")
+    parser.add_argument("--angles", type=int, default=72,
+                        help="Yaw angles in the sweep (default: 72, every 5°)")
+    parser.add_argument("--limit", type=int, help="Limit number of files to analyse (for testing)")
+    parser.add_argument("--force", action="store_true", help="Re-analyse even if the motion is unchanged")
+    args = parser.parse_args()
+
+    # Imported after argument parsing so --help doesn't load NumPy
+    import numpy as np
+    from intensely_pipeline.angle_selection import propose_angle, view_distance
+
+    print("=" * 60)
+    print("Exercise Animation Pipeline - Camera Angle Suggestions")
+    print("=" * 60)
+
+    config = load_config()
+    manifest = load_manifest()
+    exercises = manifest["exercises"]
+
+    motion_files = sorted((PIPELINE_ROOT / "motion_data").glob("*.npy"))
+    motion_files = [path for path in motion_files if path.stem in exercises]
+    if args.limit:
+        motion_files = motion_files[:args.limit]
+    if not motion_files:
+        print("\n❌ No motion files for exercises in manifest.json")
+        return
+    print(f"✓ Analysing {len(motion_files)} clips at {args.angles} yaw angles\n")
+
+    graph = BuildGraph()
+    settings_hash = hash_value({"angles": args.angles, "threshold": args.threshold})
+    changed = {}
+    flagged = []
+
+    for motion_file in motion_files:
+        slug = motion_file.stem
+        exercise = exercises[slug]
+        current = exercise["camera_angle"]
+        inputs = {"motion": hash_file(motion_file), "settings": settings_hash, "current": hash_value(current)}
+
+        if not args.force and not graph.is_stale("angles", slug, inputs, []):
+            suggestion = graph.get_meta("angles", slug)
+        else:
+            suggestion = propose_angle(np.load(motion_file), config, current_angle=current,
+                                       num_angles=args.angles, threshold=args.threshold)
+            graph.record("angles", slug, inputs, [], meta=suggestion)
+        exercise["angle_suggestion"] = suggestion
+
+        marker = "⚠" if suggestion["flagged"] else "✓"
+        print(f"  {marker} {slug:40s} {current:3d}° → {suggestion['angle']:3d}°  "
+              f"(confidence {suggestion['confidence']:.2f})")
+
+        if suggestion["flagged"]:
+            flagged.append(slug)
+        elif (
+            args.apply
+            and exercise.get("camera_angle_source") != "reviewer"
+            and view_distance(current, suggestion["angle"]) >= MIN_CHANGE
+        ):
+            exercise["camera_angle"] = suggestion["angle"]
+            exercise["camera_angle_override"] = suggestion["angle"]
+            exercise["camera_angle_source"] = "auto"
+            changed[slug] = exercise
+
+    graph.save()
+    save_manifest(manifest)
+    if changed:
+        with Catalog() as catalog:
+            catalog.sync_exercises(changed)
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    print(f"\nAnalysed: {len(motion_files)}")
+    print(f"Flagged for QA (confidence < {args.threshold}): {len(flagged)}")
+    if args.apply:
+        print(f"Camera angles changed: {len(changed)}")
+        if changed:
+            print("  Stage 03 will re-project them on the next run.")
+    print(f"\n📄 Suggestions saved to manifest.json")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Watch motion_data/ and Render New Motion as It Arrives
+
+Long-running alternative to re-running 03 → 04 → 05 → 09 after every
+download. New or changed .npy files are debounced, pushed through projection
+and rendering, and patched into output/manifest.json in place. Config is
+loaded once: restart the watcher after editing config.json or manifest.json.
+
+Usage:
+    python src/watch_pipeline.py
+
+    # Also render Lottie, with CDN URLs in the manifest
+    python src/watch_pipeline.py --lottie --cdn-base https://cdn.intensely.app
+
+    # Network mounts where inotify doesn't see remote writes
+    python src/watch_pipeline.py --poll --poll-interval 5
+
+Output:
+    projected/*.npy, output/webp/*.webp, output/lottie/*.json, output/manifest.json
+"""
+
+import argparse
+
+from intensely_pipeline import tracing
+from intensely_pipeline.config import load_config, load_manifest
+from intensely_pipeline.memory import parse_memory
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Watch motion_data/ and process new motion files incrementally"
+    )
+    parser.add_argument("--lottie", action="store_true", help="Also render Lottie animations")
+    parser.add_argument("--cdn-base", type=str, help="CDN base URL for manifest entries")
+    parser.add_argument("--pretty", action="store_true", help="Pretty-print manifest JSON")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes per stage (default: 1, 0 = all cores)")
+    parser.add_argument("--max-memory", type=parse_memory, metavar="SIZE",
+                        help="RAM budget, e.g. 2G: stream frames and cap workers to fit")
+    parser.add_argument("--debounce", type=float, default=2.0,
+                        help="Seconds of quiet before a burst is processed (default: 2.0)")
+    parser.add_argument("--poll", action="store_true",
+                        help="Poll the directory instead of using inotify")
+    parser.add_argument("--poll-interval", type=float, default=1.0,
+                        help="Polling interval in seconds (default: 1.0)")
+    parser.add_argument("--no-catch-up", action="store_true",
+                        help="Don't process out-of-date motion files at start-up")
+    parser.add_argument("--trace", type=str, metavar="FILE",
+                        help="Write Chrome trace-event JSON timings to FILE (view in Perfetto)")
+    args = parser.parse_args()
+    tracing.start(args.trace)
+
+    # Imported after argument parsing so --help doesn't load NumPy/Pillow
+    from intensely_pipeline.watch import run
+
+    print("=" * 60)
+    print("Exercise Animation Pipeline - Watch Mode")
+    print("=" * 60)
+
+    config = load_config()
+    source_manifest = load_manifest()
+    print(f"✓ Loaded config and manifest ({len(source_manifest['exercises'])} exercises)")
+
+    run(
+        config,
+        source_manifest,
+        lottie=args.lottie,
+        cdn_base=args.cdn_base,
+        pretty=args.pretty,
+        jobs=args.jobs,
+        debounce=args.debounce,
+        poll=args.poll,
+        poll_interval=args.poll_interval,
+        catch_up=not args.no_catch_up,
+        max_memory=args.max_memory,
+    )
+
+
+if __name__ == "__main__":
+    main()